@@ -0,0 +1,4 @@
+"""Benchmarks for the Koios Digital Clock integration.
+
+Run from the repository root, e.g. ``python -m benchmarks.coordinator``.
+"""
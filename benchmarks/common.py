@@ -0,0 +1,196 @@
+"""Shared helpers for the benchmarks."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
+from homeassistant.helpers.entity_platform import EntityPlatform
+
+from custom_components.koiosdigital import MODEL_PLATFORMS, PLATFORMS
+from custom_components.koiosdigital.const import DOMAIN
+from custom_components.koiosdigital.coordinator import KoiosClockDataUpdateCoordinator
+
+
+def raise_fd_limit() -> None:
+    """Allow one socket per simulated device."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def rss_kb() -> int:
+    """Return the resident set size of this process in KiB."""
+    with open("/proc/self/status", encoding="utf-8") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def percentile(values: Iterable[float], pct: float) -> float | None:
+    """Return a percentile, None for no values."""
+    ordered = sorted(values)
+    if not ordered:
+        return None
+    if len(ordered) == 1:
+        return round(ordered[0], 3)
+    return round(statistics.quantiles(ordered, n=100, method="inclusive")[int(pct) - 1], 3)
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a periodic callback."""
+
+    def __init__(self, interval: float = 0.02) -> None:
+        """Initialize."""
+        self.interval = interval
+        self.samples: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append((time.perf_counter() - start - self.interval) * 1000)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self.samples.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> dict[str, float | None]:
+        """Stop sampling and summarize in milliseconds."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        return {
+            "p50": percentile(self.samples, 50),
+            "p99": percentile(self.samples, 99),
+            "max": round(max(self.samples), 3) if self.samples else None,
+        }
+
+
+class RequestCounter:
+    """Count client requests through aiohttp tracing."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.count = 0
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+
+    async def _on_request_start(self, *_: Any) -> None:
+        self.count += 1
+
+
+class SimulatorProcess:
+    """Run the simulator in a child process so its CPU is not measured."""
+
+    def __init__(self, count: int, base_port: int, *args: str) -> None:
+        """Initialize."""
+        self.count = count
+        self.base_port = base_port
+        self.args = args
+        self.devices: list[dict[str, Any]] = []
+        self._process: asyncio.subprocess.Process | None = None
+
+    async def __aenter__(self) -> SimulatorProcess:
+        """Start the simulator and wait for its manifest."""
+        manifest = os.path.join(tempfile.mkdtemp(prefix="koios-bench-"), "devices.json")
+        self._process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "simulator",
+            "--count",
+            str(self.count),
+            "--base-port",
+            str(self.base_port),
+            "--manifest",
+            manifest,
+            *self.args,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        for _ in range(600):
+            if os.path.exists(manifest):
+                try:
+                    with open(manifest, encoding="utf-8") as file:
+                        self.devices = json.load(file)
+                    break
+                except ValueError:
+                    pass
+            await asyncio.sleep(0.05)
+        else:
+            raise RuntimeError("Simulator did not start")
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        """Stop the simulator."""
+        if self._process and self._process.returncode is None:
+            self._process.terminate()
+            await self._process.wait()
+
+
+async def async_create_hass(config_dir: str | None = None) -> HomeAssistant:
+    """Create a bare Home Assistant instance for coordinators and entities."""
+    hass = HomeAssistant(config_dir or tempfile.mkdtemp(prefix="koios-bench-hass-"))
+    hass.config.set_time_zone("UTC")
+    entity.async_setup(hass)
+    await er.async_load(hass)
+    await dr.async_load(hass)
+    hass.data[DOMAIN] = {}
+    return hass
+
+
+async def async_add_device(
+    hass: HomeAssistant,
+    session: aiohttp.ClientSession,
+    host: str,
+    port: int,
+    model: str,
+    entry_id: str,
+    update_interval: timedelta | None = None,
+) -> tuple[KoiosClockDataUpdateCoordinator, list[Any]]:
+    """Create a coordinator, run its first refresh and add its entities."""
+    coordinator = KoiosClockDataUpdateCoordinator(hass, session, host, port, model)
+    if update_interval is not None:
+        # Must be set before entities subscribe and schedule the first poll
+        coordinator.update_interval = update_interval
+    await coordinator.async_refresh()
+    hass.data[DOMAIN][entry_id] = coordinator
+
+    entities: list[Any] = []
+    entry = SimpleNamespace(entry_id=entry_id)
+    # Entity platforms forwarded for the model, the same way async_setup_entry does
+    for domain in MODEL_PLATFORMS.get(model, PLATFORMS):
+        module = __import__(f"custom_components.koiosdigital.{domain}", fromlist=["async_setup_entry"])
+        added: list[Any] = []
+        await module.async_setup_entry(hass, entry, lambda new, _update=False: added.extend(new))
+        if not added:
+            continue
+        platform = EntityPlatform(
+            hass=hass,
+            logger=module._LOGGER,
+            domain=domain,
+            platform_name=DOMAIN,
+            platform=None,
+            scan_interval=coordinator.update_interval,
+            entity_namespace=None,
+        )
+        await platform.async_add_entities(added)
+        entities.extend(added)
+    return coordinator, entities
@@ -0,0 +1,182 @@
+"""Benchmark coordinator refreshes and write paths at fleet scale.
+
+Starts the simulator in a child process, creates one coordinator with its
+real entities per simulated device and runs a number of poll rounds in
+which every coordinator refreshes at once, the worst case of many clocks
+whose timers line up. Between rounds a fraction of the devices is changed
+behind the integration's back so unchanged and changed polls are both
+exercised. One JSON object per fleet size is written to stdout (or
+--output) so results can be tracked over time.
+
+    python -m benchmarks.coordinator --devices 10 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from typing import Any
+
+import aiohttp
+from homeassistant.const import EVENT_STATE_CHANGED
+
+from custom_components.koiosdigital.const import DEFAULT_UPDATE_INTERVAL
+
+from .common import (
+    LoopLagMonitor,
+    RequestCounter,
+    SimulatorProcess,
+    async_add_device,
+    async_create_hass,
+    percentile,
+    raise_fd_limit,
+    rss_kb,
+)
+
+# Endpoint and payload used to change a device between rounds
+CHANGES = {
+    "nixie": ("/api/nixie", "brightness", 100),
+    "fibonacci": ("/api/fibonacci", "brightness", 255),
+    "matrx": ("/api/system/config", "screen_brightness", 255),
+    "wordclock": ("/api/led/channel/0", "brightness", 255),
+    "tranquil": ("/api/led/channel/0", "brightness", 255),
+}
+
+
+async def _async_change_devices(
+    session: aiohttp.ClientSession, devices: list[dict[str, Any]], rate: float
+) -> None:
+    """Change a random fraction of the devices directly on the simulator."""
+    changed = random.sample(devices, round(len(devices) * rate))
+
+    async def _change(device: dict[str, Any]) -> None:
+        endpoint, field, maximum = CHANGES[device["model"]]
+        url = f"http://{device['host']}:{device['port']}{endpoint}"
+        async with session.post(url, json={field: random.randint(0, maximum)}):
+            pass
+
+    await asyncio.gather(*(_change(device) for device in changed))
+
+
+async def async_run(count: int, rounds: int, change_rate: float, base_port: int, models: str) -> dict[str, Any]:
+    """Benchmark one fleet size."""
+    async with SimulatorProcess(count, base_port, "--models", models) as simulator:
+        hass = await async_create_hass()
+        counter = RequestCounter()
+        connector = aiohttp.TCPConnector(limit=0)
+        session = aiohttp.ClientSession(connector=connector, trace_configs=[counter.trace_config])
+        control = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+
+        state_writes = 0
+
+        def _count_state_change(_event: Any) -> None:
+            nonlocal state_writes
+            state_writes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_change)
+
+        rss_before = rss_kb()
+        devices = await asyncio.gather(
+            *(
+                async_add_device(hass, session, device["host"], device["port"], device["model"], f"entry_{index}")
+                for index, device in enumerate(simulator.devices)
+            )
+        )
+        coordinators = [coordinator for coordinator, _ in devices]
+        entity_count = sum(len(entities) for _, entities in devices)
+
+        updates = 0
+
+        def _count_update() -> None:
+            nonlocal updates
+            updates += 1
+
+        for coordinator in coordinators:
+            coordinator.async_add_listener(_count_update)
+
+        refresh_ms: list[float] = []
+
+        async def _timed_refresh(coordinator: Any) -> None:
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            refresh_ms.append((time.perf_counter() - start) * 1000)
+
+        await hass.async_block_till_done()
+        lag = LoopLagMonitor()
+        state_writes = updates = counter.count = 0
+        cpu = 0.0
+        lag.start()
+        for _ in range(rounds):
+            await _async_change_devices(control, simulator.devices, change_rate)
+            cpu_start = time.process_time()
+            await asyncio.gather(*(_timed_refresh(coordinator) for coordinator in coordinators))
+            await hass.async_block_till_done()
+            cpu += time.process_time() - cpu_start
+        loop_lag = await lag.stop()
+        rss_after = rss_kb()
+
+        polls = rounds * count
+        # Rounds run back to back, per minute figures assume the real poll interval
+        per_minute = 60 / DEFAULT_UPDATE_INTERVAL / rounds
+        result = {
+            "devices": count,
+            "entities": entity_count,
+            "rounds": rounds,
+            "change_rate": change_rate,
+            "requests_per_poll": round(counter.count / polls, 3),
+            "refresh_ms": {"p50": percentile(refresh_ms, 50), "p99": percentile(refresh_ms, 99)},
+            "event_loop_lag_ms": loop_lag,
+            "cpu_ms_per_poll": round(cpu * 1000 / polls, 3),
+            "coordinator_updates_per_minute": round(updates * per_minute, 1),
+            "state_writes_per_minute": round(state_writes * per_minute, 1),
+            "hash_hits": sum(coordinator.hash_hits for coordinator in coordinators),
+            "hash_misses": sum(coordinator.hash_misses for coordinator in coordinators),
+            "rss_kb_per_device": round((rss_after - rss_before) / count, 1),
+        }
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await session.close()
+        await control.close()
+        await hass.async_stop(force=True)
+        return result
+
+
+async def async_main(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Run every requested fleet size."""
+    results = []
+    for count in args.devices:
+        result = await async_run(count, args.rounds, args.change_rate, args.base_port, args.models)
+        print(json.dumps(result), file=sys.stderr)
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.coordinator", description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--change-rate", type=float, default=0.1, help="fraction of devices changed per round")
+    parser.add_argument("--models", default="fibonacci,nixie,wordclock,matrx,tranquil")
+    parser.add_argument("--base-port", type=int, default=18000)
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    raise_fd_limit()
+    results = asyncio.run(async_main(args))
+    output = json.dumps({"benchmark": "coordinator", "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Measure how the coordinator detects and recovers from device faults.
+
+Runs a simulated nixie clock in-process with its real entities and injects
+one fault per scenario: Wi-Fi dropping out, a storm of 408 responses and
+truncated JSON from /api/led/channel/{idx}. For each scenario the time until
+entities go unavailable, the time until they are all back after the fault
+cleared, the requests wasted on failures and extra availability flips are
+measured and compared against budgets. Any budget overrun makes the process
+exit with status 1.
+
+Time is scaled: the poll interval defaults to one second instead of 30,
+sections go stale after three polls like in production, so results and
+budgets are expressed in poll intervals as well as seconds.
+
+    python -m benchmarks.resilience --poll-interval 1 --budgets budgets.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+import aiohttp
+from homeassistant.const import EVENT_STATE_CHANGED, STATE_UNAVAILABLE
+from homeassistant.core import Event
+
+from custom_components.koiosdigital.const import (
+    DEFAULT_STALE_AFTER,
+    DEFAULT_UPDATE_INTERVAL,
+    SECTION_RETRY_DELAY,
+)
+from simulator import Fleet, SimulatedDevice
+
+from .common import async_add_device, async_create_hass
+
+# Fault settings applied for the duration of each scenario
+SCENARIOS: dict[str, dict[str, Any]] = {
+    "wifi_flap": {"offline": True},
+    "408_storm": {"rate_408": 0.9},
+    "truncated_channel_json": {"truncate": "/api/led/channel/"},
+}
+
+# Upper bounds in poll intervals (times) or absolute counts, for faults
+# lasting five polls. Total outages must be detected; an intermittent fault
+# that never makes entities unavailable is fine.
+DEFAULT_BUDGETS: dict[str, dict[str, Any]] = {
+    "wifi_flap": {
+        "must_detect": True,
+        "detect_polls": 5,
+        "recover_polls": 2,
+        "wasted_requests": 90,
+        "flaps": 0,
+    },
+    "408_storm": {
+        "must_detect": False,
+        "detect_polls": 5,
+        "recover_polls": 2,
+        "wasted_requests": 80,
+        "flaps": 0,
+    },
+    "truncated_channel_json": {
+        "must_detect": True,
+        "detect_polls": 5,
+        "recover_polls": 2,
+        "wasted_requests": 20,
+        "flaps": 0,
+    },
+}
+
+
+@dataclass
+class AvailabilityLog:
+    """Availability transitions of a device's entities."""
+
+    entity_ids: set[str]
+    transitions: list[tuple[float, str, bool]] = field(default_factory=list)
+
+    def on_state_changed(self, event: Event) -> None:
+        """Record entities flipping between available and unavailable."""
+        if event.data["entity_id"] not in self.entity_ids:
+            return
+        old, new = event.data.get("old_state"), event.data.get("new_state")
+        was = old is not None and old.state != STATE_UNAVAILABLE
+        now = new is not None and new.state != STATE_UNAVAILABLE
+        if old is not None and was != now:
+            self.transitions.append((time.monotonic(), event.data["entity_id"], now))
+
+
+def _failed_requests(coordinator: Any) -> int:
+    """Return the number of requests that did not produce usable data."""
+    return sum(
+        stats.errors + stats.timeouts + stats.status_408 + stats.status_5xx
+        for stats in coordinator.stats.endpoints.values()
+    )
+
+
+async def async_run_scenario(
+    name: str, faults: dict[str, Any], poll: float, fault_polls: int, port: int
+) -> dict[str, Any]:
+    """Inject one fault and measure detection and recovery."""
+    device = SimulatedDevice("nixie")
+    fleet = Fleet([device], base_port=port)
+    await fleet.async_start()
+    hass = await async_create_hass()
+    session = aiohttp.ClientSession()
+
+    coordinator, entities = await async_add_device(
+        hass, session, *fleet.address(device), device.model, f"entry_{name}", timedelta(seconds=poll)
+    )
+    # Keep the production ratios between poll interval, staleness and retries
+    coordinator.stale_after = timedelta(seconds=poll * DEFAULT_STALE_AFTER / DEFAULT_UPDATE_INTERVAL)
+    coordinator.retry_delay = poll * SECTION_RETRY_DELAY / DEFAULT_UPDATE_INTERVAL
+
+    log = AvailabilityLog({entity.entity_id for entity in entities if entity.enabled})
+    hass.bus.async_listen(EVENT_STATE_CHANGED, log.on_state_changed)
+
+    # Settle into a steady polling rhythm first
+    await asyncio.sleep(poll * 2)
+    failed_before = _failed_requests(coordinator)
+    requests_before = coordinator.stats.requests
+
+    fault_start = time.monotonic()
+    device.faults.update(faults)
+    await asyncio.sleep(poll * fault_polls)
+    device.faults.update({key: type(value)() for key, value in faults.items()})
+    fault_end = time.monotonic()
+
+    # Wait for every entity to come back, up to ten polls
+    recovered_at = None
+    deadline = fault_end + poll * 10
+    while time.monotonic() < deadline:
+        unavailable = {
+            entity_id for _, entity_id, available in log.transitions if not available
+        } - {entity_id for _, entity_id, available in log.transitions if available}
+        if not unavailable and coordinator.last_update_success:
+            # Entities that went away came back, or never went away
+            recovered_at = max(
+                (at for at, _, available in log.transitions if available), default=fault_end
+            )
+            break
+        await asyncio.sleep(poll / 20)
+
+    down = [at for at, _, available in log.transitions if not available]
+    affected = {entity_id for _, entity_id, _ in log.transitions}
+    detect = round(min(down) - fault_start, 2) if down else None
+    recover = round(max(recovered_at - fault_end, 0), 2) if recovered_at is not None else None
+    result = {
+        "scenario": name,
+        "faults": faults,
+        "poll_interval_s": poll,
+        "fault_duration_s": round(fault_end - fault_start, 2),
+        "detect_s": detect,
+        "detect_polls": round(detect / poll, 2) if detect is not None else None,
+        "recover_s": recover,
+        "recover_polls": round(recover / poll, 2) if recover is not None else None,
+        "requests": coordinator.stats.requests - requests_before,
+        "wasted_requests": _failed_requests(coordinator) - failed_before,
+        "affected_entities": len(affected),
+        "availability_transitions": len(log.transitions),
+        # Every affected entity should go down once and come back once
+        "flaps": max(len(log.transitions) - 2 * len(affected), 0),
+    }
+
+    await coordinator.async_shutdown()
+    await session.close()
+    await hass.async_stop(force=True)
+    await fleet.async_stop()
+    return result
+
+
+def check_budget(result: dict[str, Any], budget: dict[str, Any]) -> list[str]:
+    """Return the budget violations of one scenario."""
+    violations = []
+    if result["detect_polls"] is None:
+        if budget["must_detect"]:
+            violations.append("fault was never detected")
+    elif result["detect_polls"] > budget["detect_polls"]:
+        violations.append(f"detect_polls {result['detect_polls']} > {budget['detect_polls']}")
+    if result["recover_polls"] is None:
+        violations.append("did not recover")
+    elif result["recover_polls"] > budget["recover_polls"]:
+        violations.append(f"recover_polls {result['recover_polls']} > {budget['recover_polls']}")
+    for key in ("wasted_requests", "flaps"):
+        if result[key] > budget[key]:
+            violations.append(f"{key} {result[key]} > {budget[key]}")
+    return violations
+
+
+async def async_main(args: argparse.Namespace) -> list[dict[str, Any]]:
+    """Run every requested scenario."""
+    budgets = dict(DEFAULT_BUDGETS)
+    if args.budgets:
+        with open(args.budgets, encoding="utf-8") as file:
+            for name, budget in json.load(file).items():
+                budgets[name] = {**budgets.get(name, {}), **budget}
+
+    # The simulator draws injected errors from the global generator
+    random.seed(args.seed)
+
+    results = []
+    for offset, name in enumerate(args.scenarios):
+        result = await async_run_scenario(
+            name, SCENARIOS[name], args.poll_interval, args.fault_polls, args.base_port + offset
+        )
+        result["budget"] = budgets[name]
+        result["violations"] = check_budget(result, budgets[name])
+        print(json.dumps(result), file=sys.stderr)
+        results.append(result)
+    return results
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.resilience", description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--poll-interval", type=float, default=1.0, help="seconds, stands in for the 30 s default")
+    parser.add_argument("--fault-polls", type=int, default=5, help="fault duration in poll intervals")
+    parser.add_argument("--base-port", type=int, default=18500)
+    parser.add_argument("--seed", type=int, default=0, help="seed for randomly injected errors")
+    parser.add_argument("--budgets", help="JSON file overriding budgets per scenario")
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    results = asyncio.run(async_main(args))
+    output = json.dumps({"benchmark": "resilience", "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+    if any(result["violations"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Benchmark integration import time and per-entry setup cost.
+
+Import time is measured in fresh interpreters that already hold the Home
+Assistant modules a running instance has loaded, so only the
+integration's own modules are timed; the integration modules loaded by the
+import are listed to catch heavy modules creeping back into the import
+path. Setup cost is measured by adding one config entry per simulated
+device to a bare Home Assistant core and timing each setup, including
+platform forwarding and entity creation.
+
+    python -m benchmarks.startup --devices 50 --imports 10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+from homeassistant import config_entries, loader
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity, entity_registry as er
+
+from custom_components.koiosdigital.const import DOMAIN
+
+from .common import SimulatorProcess, percentile, raise_fd_limit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Run in a child interpreter, prints the import times as JSON
+IMPORT_PROBE = """
+import json, sys, time
+import homeassistant.config_entries
+import homeassistant.helpers.aiohttp_client
+import homeassistant.helpers.config_validation
+import homeassistant.helpers.entity_platform
+import homeassistant.helpers.update_coordinator
+for domain in ("light", "select", "sensor", "switch"):
+    __import__(f"homeassistant.components.{domain}")
+
+start = time.perf_counter()
+import custom_components.koiosdigital
+integration_ms = (time.perf_counter() - start) * 1000
+modules = sorted(name for name in sys.modules if name.startswith("custom_components.koiosdigital."))
+
+platform_ms = {}
+for name in sys.argv[1:]:
+    start = time.perf_counter()
+    __import__(f"custom_components.koiosdigital.{name}")
+    platform_ms[name] = (time.perf_counter() - start) * 1000
+
+print(json.dumps({"integration_ms": integration_ms, "platform_ms": platform_ms, "modules": modules}))
+"""
+
+PLATFORM_MODULES = ("light", "select", "sensor", "switch")
+
+
+def measure_imports(runs: int) -> dict[str, Any]:
+    """Time the integration and platform imports in fresh interpreters."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_PROBE, *PLATFORM_MODULES],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output))
+    return {
+        "integration_ms": round(statistics.median(s["integration_ms"] for s in samples), 2),
+        "platform_ms": {
+            name: round(statistics.median(s["platform_ms"][name] for s in samples), 2)
+            for name in PLATFORM_MODULES
+        },
+        "modules_loaded_by_import": samples[0]["modules"],
+    }
+
+
+async def async_create_hass() -> HomeAssistant:
+    """Create a Home Assistant core that loads the integration like a real instance."""
+    config_dir = tempfile.mkdtemp(prefix="koios-bench-startup-")
+    os.symlink(os.path.join(REPO_ROOT, "custom_components"), os.path.join(config_dir, "custom_components"))
+    hass = HomeAssistant(config_dir)
+    hass.config.set_time_zone("UTC")
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    entity.async_setup(hass)
+    await er.async_load(hass)
+    await dr.async_load(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    # Dependencies from the manifest, not exercised here
+    hass.config.components.add("zeroconf")
+    return hass
+
+
+async def async_measure_setup(count: int, base_port: int, models: str) -> dict[str, Any]:
+    """Add one entry per simulated device and time every setup."""
+    async with SimulatorProcess(count, base_port, "--models", models) as simulator:
+        hass = await async_create_hass()
+        setup_ms: list[float] = []
+        cpu_start = time.process_time()
+        for device in simulator.devices:
+            entry = config_entries.ConfigEntry(
+                version=1,
+                minor_version=1,
+                domain=DOMAIN,
+                title=f"{device['model']} {device['port']}",
+                data={"host": device["host"], "port": device["port"], "model": device["model"]},
+                source=config_entries.SOURCE_USER,
+                unique_id=f"{device['host']}:{device['port']}",
+            )
+            start = time.perf_counter()
+            await hass.config_entries.async_add(entry)
+            await hass.async_block_till_done()
+            setup_ms.append((time.perf_counter() - start) * 1000)
+        cpu_ms = (time.process_time() - cpu_start) * 1000
+
+        entries = hass.config_entries.async_entries(DOMAIN)
+        coordinators = [hass.data[DOMAIN][entry.entry_id] for entry in entries if entry.entry_id in hass.data.get(DOMAIN, {})]
+        forwarded = sum(len(coordinator.platforms) for coordinator in coordinators)
+        result = {
+            "devices": count,
+            "loaded": len(coordinators),
+            # The first entry also sets up the integration and its services
+            "first_setup_ms": round(setup_ms[0], 2),
+            "setup_ms": {"p50": percentile(setup_ms[1:], 50), "p99": percentile(setup_ms[1:], 99)},
+            "cpu_ms_per_entry": round(cpu_ms / count, 3),
+            "platforms_per_entry": round(forwarded / max(len(coordinators), 1), 2),
+            "entities_per_entry": round(len(hass.states.async_all()) / max(len(coordinators), 1), 2),
+            "lazy_modules_loaded": sorted(
+                name.rsplit(".", 1)[1]
+                for name in sys.modules
+                if name.rsplit(".", 1)[-1] in ("broadcast", "examples", "profiler", "snapshot", "translations")
+                and name.startswith("custom_components.koiosdigital.")
+            ),
+        }
+        await hass.async_stop(force=True)
+        return result
+
+
+async def async_main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the import and setup measurements."""
+    return {
+        "imports": await asyncio.get_running_loop().run_in_executor(None, measure_imports, args.imports),
+        "setup": await async_measure_setup(args.devices, args.base_port, args.models),
+    }
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--imports", type=int, default=10, help="fresh interpreters timing the imports")
+    parser.add_argument("--models", default="fibonacci,nixie,wordclock,matrx,tranquil")
+    parser.add_argument("--base-port", type=int, default=18700)
+    parser.add_argument("--output", help="write the JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.CRITICAL)
+    raise_fd_limit()
+    results = asyncio.run(async_main(args))
+    output = json.dumps({"benchmark": "startup", "results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,50 +5,142 @@ import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.aiohttp_client import (
+    async_create_clientsession,
+    async_get_clientsession,
+)
 
-from .const import DOMAIN
+from .const import (
+    CONF_DEVICE_ID,
+    CONF_TRACE_REQUESTS,
+    DOMAIN,
+    MODEL_FIBONACCI,
+    MODEL_MATRX,
+    MODEL_NIXIE,
+    MODEL_TRANQUIL,
+    MODEL_WORDCLOCK,
+)
 from .coordinator import KoiosClockDataUpdateCoordinator
-from .services import async_setup_services, async_unload_services
+from .device import get_device_name
+from .schedule import async_get_schedules
+from .throttle import async_get_setup_throttle
+from .tracing import RequestTracer
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.SELECT, Platform.SWITCH, Platform.NUMBER]
+# Platforms every clock has entities on
+PLATFORMS: list[Platform] = [Platform.LIGHT, Platform.SENSOR]
+
+# Platforms of clocks with timezone settings (every model but MATRX)
+CLOCK_PLATFORMS: list[Platform] = [*PLATFORMS, Platform.SELECT, Platform.SWITCH]
+
+# Platforms forwarded per model, only those that create entities for it
+MODEL_PLATFORMS: dict[str, list[Platform]] = {
+    MODEL_FIBONACCI: CLOCK_PLATFORMS,
+    MODEL_NIXIE: CLOCK_PLATFORMS,
+    MODEL_WORDCLOCK: CLOCK_PLATFORMS,
+    MODEL_TRANQUIL: CLOCK_PLATFORMS,
+    MODEL_MATRX: [*PLATFORMS, Platform.SWITCH],
+}
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Koios Digital Clock from a config entry."""
-    session = async_get_clientsession(hass)
+    if CONF_DEVICE_ID not in entry.data:
+        # Pin the identity of entities and device to the current address
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_DEVICE_ID: f"{entry.data[CONF_HOST]}_{entry.data[CONF_PORT]}"},
+        )
+
+    tracer = None
+    if entry.options.get(CONF_TRACE_REQUESTS):
+        # Trace callbacks need a session of their own, it is closed when the
+        # entry unloads
+        tracer = RequestTracer(entry.title)
+        session = async_create_clientsession(hass, trace_configs=[tracer.trace_config])
+    else:
+        session = async_get_clientsession(hass)
     coordinator = KoiosClockDataUpdateCoordinator(
         hass,
         session,
-        entry.data["host"],
-        entry.data["port"],
+        entry.data[CONF_HOST],
+        entry.data[CONF_PORT],
         entry.data["model"],
+        tracer,
+        entry.options,
+        entry.data[CONF_DEVICE_ID],
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    # Brightness schedules are evaluated from the first poll on
+    await async_get_schedules(hass).async_load()
+
+    # Unreachable clocks are deferred instead of holding up the others
+    await async_get_setup_throttle(hass).async_first_refresh(entry.entry_id, coordinator)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
-    # Set up services on first entry
+    # Set up services on first entry, their module is only imported then
     if len(hass.data[DOMAIN]) == 1:
+        from .services import async_setup_services  # pylint: disable=import-outside-toplevel
+
         await async_setup_services(hass)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Remembered for unload, in case the mapping changes with the model
+    coordinator.platforms = MODEL_PLATFORMS.get(coordinator.model, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+
+    entry.async_on_unload(entry.add_update_listener(async_entry_updated))
 
     return True
 
 
+async def async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply a changed address or options to the running coordinator."""
+    coordinator: KoiosClockDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if bool(entry.options.get(CONF_TRACE_REQUESTS)) != (coordinator.tracer is not None):
+        # Tracing needs a different HTTP session, only a reload swaps it
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    host, port = entry.data[CONF_HOST], entry.data[CONF_PORT]
+    if (host, port) != (coordinator.host, coordinator.port):
+        await coordinator.async_set_address(host, port)
+        device_registry = dr.async_get(hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, coordinator.device_id)}
+        ):
+            # The address is part of the name, a name set by the user is kept
+            device_registry.async_update_device(
+                device.id,
+                configuration_url=coordinator.base_url,
+                name=get_device_name(coordinator.model, host),
+            )
+
+    coordinator.async_apply_options(entry.options)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    coordinator: KoiosClockDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    if unload_ok := await hass.config_entries.async_unload_platforms(entry, coordinator.platforms):
         hass.data[DOMAIN].pop(entry.entry_id)
         
         # Unload services if this is the last entry
         if not hass.data[DOMAIN]:
+            from .services import async_unload_services  # pylint: disable=import-outside-toplevel
+
             await async_unload_services(hass)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the brightness schedules of a removed clock."""
+    if device_id := entry.data.get(CONF_DEVICE_ID):
+        schedules = async_get_schedules(hass)
+        await schedules.async_load()
+        schedules.async_clear(device_id)
@@ -0,0 +1,72 @@
+"""Time-synchronized writes across many Koios Digital Clocks."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes
+
+from .coordinator import KoiosClockDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_broadcast(
+    targets: list[tuple[KoiosClockDataUpdateCoordinator, str, dict[str, Any]]],
+) -> dict[str, Any]:
+    """Post staged payloads to every target at the same instant.
+
+    Connections are warmed up and payloads serialized first so the writes
+    don't pay for TCP setup or encoding, then every request is parked on
+    one event and released together. Each request holds its clock's
+    reconcile lock, so a poll can't write older desired state in between.
+    The report contains the completion time of each device relative to
+    the release and the spread between the first and the last one.
+    """
+    await asyncio.gather(*(coordinator.async_prewarm() for coordinator, _, _ in targets))
+
+    staged = []
+    for coordinator, endpoint, payload in targets:
+        # Kept as desired state until applied, retried on later polls if not
+        coordinator.desired.set(endpoint, payload)
+        staged.append((coordinator, endpoint, json_bytes(payload), asyncio.Event()))
+
+    release = asyncio.Event()
+
+    async def _async_send(
+        coordinator: KoiosClockDataUpdateCoordinator,
+        endpoint: str,
+        body: bytes,
+        ready: asyncio.Event,
+    ) -> tuple[float, dict[str, Any] | None]:
+        async with coordinator.reconcile_lock:
+            ready.set()
+            await release.wait()
+            response = await coordinator.async_post_data(endpoint, body)
+            return time.monotonic(), response
+
+    tasks = [asyncio.create_task(_async_send(*target)) for target in staged]
+    # Every task holds its lock and waits at the barrier before the release
+    await asyncio.gather(*(ready.wait() for _, _, _, ready in staged))
+    released = time.monotonic()
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    devices = {}
+    completions = []
+    for (coordinator, endpoint, payload), (done, response) in zip(targets, results):
+        elapsed = round((done - released) * 1000, 1)
+        devices[coordinator.base_url] = {"ok": response is not None, "completed_ms": elapsed}
+        if response is None:
+            # Left to the desired-state engine to retry on the next poll
+            continue
+        completions.append(elapsed)
+        coordinator.async_write_applied(endpoint, payload, response)
+
+    spread = round(max(completions) - min(completions), 1) if completions else None
+    _LOGGER.debug(
+        "Broadcast to %s devices completed with a spread of %s ms", len(targets), spread
+    )
+    return {"spread_ms": spread, "devices": devices}
@@ -1,6 +1,7 @@
 """Config flow for Koios Digital Clock integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -8,16 +9,39 @@ import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.components import zeroconf
-from homeassistant.const import CONF_HOST, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_DEVICE, CONF_HOST, CONF_PORT
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, API_ABOUT
+from .const import (
+    API_ABOUT,
+    API_SYSTEM_CONFIG,
+    CONF_APPLY_TO_ALL,
+    CONF_CATALOG_TTL,
+    CONF_MAX_IN_FLIGHT,
+    CONF_NETWORK,
+    CONF_POLL_INTERVAL,
+    CONF_PUSH,
+    CONF_REQUEST_TIMEOUT,
+    CONF_TRACE_REQUESTS,
+    DEFAULT_CATALOG_TTL,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+    MODEL_FIBONACCI,
+    MODEL_NIXIE,
+)
+from .discovery import async_get_discovery_cache
+from .scan import NetworkTooLarge, async_scan_network, parse_network
 
 _LOGGER = logging.getLogger(__name__)
 
+# Models whose clocks can push state over a websocket
+PUSH_MODELS = (MODEL_NIXIE, MODEL_FIBONACCI)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -25,6 +49,13 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_SCAN_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NETWORK): str,
+        vol.Required(CONF_PORT, default=80): int,
+    }
+)
+
 
 class PlaceholderAuth:
     """Placeholder class to make tests pass.
@@ -61,6 +92,23 @@ class PlaceholderAuth:
             raise InvalidAuth from err
 
 
+async def async_get_hostname(session: aiohttp.ClientSession, host: str, port: int) -> str:
+    """Return the WiFi hostname a clock announces itself under over mDNS.
+
+    MATRX clocks don't report one, their address is used instead.
+    """
+    try:
+        url = f"http://{host}:{port}{API_SYSTEM_CONFIG}"
+        async with session.get(url, timeout=10) as response:
+            if response.status == 200:
+                data = await response.json(content_type=None)
+                if isinstance(data, dict) and data.get("wifi_hostname"):
+                    return data["wifi_hostname"]
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
+        _LOGGER.debug("No hostname from %s:%s - %s", host, port, err)
+    return host
+
+
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Koios Digital Clock."""
 
@@ -72,11 +120,26 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._discovered_port: int | None = None
         self._discovered_model: str | None = None
         self._discovered_hostname: str | None = None
+        self._scan_results: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle manual setup of a single clock."""
         errors: dict[str, str] = {}
         if user_input is not None:
             try:
@@ -85,7 +148,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 device_info = await hub.authenticate(session)
                 
                 # Use hostname for unique ID if available, otherwise fall back to host:port
-                hostname = device_info.get("hostname", user_input[CONF_HOST])
+                hostname = await async_get_hostname(
+                    session, user_input[CONF_HOST], user_input[CONF_PORT]
+                )
                 await self.async_set_unique_id(hostname)
                 self._abort_if_unique_id_configured()
                 
@@ -106,7 +171,75 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Scan a subnet for clocks that mDNS can't reach."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                hosts = parse_network(user_input[CONF_NETWORK])
+            except NetworkTooLarge:
+                errors[CONF_NETWORK] = "network_too_large"
+            except ValueError:
+                errors[CONF_NETWORK] = "invalid_network"
+            else:
+                found = await async_scan_network(
+                    async_get_clientsession(self.hass), hosts, user_input[CONF_PORT]
+                )
+                configured = {
+                    (entry.data.get(CONF_HOST), entry.data.get(CONF_PORT))
+                    for entry in self._async_current_entries(include_ignore=False)
+                }
+                self._scan_results = {
+                    f"{device[CONF_HOST]}:{device[CONF_PORT]}": device
+                    for device in found
+                    if (device[CONF_HOST], device[CONF_PORT]) not in configured
+                }
+                if self._scan_results:
+                    return await self.async_step_scan_select()
+                errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=self.add_suggested_values_to_schema(STEP_SCAN_DATA_SCHEMA, user_input),
+            errors=errors,
+        )
+
+    async def async_step_scan_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick the scanned clocks to add."""
+        if user_input is not None:
+            device = self._scan_results[user_input[CONF_DEVICE]]
+            # Same unique ID as zeroconf, so mDNS doesn't offer the clock again
+            hostname = await async_get_hostname(
+                async_get_clientsession(self.hass), device[CONF_HOST], device[CONF_PORT]
+            )
+            await self.async_set_unique_id(hostname)
+            self._abort_if_unique_id_configured(
+                updates={CONF_HOST: device[CONF_HOST], CONF_PORT: device[CONF_PORT]}
+            )
+            return self.async_create_entry(
+                title=device.get("model") or "Koios Digital Clock",
+                data={
+                    CONF_HOST: device[CONF_HOST],
+                    CONF_PORT: device[CONF_PORT],
+                    "model": device["subtype"],
+                },
+            )
+
+        options = {
+            key: f"{device.get('model') or device['subtype']} ({device['subtype']}) at {key}"
+            for key, device in sorted(self._scan_results.items())
+        }
+        return self.async_show_form(
+            step_id="scan_select",
+            data_schema=vol.Schema({vol.Required(CONF_DEVICE): vol.In(options)}),
+            description_placeholders={"count": str(len(options))},
         )
 
     async def async_step_zeroconf(
@@ -131,47 +264,59 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         _LOGGER.debug("Extracted subtype: %s, hostname: %s", subtype, hostname)
 
-        # If no subtype in mDNS properties, try to get it from the device API
-        device_info = None
-        if not subtype:
-            _LOGGER.debug("No subtype in mDNS properties, trying to fetch from device API")
+        # Set unique ID before touching the device: configured clocks and
+        # clocks with a flow in progress are dropped without a request
+        await self.async_set_unique_id(hostname)
+        for entry in self._async_current_entries(include_ignore=False):
+            if (
+                entry.unique_id == hostname
+                and entry.state is config_entries.ConfigEntryState.SETUP_RETRY
+            ):
+                # The clock is back, Home Assistant reloads the entry below and
+                # its setup must not be turned away by an earlier backoff
+                from .throttle import async_get_setup_throttle  # pylint: disable=import-outside-toplevel
+
+                async_get_setup_throttle(self.hass).async_clear(entry.entry_id)
+        # A new lease is applied by the running coordinator, no reload
+        self._abort_if_unique_id_configured(
+            updates={CONF_HOST: host, CONF_PORT: port}, reload_on_update=False
+        )
+
+        # Unchanged re-announcements reuse the last probe result
+        cache = async_get_discovery_cache(self.hass)
+        signature = (host, port, tuple(sorted((str(k), str(v)) for k, v in properties.items())))
+        if (cached := cache.get(hostname, signature)) is not None:
+            _LOGGER.debug("Using cached probe result for %s", hostname)
+            device_info = cached.device_info
+        else:
+            # Single probe: verifies connectivity and fills in a missing subtype
             try:
                 session = async_get_clientsession(self.hass)
                 hub = PlaceholderAuth(host, port)
                 device_info = await hub.authenticate(session)
-                # Handle both 'subtype' (legacy clocks) and 'type' (MATRX devices)
-                subtype = device_info.get("subtype") or device_info.get("type")
-                _LOGGER.debug("Got subtype from device API: %s", subtype)
+                _LOGGER.debug("Successfully authenticated with discovered device at %s:%s", host, port)
             except Exception as err:
-                _LOGGER.warning("Failed to get device info during discovery: %s", err)
-                return self.async_abort(reason="cannot_connect")
-            
+                _LOGGER.warning("Failed to authenticate with discovered device at %s:%s: %s", host, port, err)
+                device_info = None
+            cache.store(hostname, signature, device_info)
+
+        if device_info is None:
+            return self.async_abort(reason="cannot_connect")
+
+        if not subtype:
+            # Handle both 'subtype' (legacy clocks) and 'type' (MATRX devices)
+            subtype = device_info.get("subtype") or device_info.get("type")
+            _LOGGER.debug("Got subtype from device API: %s", subtype)
+
         if not subtype:
             _LOGGER.warning("No subtype found in discovery properties or device API, aborting")
             return self.async_abort(reason="invalid_discovery")
 
-        # Set unique ID to prevent duplicates - use hostname for uniqueness
-        await self.async_set_unique_id(hostname)
-        self._abort_if_unique_id_configured(
-            updates={CONF_HOST: host, CONF_PORT: port}
-        )
-
         self._discovered_host = host
         self._discovered_port = port
         self._discovered_model = subtype  # Use subtype as model
         self._discovered_hostname = hostname
 
-        # If we didn't authenticate above, do it now to verify connectivity
-        if device_info is None:
-            try:
-                session = async_get_clientsession(self.hass)
-                hub = PlaceholderAuth(host, port)
-                await hub.authenticate(session)
-                _LOGGER.debug("Successfully authenticated with discovered device at %s:%s", host, port)
-            except Exception as err:
-                _LOGGER.warning("Failed to authenticate with discovered device at %s:%s: %s", host, port, err)
-                return self.async_abort(reason="cannot_connect")
-
         self.context.update({"title_placeholders": {"name": hostname}})
         return await self.async_step_discovery_confirm()
 
@@ -195,6 +340,60 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Koios Digital Clock options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            if user_input.pop(CONF_APPLY_TO_ALL, False):
+                # Tracing stays a per-device choice, everything else is
+                # copied and applied live by each entry's update listener
+                fleet = {
+                    key: value for key, value in user_input.items() if key != CONF_TRACE_REQUESTS
+                }
+                for entry in self.hass.config_entries.async_entries(DOMAIN):
+                    if entry.entry_id != self.config_entry.entry_id:
+                        self.hass.config_entries.async_update_entry(
+                            entry, options={**entry.options, **fleet}
+                        )
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        schema = {
+            vol.Optional(
+                CONF_POLL_INTERVAL,
+                default=options.get(CONF_POLL_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+            vol.Optional(
+                CONF_REQUEST_TIMEOUT,
+                default=options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+            vol.Optional(
+                CONF_MAX_IN_FLIGHT,
+                default=options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=8)),
+            vol.Optional(
+                CONF_CATALOG_TTL,
+                default=options.get(CONF_CATALOG_TTL, DEFAULT_CATALOG_TTL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+        }
+        if self.config_entry.data.get("model") in PUSH_MODELS:
+            schema[vol.Optional(CONF_PUSH, default=options.get(CONF_PUSH, False))] = bool
+        schema[
+            vol.Optional(CONF_TRACE_REQUESTS, default=options.get(CONF_TRACE_REQUESTS, False))
+        ] = bool
+        schema[vol.Optional(CONF_APPLY_TO_ALL, default=False)] = bool
+
+        return self.async_show_form(step_id="init", data_schema=vol.Schema(schema))
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
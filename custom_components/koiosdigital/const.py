@@ -39,5 +39,121 @@ LED_CHANNEL_BACKLIGHT = 0
 # Default update interval (30 seconds as requested)
 DEFAULT_UPDATE_INTERVAL = 30
 
+# Seconds a section may go without a successful fetch before the entities
+# that depend on it become unavailable (three missed polls)
+DEFAULT_STALE_AFTER = 90
+
+# Failed sections are retried on their own between polls
+SECTION_RETRY_DELAY = 5
+SECTION_RETRY_ATTEMPTS = 2
+
+# Writes to a reachable device are retried on this many polls before the
+# desired state is dropped
+RECONCILE_MAX_ATTEMPTS = 5
+
+# Config flow fields
+CONF_NETWORK = "network"
+
+# Entry data: address the clock was first set up with, its entities and
+# device keep this identity when the clock moves to another address
+CONF_DEVICE_ID = "device_id"
+
+# Options
+CONF_TRACE_REQUESTS = "trace_requests"
+CONF_POLL_INTERVAL = "poll_interval"
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_MAX_IN_FLIGHT = "max_in_flight"
+CONF_PUSH = "push"
+CONF_CATALOG_TTL = "catalog_ttl"
+CONF_APPLY_TO_ALL = "apply_to_all"
+
+# Seconds before a single request to a clock is abandoned
+DEFAULT_REQUEST_TIMEOUT = 10
+
+# Requests a coordinator keeps open to its clock at once
+DEFAULT_MAX_IN_FLIGHT = 2
+
+# Seconds the about, LED config and LED effect catalogs are reused before
+# they are fetched again, 0 fetches them on every poll
+DEFAULT_CATALOG_TTL = 0
+
+# Seconds clock settings such as the timezone are reused between fetches,
+# writes from Home Assistant update them right away
+SETTINGS_TTL = 300
+
+# Push connections are reopened after this many seconds, doubling up to the
+# maximum while the clock keeps refusing them
+PUSH_RECONNECT_MIN = 1
+PUSH_RECONNECT_MAX = 300
+
+# Fast lane polling a single section of clocks without push, in seconds:
+# the idle interval and the interval right after a change, doubling back
+LANE_INTERVAL = 2
+LANE_FAST_INTERVAL = 0.5
+
+# Request tracing keeps the phase timings of this many recent requests and
+# logs requests slower than the threshold
+TRACE_BUFFER_SIZE = 200
+TRACE_OUTLIER_MS = 1000
+
+# Seconds between state writes of the performance sensors
+PERFORMANCE_SENSOR_INTERVAL = 60
+
+# Profiling runs are bounded to this many seconds
+PROFILE_MAX_SECONDS = 600
+
+# In debug mode integration callbacks and coroutine steps holding the event
+# loop longer than this are reported, the most recent reports are kept
+WATCHDOG_THRESHOLD_MS = 50
+WATCHDOG_MAX_REPORTS = 50
+
+# hass.data key for fleet snapshots
+DATA_SNAPSHOTS = f"{DOMAIN}_snapshots"
+
+# Subnet scan: concurrent probes, per-probe timeout in seconds and the
+# largest network accepted (a /22)
+SCAN_CONCURRENCY = 64
+SCAN_TIMEOUT = 1.0
+SCAN_MAX_HOSTS = 1024
+
+# hass.data key and lifetime in seconds of cached zeroconf probe results,
+# failed probes are retried sooner
+DATA_DISCOVERY = f"{DOMAIN}_discovery"
+DISCOVERY_CACHE_TTL = 300
+DISCOVERY_FAILURE_TTL = 60
+
+# hass.data key for the event loop watchdog
+DATA_WATCHDOG = f"{DOMAIN}_watchdog"
+
+# hass.data key of the timezone database cache and the number of firmware
+# versions whose database is kept on disk
+DATA_ZONEDB = f"{DOMAIN}_zonedb"
+ZONEDB_MAX_VERSIONS = 4
+
+# Seconds before a failed timezone database download is tried again
+ZONEDB_RETRY_AFTER = 3600
+
+# Fleet system config rollouts: devices written at once, retries per device
+# and the delay before the first retry in seconds (doubling per attempt)
+ROLLOUT_CONCURRENCY = 32
+ROLLOUT_RETRIES = 2
+ROLLOUT_RETRY_DELAY = 0.5
+
+# Entry setup: hass.data key of the fleet-wide throttle, first refreshes
+# running at once, seconds a clock gets to answer its setup probe and the
+# deadline for a whole setup including the wait for a slot
+DATA_SETUP = f"{DOMAIN}_setup"
+SETUP_CONCURRENCY = 8
+SETUP_PROBE_TIMEOUT = 3
+SETUP_DEADLINE = 30
+
+# Unreachable clocks are not contacted again during setup for this many
+# seconds, doubling per failure up to the maximum
+SETUP_RETRY_MIN = 30
+SETUP_RETRY_MAX = 900
+
 # zeroconf service type
 ZEROCONF_TYPE = "_koiosdigital._tcp.local."
+
+# hass.data key of the brightness schedules of every light
+DATA_SCHEDULES = f"{DOMAIN}_schedules"
@@ -2,13 +2,23 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
-from datetime import timedelta
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import Any
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_ABOUT,
@@ -16,8 +26,19 @@ from .const import (
     API_LED_CHANNEL,
     API_LED_EFFECTS,
     API_NIXIE,
+    API_NIXIE_WS,
     API_FIBONACCI,
+    API_FIBONACCI_WS,
     API_SYSTEM_CONFIG,
+    CONF_CATALOG_TTL,
+    CONF_MAX_IN_FLIGHT,
+    CONF_POLL_INTERVAL,
+    CONF_PUSH,
+    CONF_REQUEST_TIMEOUT,
+    DEFAULT_CATALOG_TTL,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_STALE_AFTER,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
     LED_CHANNEL_BACKLIGHT,
@@ -26,10 +47,80 @@ from .const import (
     MODEL_WORDCLOCK,
     MODEL_MATRX,
     MODEL_TRANQUIL,
+    SECTION_RETRY_ATTEMPTS,
+    SECTION_RETRY_DELAY,
+    SETTINGS_TTL,
 )
+from .instrumentation import RequestStats
+from .lane import SectionLane
+from .push import SectionPush
+from .reconcile import DesiredState
+from .schedule import async_get_schedules
+from .tracing import RequestTracer
+from .watchdog import async_get_watchdog
 
 _LOGGER = logging.getLogger(__name__)
 
+# Endpoint backing each data section (led_channels is fetched per channel)
+SECTION_ENDPOINTS = {
+    "about": API_ABOUT,
+    "led_config": API_LED_CONFIG,
+    "led_effects": API_LED_EFFECTS,
+    "nixie": API_NIXIE,
+    "fibonacci": API_FIBONACCI,
+    "system_config": API_SYSTEM_CONFIG,
+}
+
+# Section updated by a POST to each writable endpoint
+ENDPOINT_SECTIONS = {
+    API_NIXIE: "nixie",
+    API_FIBONACCI: "fibonacci",
+    API_SYSTEM_CONFIG: "system_config",
+}
+
+# Sections polled for each model, in fetch order (led_config before led_channels)
+MODEL_SECTIONS = {
+    # Fibonacci clocks only use /api/fibonacci endpoint
+    MODEL_FIBONACCI: ("about", "fibonacci", "system_config"),
+    # Nixie clocks use both LED channels and /api/nixie endpoints
+    MODEL_NIXIE: ("about", "led_config", "led_effects", "led_channels", "nixie", "system_config"),
+    # Wordclock only uses LED channels
+    MODEL_WORDCLOCK: ("about", "led_config", "led_effects", "led_channels", "system_config"),
+    # MATRX devices use system config endpoint
+    MODEL_MATRX: ("about", "system_config"),
+    # Tranquil only uses LED channel 0 (similar to wordclock but only channel 0)
+    MODEL_TRANQUIL: ("about", "led_config", "led_effects", "led_channels", "system_config"),
+}
+
+# Sections that only change with firmware or LED hardware configuration,
+# reused for the catalog TTL instead of being fetched on every poll
+CATALOG_SECTIONS = frozenset({"about", "led_config", "led_effects"})
+
+# Clock settings that only change when written, reused for at least
+# SETTINGS_TTL; on MATRX the system config carries live screen state
+SETTINGS_SECTIONS = frozenset({"system_config"})
+
+# Websocket pushing the state of a section, per model
+PUSH_ENDPOINTS = {
+    MODEL_NIXIE: ("nixie", API_NIXIE_WS),
+    MODEL_FIBONACCI: ("fibonacci", API_FIBONACCI_WS),
+}
+
+# Section polled on a fast lane for models without push for it, with the
+# flag under which the firmware changes the section by itself
+LANE_SECTIONS = {
+    # Auto brightness switches the screen from the light sensor
+    MODEL_MATRX: ("system_config", "auto_brightness_enabled"),
+}
+
+
+@dataclass
+class SectionCache:
+    """Last good value of a data section."""
+
+    value: Any
+    updated: datetime
+
 
 class KoiosClockDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the Koios Clock API."""
@@ -41,6 +132,9 @@ class KoiosClockDataUpdateCoordinator(DataUpdateCoordinator):
         host: str,
         port: int,
         model: str,
+        tracer: RequestTracer | None = None,
+        options: Mapping[str, Any] | None = None,
+        device_id: str | None = None,
     ) -> None:
         """Initialize."""
         self.host = host
@@ -48,141 +142,658 @@ class KoiosClockDataUpdateCoordinator(DataUpdateCoordinator):
         self.model = model
         self.session = session
         self.base_url = f"http://{host}:{port}"
+        self.device_id = device_id or f"{host}_{port}"
+        self.stale_after = timedelta(seconds=DEFAULT_STALE_AFTER)
+        self.retry_delay = SECTION_RETRY_DELAY
+        self.request_timeout = DEFAULT_REQUEST_TIMEOUT
+        self.catalog_ttl = timedelta(seconds=DEFAULT_CATALOG_TTL)
+        self.max_in_flight = DEFAULT_MAX_IN_FLIGHT
+        self._request_slots = asyncio.Semaphore(DEFAULT_MAX_IN_FLIGHT)
+
+        # Websocket feeding a section while push is enabled, sections it
+        # currently covers are not polled
+        self.push_enabled = False
+        self.push: SectionPush | None = None
+        self._pushed_sections: set[str] = set()
+
+        # Otherwise a section the firmware changes by itself is polled on
+        # its own lane, it counts as pushed while the lane is healthy
+        self.lane: SectionLane | None = None
+
+        # Each section keeps its last good value so one failed endpoint does
+        # not wipe the state of the entities that depend on it
+        self._sections: dict[str, SectionCache] = {}
+        self._failed_sections: set[str] = set()
+        self._retry_attempt = 0
+        self._retry_unsub: CALLBACK_TYPE | None = None
+        self._available_sections: frozenset[str] = frozenset()
+
+        # Raw body hash and decoded value of the last response per endpoint,
+        # most polls return byte-identical bodies
+        self._responses: dict[str, tuple[bytes, Any]] = {}
+        self.hash_hits = 0
+        self.hash_misses = 0
+
+        # Per-endpoint request counters, latency and transfer sizes
+        self.stats = RequestStats()
+        self.tracer = tracer
+        self.poll_rtt_ms: float | None = None
+        self.last_refresh_ms: float | None = None
+        self.consecutive_failures = 0
+        self.refreshes = 0
+
+        # State requested by entities and services, reconciled against the
+        # observed state whenever the device is reachable; writes posted
+        # outside of reconciliation hold the lock too
+        self.desired = DesiredState()
+        self.reconcile_lock = asyncio.Lock()
+
+        self.watchdog = async_get_watchdog(hass)
+
+        # Platforms forwarded for this clock, set up by the entry
+        self.platforms: list[Platform] = []
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_UPDATE_INTERVAL),
+            # Listeners are only notified when a section actually changed
+            always_update=False,
+        )
+        self.async_apply_options(options or {})
+
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply entry options to the running coordinator.
+
+        Entities stay registered, the next poll simply runs with the new
+        settings.
+        """
+        interval = options.get(CONF_POLL_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        self.update_interval = timedelta(seconds=interval)
+        # Sections still go stale after three missed polls
+        self.stale_after = timedelta(
+            seconds=DEFAULT_STALE_AFTER * interval / DEFAULT_UPDATE_INTERVAL
+        )
+        self.request_timeout = options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+        self.catalog_ttl = timedelta(seconds=options.get(CONF_CATALOG_TTL, DEFAULT_CATALOG_TTL))
+
+        max_in_flight = options.get(CONF_MAX_IN_FLIGHT, DEFAULT_MAX_IN_FLIGHT)
+        if max_in_flight != self.max_in_flight:
+            # Requests already queued finish under the old limit
+            self.max_in_flight = max_in_flight
+            self._request_slots = asyncio.Semaphore(max_in_flight)
+
+        self.push_enabled = options.get(CONF_PUSH, False) and self.model in PUSH_ENDPOINTS
+        if self.data is not None:
+            self._async_sync_push()
+
+        if self._listeners:
+            # Move the pending poll to the new interval right away
+            self._schedule_refresh()
+
+    @callback
+    def _async_sync_push(self) -> None:
+        """Open or close the push connection to match the options."""
+        if self.push_enabled and self.push is None:
+            section, endpoint = PUSH_ENDPOINTS[self.model]
+            self.push = SectionPush(self.hass, self, section, endpoint)
+            self.push.start()
+        elif not self.push_enabled and self.push is not None:
+            self.push.stop()
+            self.push = None
+        self._async_sync_lane()
+
+    @property
+    def lane_wanted(self) -> bool:
+        """Return True if a section should be polled on its own lane."""
+        if self.model not in LANE_SECTIONS or self.push is not None:
+            return False
+        section, flag = LANE_SECTIONS[self.model]
+        cache = self._sections.get(section)
+        return cache is not None and isinstance(cache.value, dict) and bool(cache.value.get(flag))
+
+    @callback
+    def _async_sync_lane(self) -> None:
+        """Start or stop the fast lane to match the clock's settings."""
+        if self.lane_wanted:
+            if self.lane is None:
+                section, _ = LANE_SECTIONS[self.model]
+                self.lane = SectionLane(self.hass, self, section)
+                self.lane.start()
+        elif self.lane is not None:
+            self.lane.stop()
+            self.lane = None
+
+    @callback
+    def async_push_state(self, section: str, connected: bool) -> None:
+        """Track whether a section is covered by a push connection or lane."""
+        if connected:
+            self._pushed_sections.add(section)
+            return
+        self._pushed_sections.discard(section)
+        if cache := self._sections.get(section):
+            # The pushed value was current until now, polling takes over
+            cache.updated = dt_util.utcnow()
+
+    @callback
+    def async_push_update(self, section: str, value: Any) -> None:
+        """Store a section state pushed by the clock."""
+        cache = self._sections.get(section)
+        if cache is not None and isinstance(cache.value, dict) and isinstance(value, dict):
+            # Pushed state may leave out static parts such as the theme list
+            value = {**cache.value, **value}
+        if cache is not None and cache.value == value:
+            cache.updated = dt_util.utcnow()
+            return
+        self._sections[section] = SectionCache(value, dt_util.utcnow())
+        # Don't reset the poll timer, the other sections are still polled
+        self.data = self._build_data()
+        self.async_update_listeners()
+
+    @property
+    def sections(self) -> tuple[str, ...]:
+        """Return the sections polled for this model."""
+        return MODEL_SECTIONS.get(self.model, ("about",))
+
+    @property
+    def writable_endpoints(self) -> list[str]:
+        """Return the endpoints whose state can be written back."""
+        endpoints = [
+            f"{API_LED_CHANNEL}/{channel_idx}"
+            for channel_idx in (self.data or {}).get("led_channels", {})
+        ]
+        endpoints.extend(
+            endpoint for endpoint, section in ENDPOINT_SECTIONS.items() if section in self.sections
         )
+        return endpoints
+
+    @callback
+    def section_available(self, section: str | None) -> bool:
+        """Return True if a section has a value that is not stale yet."""
+        if section is None:
+            return True
+        cache = self._sections.get(section)
+        if cache is None:
+            return False
+        if section in self._pushed_sections:
+            return True
+        return dt_util.utcnow() - cache.updated <= self.stale_after + self._section_ttl(section)
+
+    @callback
+    def _section_ttl(self, section: str) -> timedelta:
+        """Return how long a fetched section is reused before polling it again."""
+        if section in CATALOG_SECTIONS:
+            return self.catalog_ttl
+        if section in SETTINGS_SECTIONS and self.model != MODEL_MATRX:
+            return max(self.catalog_ttl, timedelta(seconds=SETTINGS_TTL))
+        return timedelta(0)
+
+    @callback
+    def _section_due(self, section: str) -> bool:
+        """Return True if a section has to be fetched on this poll."""
+        if section in self._pushed_sections:
+            return False
+        if any(ENDPOINT_SECTIONS.get(endpoint) == section for endpoint in self.desired.endpoints):
+            # Pending writes are diffed against what the clock has right now
+            return True
+        if ttl := self._section_ttl(section):
+            cache = self._sections.get(section)
+            return cache is None or dt_util.utcnow() - cache.updated >= ttl
+        return True
+
+    @callback
+    def section_status(self) -> dict[str, dict[str, Any]]:
+        """Return when each section was last fetched and whether it failed since."""
+        return {
+            section: {
+                "last_success": cache.updated.isoformat() if (cache := self._sections.get(section)) else None,
+                "available": self.section_available(section),
+                "failed": section in self._failed_sections,
+            }
+            for section in self.sections
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, timing each one in debug mode."""
+        if not self.watchdog.enabled:
+            super().async_update_listeners()
+            return
+        for update_callback, _ in list(self._listeners.values()):
+            entity = getattr(update_callback, "__self__", None)
+            label = getattr(entity, "entity_id", None) or getattr(
+                update_callback, "__qualname__", repr(update_callback)
+            )
+            with self.watchdog.step(f"update of {label}", self.base_url):
+                update_callback()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
+        start = time.monotonic()
+        gets, get_ms = self.stats.gets, self.stats.get_ms
         try:
-            data = {}
-
-            # Get device info
-            about_data = await self._async_get_data(API_ABOUT)
-            if about_data:
-                data["about"] = about_data
-
-            # Get model-specific configuration based on subtype
-            if self.model == MODEL_FIBONACCI:
-                # Fibonacci clocks only use /api/fibonacci endpoint
-                fib_data = await self._async_get_data(API_FIBONACCI)
-                if fib_data:
-                    data["fibonacci"] = fib_data
-
-            elif self.model == MODEL_NIXIE:
-                # Nixie clocks use both LED channels and /api/nixie endpoints
-                led_config = await self._async_get_data(API_LED_CONFIG)
-                if led_config:
-                    data["led_config"] = led_config
-                    
-                # Get available LED effects
-                led_effects = await self._async_get_data(API_LED_EFFECTS)
-                if led_effects:
-                    data["led_effects"] = led_effects
-                    
-                # Get state for each LED channel
-                channels = led_config.get("channels", []) if led_config else []
-                led_channels = {}
-                for channel in channels:
-                    channel_idx = channel.get("index")
-                    if channel_idx is not None:
-                        channel_data = await self._async_get_data(f"{API_LED_CHANNEL}/{channel_idx}")
-                        if channel_data:
-                            led_channels[channel_idx] = channel_data
-                
-                if led_channels:
-                    data["led_channels"] = led_channels
-
-                nixie_data = await self._async_get_data(API_NIXIE)
-                if nixie_data:
-                    data["nixie"] = nixie_data
-
-            elif self.model == MODEL_WORDCLOCK:
-                # Wordclock only uses LED channels
-                led_config = await self._async_get_data(API_LED_CONFIG)
-                if led_config:
-                    data["led_config"] = led_config
-                    
-                # Get available LED effects
-                led_effects = await self._async_get_data(API_LED_EFFECTS)
-                if led_effects:
-                    data["led_effects"] = led_effects
-                    
-                # Get state for each LED channel
-                channels = led_config.get("channels", []) if led_config else []
-                led_channels = {}
-                for channel in channels:
-                    channel_idx = channel.get("index")
-                    if channel_idx is not None:
-                        channel_data = await self._async_get_data(f"{API_LED_CHANNEL}/{channel_idx}")
-                        if channel_data:
-                            led_channels[channel_idx] = channel_data
-                
-                if led_channels:
-                    data["led_channels"] = led_channels
-
-            elif self.model == MODEL_MATRX:
-                # MATRX devices use system config endpoint
-                system_config = await self._async_get_data(API_SYSTEM_CONFIG)
-                if system_config:
-                    data["system_config"] = system_config
-
-            elif self.model == MODEL_TRANQUIL:
-                # Tranquil only uses LED channel 0 (similar to wordclock but only channel 0)
-                led_config = await self._async_get_data(API_LED_CONFIG)
-                if led_config:
-                    data["led_config"] = led_config
-                    
-                # Get available LED effects
-                led_effects = await self._async_get_data(API_LED_EFFECTS)
-                if led_effects:
-                    data["led_effects"] = led_effects
-                    
-                # Get state for LED channel 0 only
-                channel_data = await self._async_get_data(f"{API_LED_CHANNEL}/{LED_CHANNEL_BACKLIGHT}")
-                if channel_data:
-                    data["led_channels"] = {LED_CHANNEL_BACKLIGHT: channel_data}
-
-            return data
+            if self.watchdog.enabled:
+                data = await self.watchdog.async_timed(self._async_poll(), "refresh", self.base_url)
+            else:
+                data = await self._async_poll()
+        finally:
+            self.refreshes += 1
+            self.last_refresh_ms = round((time.monotonic() - start) * 1000, 1)
+            if self.stats.gets > gets:
+                self.poll_rtt_ms = round((self.stats.get_ms - get_ms) / (self.stats.gets - gets), 1)
+        return data
 
+    async def _async_poll(self) -> dict[str, Any]:
+        """Refresh every section and reconcile pending writes."""
+        hits, misses = self.hash_hits, self.hash_misses
+        due = tuple(section for section in self.sections if self._section_due(section))
+        try:
+            failed, changed = await self._async_refresh_sections(due)
         except Exception as err:
+            self.consecutive_failures += 1
             raise UpdateFailed(f"Error communicating with API: {err}") from err
 
-    async def _async_get_data(self, endpoint: str) -> dict[str, Any] | None:
+        self._retry_attempt = 0
+        self._schedule_section_retry(failed)
+        _LOGGER.debug(
+            "Poll of %s: %s unchanged, %s changed responses",
+            self.base_url,
+            self.hash_hits - hits,
+            self.hash_misses - misses,
+        )
+
+        # A clock that answered none of this poll's requests is down, no
+        # matter how long the sections it kept from earlier polls stay valid
+        if due and len(failed) == len(due):
+            self.consecutive_failures += 1
+            raise UpdateFailed(f"No response from {self.base_url}: {', '.join(sorted(failed))} failed")
+        if due:
+            # A poll only counts as failed if the clock answered none of it,
+            # polls where nothing was due leave the count alone
+            self.consecutive_failures = 0
+        available = frozenset(
+            section for section in self.sections if self.section_available(section)
+        )
+        if not available:
+            raise UpdateFailed(f"No data from {self.base_url}: {', '.join(sorted(failed))} failed")
+
+        # Writes only go out once the device answered during this poll, a
+        # poll where nothing was due counts if a push or lane is feeding it
+        if due or self._pushed_sections:
+            # Scheduled brightness goes out with the writes of this poll
+            async_get_schedules(self.hass).async_apply(self)
+            # Push whatever is still diverging
+            if self.desired and await self._async_reconcile():
+                changed = True
+
+        if self.push_enabled and self.push is None:
+            self._async_sync_push()
+        else:
+            self._async_sync_lane()
+
+        # Availability changes must reach the entities even if no body changed
+        self.always_update = available != self._available_sections
+        self._available_sections = available
+
+        if not changed and self.data is not None:
+            return self.data
+        return self._build_data()
+
+    async def _async_refresh_sections(self, sections: tuple[str, ...]) -> tuple[set[str], bool]:
+        """Fetch the given sections, returning the failed ones and whether any changed."""
+        failed = set()
+        changed = False
+        for section in sections:
+            value = await self._async_fetch_section(section)
+            if value is None:
+                failed.add(section)
+                continue
+            cache = self._sections.get(section)
+            if cache is not None and cache.value is value:
+                # Unchanged response, only refresh the timestamp
+                cache.updated = dt_util.utcnow()
+                continue
+            self._sections[section] = SectionCache(value, dt_util.utcnow())
+            changed = True
+        return failed, changed
+
+    async def _async_fetch_section(self, section: str) -> Any | None:
+        """Fetch a single section from the device."""
+        if section != "led_channels":
+            return await self._async_get_data(SECTION_ENDPOINTS[section])
+
+        if self.model == MODEL_TRANQUIL:
+            # Get state for LED channel 0 only
+            channel_indices = [LED_CHANNEL_BACKLIGHT]
+        else:
+            # Get state for each LED channel in the (possibly cached) config
+            led_config = self._sections.get("led_config")
+            channels = led_config.value.get("channels", []) if led_config else []
+            channel_indices = [
+                channel["index"] for channel in channels if channel.get("index") is not None
+            ]
+
+        led_channels = {}
+        for channel_idx in channel_indices:
+            channel_data = await self._async_get_data(f"{API_LED_CHANNEL}/{channel_idx}")
+            if channel_data is None:
+                return None
+            led_channels[channel_idx] = channel_data
+
+        # Hand back the cached mapping if no channel changed
+        cache = self._sections.get("led_channels")
+        if (
+            cache is not None
+            and cache.value.keys() == led_channels.keys()
+            and all(cache.value[idx] is value for idx, value in led_channels.items())
+        ):
+            return cache.value
+        return led_channels or None
+
+    @callback
+    def _build_data(self) -> dict[str, Any]:
+        """Assemble coordinator data from the section cache."""
+        return {section: cache.value for section, cache in self._sections.items()}
+
+    @callback
+    def _schedule_section_retry(self, failed: set[str]) -> None:
+        """Retry failed sections on their own before the next poll."""
+        if self._retry_unsub:
+            self._retry_unsub()
+            self._retry_unsub = None
+
+        self._failed_sections = failed
+        if not failed or self._retry_attempt >= SECTION_RETRY_ATTEMPTS:
+            return
+
+        self._retry_attempt += 1
+        self._retry_unsub = async_call_later(
+            self.hass,
+            self.retry_delay * self._retry_attempt,
+            HassJob(self._async_retry_sections, cancel_on_shutdown=True),
+        )
+
+    async def _async_retry_sections(self, _now: datetime) -> None:
+        """Refetch the sections that failed during the last poll."""
+        self._retry_unsub = None
+        retry = tuple(section for section in self.sections if section in self._failed_sections)
+        _LOGGER.debug("Retrying sections %s on %s", retry, self.base_url)
+
+        failed, changed = await self._async_refresh_sections(retry)
+        self._schedule_section_retry(failed)
+
+        if changed:
+            # Don't reset the poll timer, just hand the recovered data out
+            self.data = self._build_data()
+            self.async_update_listeners()
+
+    async def async_refresh_section(self, section: str) -> bool | None:
+        """Fetch one section outside of the poll cycle.
+
+        Returns whether the section changed, or None if the fetch failed.
+        """
+        failed, changed = await self._async_refresh_sections((section,))
+        if failed:
+            return None
+        if changed:
+            # Don't reset the poll timer, the other sections are still polled
+            self.data = self._build_data()
+            self.async_update_listeners()
+            self._async_sync_lane()
+        return changed
+
+    async def async_refresh_observed(self, *endpoints: str) -> None:
+        """Refetch the state behind endpoints unless a websocket keeps it current.
+
+        Callers diffing against the observed state outside of a poll use this
+        so a setting changed on the clock itself isn't mistaken for a match.
+        """
+        sections = {
+            "led_channels" if endpoint.startswith(f"{API_LED_CHANNEL}/") else ENDPOINT_SECTIONS[endpoint]
+            for endpoint in endpoints
+        }
+        for section in sections:
+            if self.push is None or self.push.section != section or not self.push.connected:
+                await self.async_refresh_section(section)
+
+    @callback
+    def observed(self, endpoint: str) -> dict[str, Any]:
+        """Return the last observed state behind a writable endpoint."""
+        if endpoint.startswith(f"{API_LED_CHANNEL}/"):
+            cache = self._sections.get("led_channels")
+            channel_idx = int(endpoint.rsplit("/", 1)[1])
+            return cache.value.get(channel_idx, {}) if cache else {}
+        cache = self._sections.get(ENDPOINT_SECTIONS[endpoint])
+        return cache.value if cache else {}
+
+    @callback
+    def _store_response(
+        self, endpoint: str, sent: dict[str, Any], response: dict[str, Any]
+    ) -> None:
+        """Update the section cache after a successful POST."""
+        if any(key in response for key in sent):
+            # API returns the entire endpoint state after update
+            value = response
+        else:
+            # Firmware only acknowledged the write, apply it to what we know
+            value = {**self.observed(endpoint), **sent}
+
+        if endpoint.startswith(f"{API_LED_CHANNEL}/"):
+            cache = self._sections.get("led_channels")
+            led_channels = dict(cache.value) if cache else {}
+            led_channels[int(endpoint.rsplit("/", 1)[1])] = value
+            section, value = "led_channels", led_channels
+        else:
+            section = ENDPOINT_SECTIONS[endpoint]
+        self._sections[section] = SectionCache(value, dt_util.utcnow())
+
+    async def _async_reconcile_endpoint(
+        self, endpoint: str, command: dict[str, Any] | None = None
+    ) -> bool | None:
+        """Send the minimal diff for an endpoint.
+
+        Fields of a direct command are sent even if the cached state already
+        matches them, the diff only decides what background reconciliation
+        re-applies. Returns True if a write was applied, False if it failed
+        and None if the device already matched the desired state. Only
+        writes the device answered count against the retry budget; while it
+        can't be reached the write just stays pending.
+        """
+        changes = {**self.desired.diff(endpoint, self.observed(endpoint)), **(command or {})}
+        if not changes:
+            self.desired.clear(endpoint)
+            return None
+
+        try:
+            response = await self._async_post(endpoint, changes)
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Keeping write to %s pending, %s unreachable: %s", endpoint, self.base_url, err)
+            return False
+        except (aiohttp.ClientError, ValueError) as err:
+            _LOGGER.error("Error posting data to %s: %s", endpoint, err)
+            response = None
+        if response is None:
+            self.desired.failed(endpoint)
+            return False
+
+        self.desired.applied(endpoint, changes)
+        self._store_response(endpoint, changes, response)
+        return True
+
+    async def _async_reconcile(self) -> bool:
+        """Reconcile every endpoint with pending desired state."""
+        applied = False
+        async with self.reconcile_lock:
+            for endpoint in self.desired.endpoints:
+                if await self._async_reconcile_endpoint(endpoint):
+                    applied = True
+        return applied
+
+    async def async_set_desired(self, endpoint: str, fields: dict[str, Any]) -> bool:
+        """Record desired state for an endpoint and send it right away.
+
+        Returns False if the write failed; it stays pending and is retried
+        on later polls while the device is reachable. Raises
+        HomeAssistantError for endpoints this clock doesn't have.
+        """
+        if endpoint not in self.writable_endpoints:
+            raise HomeAssistantError(f"{self.model} clock at {self.base_url} has no {endpoint}")
+        self.desired.set(endpoint, fields)
+        async with self.reconcile_lock:
+            result = await self._async_reconcile_endpoint(endpoint, fields)
+        if result:
+            # Trigger state update for all entities
+            self.async_set_updated_data(self._build_data())
+            self._async_sync_lane()
+        return result is not False
+
+    async def async_reconcile(self) -> None:
+        """Push pending desired state now instead of at the next poll."""
+        if self.desired and await self._async_reconcile():
+            self.async_set_updated_data(self._build_data())
+
+    @callback
+    def async_write_applied(
+        self, endpoint: str, sent: dict[str, Any], response: dict[str, Any]
+    ) -> None:
+        """Record a write that was posted outside of the desired-state engine."""
+        self.desired.applied(endpoint, sent)
+        self._store_response(endpoint, sent, response)
+        self.async_set_updated_data(self._build_data())
+        self._async_sync_lane()
+
+    async def async_set_address(self, host: str, port: int) -> None:
+        """Move to a new address without dropping entities or cached state.
+
+        Requests already in flight finish (or fail) against the old address,
+        everything started afterwards uses the new one.
+        """
+        if (host, port) == (self.host, self.port):
+            return
+        _LOGGER.debug("Clock at %s moved to %s:%s", self.base_url, host, port)
+        self.host = host
+        self.port = port
+        self.base_url = f"http://{host}:{port}"
+
+        if self.push is not None:
+            # The socket is bound to the old address
+            self.push.stop()
+            self.push = None
+        if self.lane is not None:
+            # Polls through the new address once the refresh restarts it
+            self.lane.stop()
+            self.lane = None
+
+        # Open a keep-alive connection to the new address and poll through it
+        # right away, so entities only miss the time of one request
+        await self.async_prewarm()
+        await self.async_refresh()
+
+    async def async_probe(self, timeout: float) -> bool:
+        """Return True if the clock answers /api/about within the timeout."""
+        return await self._async_get_data(API_ABOUT, timeout) is not None
+
+    async def async_fetch(self, endpoint: str) -> Any | None:
+        """Get a large, rarely needed document without keeping it per clock."""
+        return await self._async_get_data(endpoint, remember=False)
+
+    async def async_prewarm(self) -> None:
+        """Open a keep-alive connection to the device ahead of a write."""
+        await self._async_get_data(API_ABOUT)
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending section retries, close the push connection and lane."""
+        await super().async_shutdown()
+        if self._retry_unsub:
+            self._retry_unsub()
+            self._retry_unsub = None
+        if self.push is not None:
+            self.push.stop()
+            self.push = None
+        if self.lane is not None:
+            self.lane.stop()
+            self.lane = None
+
+    async def _async_get_data(
+        self, endpoint: str, timeout: float | None = None, *, remember: bool = True
+    ) -> Any | None:
         """Get data from an endpoint."""
         try:
             url = f"{self.base_url}{endpoint}"
-            async with self.session.get(url, timeout=10) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    _LOGGER.warning("API endpoint %s returned status %s", endpoint, response.status)
-                    return None
+            async with self._request_slots:
+                with self.stats.measure(endpoint) as sample:
+                    async with self.session.get(
+                        url, timeout=timeout or self.request_timeout
+                    ) as response:
+                        sample.status = response.status
+                        if response.status == 200:
+                            body = await response.read()
+                            sample.bytes_in = len(body)
+                            digest = hashlib.blake2b(body, digest_size=16).digest()
+                            previous = self._responses.get(endpoint)
+                            if previous is not None and previous[0] == digest:
+                                # Same bytes as last time, skip decoding
+                                self.hash_hits += 1
+                                return previous[1]
+                            self.hash_misses += 1
+                            value = json_loads(body)
+                            if remember:
+                                self._responses[endpoint] = (digest, value)
+                            return value
+                        else:
+                            _LOGGER.warning("API endpoint %s returned status %s", endpoint, response.status)
+                            return None
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching data from %s: %s", endpoint, err)
             return None
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout fetching data from %s: %s", endpoint, err)
             return None
+        except ValueError as err:
+            _LOGGER.error("Invalid JSON from %s: %s", endpoint, err)
+            return None
 
-    async def async_post_data(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any] | None:
+    async def _async_post(
+        self, endpoint: str, data: dict[str, Any] | bytes
+    ) -> dict[str, Any] | None:
+        """Post data to an endpoint, returning None if the device rejected it.
+
+        Data may be passed already serialized. Connection, timeout and
+        decoding errors are raised to the caller.
+        """
+        url = f"{self.base_url}{endpoint}"
+        payload = data if isinstance(data, bytes) else json_bytes(data)
+        async with self._request_slots:
+            with self.stats.measure(endpoint, "POST", len(payload)) as sample:
+                async with self.session.post(
+                    url,
+                    data=payload,
+                    headers={"Content-Type": "application/json"},
+                    timeout=self.request_timeout,
+                ) as response:
+                    sample.status = response.status
+                    if response.status != 200:
+                        _LOGGER.error("API endpoint %s returned status %s", endpoint, response.status)
+                        return None
+                    body = await response.read()
+                    sample.bytes_in = len(body)
+                    # API returns the entire endpoint state after update
+                    return json_loads(body)
+
+    async def async_post_data(
+        self, endpoint: str, data: dict[str, Any] | bytes
+    ) -> dict[str, Any] | None:
         """Post data to an endpoint and return the response."""
         try:
-            url = f"{self.base_url}{endpoint}"
-            async with self.session.post(url, json=data, timeout=10) as response:
-                if response.status == 200:
-                    # API returns the entire endpoint state after update
-                    return await response.json()
-                else:
-                    _LOGGER.error("API endpoint %s returned status %s", endpoint, response.status)
-                    return None
+            return await self._async_post(endpoint, data)
         except aiohttp.ClientError as err:
             _LOGGER.error("Error posting data to %s: %s", endpoint, err)
             return None
         except asyncio.TimeoutError as err:
             _LOGGER.error("Timeout posting data to %s: %s", endpoint, err)
             return None
+        except ValueError as err:
+            _LOGGER.error("Invalid JSON from %s: %s", endpoint, err)
+            return None
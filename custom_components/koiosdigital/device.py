@@ -6,6 +6,17 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from .const import DOMAIN, MODEL_MATRX, MODEL_TRANQUIL
 
 
+def get_device_name(model: str, host: str) -> str:
+    """Get the registry name of a Koios Clock at an address."""
+    # Set appropriate device name based on model
+    device_name = "Koios Clock"
+    if model == MODEL_MATRX:
+        device_name = "Koios MATRX"
+    elif model == MODEL_TRANQUIL:
+        device_name = "Koios Tranquil"
+    return f"{device_name} ({host})"
+
+
 def get_device_info(
     coordinator,
     host: str,
@@ -14,17 +25,10 @@ def get_device_info(
 ) -> DeviceInfo:
     """Get device info for Koios Clock device."""
     about_data = coordinator.data.get("about", {})
-    
-    # Set appropriate device name based on model
-    device_name = "Koios Clock"
-    if model == MODEL_MATRX:
-        device_name = "Koios MATRX"
-    elif model == MODEL_TRANQUIL:
-        device_name = "Koios Tranquil"
-    
+
     return DeviceInfo(
-        identifiers={(DOMAIN, f"{host}_{port}")},
-        name=f"{device_name} ({host})",
+        identifiers={(DOMAIN, coordinator.device_id)},
+        name=get_device_name(model, host),
         manufacturer="Koios Digital",
         model=model.title(),
         sw_version=about_data.get("version"),
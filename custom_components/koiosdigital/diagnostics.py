@@ -0,0 +1,82 @@
+"""Diagnostics support for Koios Digital Clock."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import KoiosClockDataUpdateCoordinator
+from .schedule import async_get_schedules
+
+# Addresses, names and identifiers that point at a clock or its network;
+# zeroconf entries are titled with the hostname
+TO_REDACT = {
+    CONF_HOST,
+    "base_url",
+    "device",
+    "device_id",
+    "hostname",
+    "ip",
+    "mac",
+    "ntp_server",
+    "serial",
+    "ssid",
+    "title",
+    "wifi_hostname",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: KoiosClockDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    update_interval = coordinator.update_interval
+    sections = coordinator.section_status()
+    watchdog = coordinator.watchdog.as_dict()
+
+    diagnostics = {
+        "entry": {
+            "title": entry.title,
+            "data": dict(entry.data),
+            "options": dict(entry.options),
+        },
+        "coordinator": {
+            "base_url": coordinator.base_url,
+            "model": coordinator.model,
+            "last_update_success": coordinator.last_update_success,
+            "poll_interval": update_interval.total_seconds() if update_interval else None,
+            "stale_after": coordinator.stale_after.total_seconds(),
+            "request_timeout": coordinator.request_timeout,
+            "max_in_flight": coordinator.max_in_flight,
+            "catalog_ttl": coordinator.catalog_ttl.total_seconds(),
+            "push": coordinator.push.as_dict() if coordinator.push else None,
+            "lane": coordinator.lane.as_dict() if coordinator.lane else None,
+            "brightness_schedules": async_get_schedules(hass).curves(coordinator.device_id),
+            "sections": sections,
+            "queues": {
+                "pending_writes": len(coordinator.desired),
+                "pending_endpoints": coordinator.desired.endpoints,
+                "failed_sections": sum(status["failed"] for status in sections.values()),
+                "in_flight_requests": coordinator.stats.in_flight,
+            },
+            "hash_hits": coordinator.hash_hits,
+            "hash_misses": coordinator.hash_misses,
+        },
+        "requests": coordinator.stats.as_dict(),
+        "traces": coordinator.tracer.as_dict() if coordinator.tracer else None,
+        "watchdog": {
+            **watchdog,
+            "reports": [
+                report
+                for report in watchdog["reports"]
+                if report["device"] in (coordinator.base_url, "")
+            ],
+        },
+        "data": coordinator.data,
+    }
+    return async_redact_data(diagnostics, TO_REDACT)
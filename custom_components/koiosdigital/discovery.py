@@ -0,0 +1,69 @@
+"""Cache of zeroconf probe results for Koios Digital Clock."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_DISCOVERY, DISCOVERY_CACHE_TTL, DISCOVERY_FAILURE_TTL
+
+
+@dataclass
+class DiscoveryResult:
+    """Outcome of probing /api/about for one announcement."""
+
+    signature: tuple[Any, ...]
+    device_info: dict[str, Any] | None
+    probed: float
+
+    def expired(self, now: float, ttl: float, failure_ttl: float) -> bool:
+        """Return True once the result should no longer be reused."""
+        return now - self.probed >= (ttl if self.device_info is not None else failure_ttl)
+
+
+class DiscoveryCache:
+    """Probe results keyed by mDNS hostname, shared by every flow.
+
+    A clock re-announces itself regularly and each announcement starts a new
+    flow; as long as host, port and TXT properties are unchanged the cached
+    result is reused instead of probing the device again.
+    """
+
+    def __init__(
+        self, ttl: float = DISCOVERY_CACHE_TTL, failure_ttl: float = DISCOVERY_FAILURE_TTL
+    ) -> None:
+        """Initialize."""
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self._results: dict[str, DiscoveryResult] = {}
+
+    @callback
+    def get(self, hostname: str, signature: tuple[Any, ...]) -> DiscoveryResult | None:
+        """Return a fresh result for an unchanged announcement."""
+        now = time.monotonic()
+        self._results = {
+            key: result
+            for key, result in self._results.items()
+            if not result.expired(now, self.ttl, self.failure_ttl)
+        }
+        result = self._results.get(hostname)
+        if result is None or result.signature != signature:
+            return None
+        return result
+
+    @callback
+    def store(
+        self, hostname: str, signature: tuple[Any, ...], device_info: dict[str, Any] | None
+    ) -> None:
+        """Remember a probe result, None if the device could not be reached."""
+        self._results[hostname] = DiscoveryResult(signature, device_info, time.monotonic())
+
+
+@callback
+def async_get_discovery_cache(hass: HomeAssistant) -> DiscoveryCache:
+    """Return the discovery cache shared by every flow."""
+    if (cache := hass.data.get(DATA_DISCOVERY)) is None:
+        cache = hass.data[DATA_DISCOVERY] = DiscoveryCache()
+    return cache
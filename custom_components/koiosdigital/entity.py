@@ -0,0 +1,16 @@
+"""Base entity for Koios Digital Clock integration."""
+from __future__ import annotations
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+
+class KoiosClockEntity(CoordinatorEntity):
+    """Base class for entities backed by a section of the coordinator data."""
+
+    # Coordinator data section backing this entity
+    _section: str | None = None
+
+    @property
+    def available(self) -> bool:
+        """Return True until the entity's own section goes stale."""
+        return super().available and self.coordinator.section_available(self._section)
@@ -0,0 +1,194 @@
+"""Request instrumentation for Koios Digital Clock."""
+from __future__ import annotations
+
+import asyncio
+import time
+from bisect import bisect_left
+from types import TracebackType
+from typing import Any
+
+import aiohttp
+
+# Upper bounds of the latency histogram buckets in milliseconds, the last
+# bucket catches everything slower
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def new_histogram() -> list[int]:
+    """Return an empty latency histogram."""
+    return [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+
+def histogram_percentile(histogram: list[int], pct: float) -> float | None:
+    """Return the bucket bound below which pct percent of requests finished."""
+    total = sum(histogram)
+    if not total:
+        return None
+    threshold = total * pct / 100
+    seen = 0
+    for bound, count in zip((*LATENCY_BUCKETS_MS, float("inf")), histogram):
+        seen += count
+        if seen >= threshold:
+            return bound
+    return float("inf")
+
+
+class EndpointStats:
+    """Counters and latency histogram of one endpoint."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "timeouts",
+        "status_408",
+        "status_5xx",
+        "bytes_in",
+        "bytes_out",
+        "histogram",
+        "last_ms",
+    )
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.requests = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.status_408 = 0
+        self.status_5xx = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.histogram = new_histogram()
+        self.last_ms: float | None = None
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the bucket bound below which pct percent of requests finished."""
+        return histogram_percentile(self.histogram, pct)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "status_408": self.status_408,
+            "status_5xx": self.status_5xx,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "last_ms": self.last_ms,
+            "latency_ms": {
+                f"le_{bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self.histogram)
+            }
+            | {"slower": self.histogram[-1]},
+        }
+
+
+class RequestSample:
+    """Measure one request and record it when done."""
+
+    __slots__ = ("_stats", "_endpoint", "_method", "_start", "status", "bytes_in", "bytes_out")
+
+    def __init__(self, stats: RequestStats, endpoint: str, method: str, bytes_out: int) -> None:
+        """Initialize."""
+        self._stats = stats
+        self._endpoint = endpoint
+        self._method = method
+        self._start = 0.0
+        self.status: int | None = None
+        self.bytes_in = 0
+        self.bytes_out = bytes_out
+
+    def __enter__(self) -> RequestSample:
+        """Start timing."""
+        self._start = time.monotonic()
+        self._stats.in_flight += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Record the outcome, exceptions are left to the caller."""
+        self._stats.in_flight -= 1
+        self._stats.record(
+            self._endpoint,
+            self._method,
+            (time.monotonic() - self._start) * 1000,
+            self.status,
+            self.bytes_in,
+            self.bytes_out,
+            timeout=exc_type is not None and issubclass(exc_type, asyncio.TimeoutError),
+            error=exc_type is not None and issubclass(exc_type, (aiohttp.ClientError, ValueError)),
+        )
+
+
+class RequestStats:
+    """Per-endpoint request statistics of one device."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.endpoints: dict[str, EndpointStats] = {}
+        self.in_flight = 0
+        self.started = time.monotonic()
+        # Running totals across endpoints, cheap to diff between polls
+        self.requests = 0
+        self.gets = 0
+        self.get_ms = 0.0
+        self.get_histogram = new_histogram()
+        self.last_write_ms: float | None = None
+
+    def measure(self, endpoint: str, method: str = "GET", bytes_out: int = 0) -> RequestSample:
+        """Return a context manager measuring one request."""
+        return RequestSample(self, endpoint, method, bytes_out)
+
+    def record(
+        self,
+        endpoint: str,
+        method: str,
+        duration_ms: float,
+        status: int | None,
+        bytes_in: int,
+        bytes_out: int,
+        *,
+        timeout: bool = False,
+        error: bool = False,
+    ) -> None:
+        """Record a finished request."""
+        if (stats := self.endpoints.get(endpoint)) is None:
+            stats = self.endpoints[endpoint] = EndpointStats()
+        bucket = bisect_left(LATENCY_BUCKETS_MS, duration_ms)
+        stats.requests += 1
+        self.requests += 1
+        if method == "GET":
+            self.gets += 1
+            self.get_ms += duration_ms
+            self.get_histogram[bucket] += 1
+        else:
+            self.last_write_ms = round(duration_ms, 1)
+        stats.bytes_in += bytes_in
+        stats.bytes_out += bytes_out
+        stats.last_ms = round(duration_ms, 1)
+        stats.histogram[bucket] += 1
+        if timeout:
+            stats.timeouts += 1
+        elif error:
+            stats.errors += 1
+        if status == 408:
+            stats.status_408 += 1
+        elif status is not None and status >= 500:
+            stats.status_5xx += 1
+
+    def requests_per_minute(self) -> float:
+        """Return the average request rate since the counters started."""
+        elapsed = time.monotonic() - self.started
+        return self.requests * 60 / elapsed if elapsed > 0 else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "last_write_ms": self.last_write_ms,
+            "endpoints": {endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()},
+        }
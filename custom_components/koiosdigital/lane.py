@@ -0,0 +1,97 @@
+"""Fast polling lane for Koios Digital Clock sections without push."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant
+
+from .const import LANE_FAST_INTERVAL, LANE_INTERVAL
+
+if TYPE_CHECKING:
+    from .coordinator import KoiosClockDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SectionLane:
+    """Poll a single section much faster than the rest of the clock.
+
+    Meant for state the firmware changes by itself, such as a MATRX
+    switching its screen from the light sensor. The lane polls at
+    LANE_INTERVAL, drops to LANE_FAST_INTERVAL right after a change and
+    doubles back per unchanged fetch, so bursts of changes are followed
+    closely. While the lane is healthy the section is left out of the
+    regular poll; after a failed fetch the regular poll takes it back and
+    the lane waits one poll interval before trying again.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: KoiosClockDataUpdateCoordinator,
+        section: str,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.section = section
+        self.active = False
+        self.interval = LANE_INTERVAL
+        self.fetches = 0
+        self.changes = 0
+        self.failures = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the polling loop."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{self.coordinator.base_url} {self.section} lane"
+            )
+
+    def stop(self) -> None:
+        """Stop polling and hand the section back to the regular poll."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._set_active(False)
+
+    def _set_active(self, active: bool) -> None:
+        """Tell the coordinator whether the lane keeps the section current."""
+        if active != self.active:
+            self.active = active
+            self.coordinator.async_push_state(self.section, active)
+
+    async def _async_run(self) -> None:
+        """Fetch the section, speeding up after changes."""
+        while True:
+            await asyncio.sleep(self.interval)
+            changed = await self.coordinator.async_refresh_section(self.section)
+            if self._task is None:
+                # The fetch turned the lane off
+                return
+            self.fetches += 1
+            if changed is None:
+                self.failures += 1
+                self._set_active(False)
+                self.interval = self.coordinator.update_interval.total_seconds()
+                continue
+            self._set_active(True)
+            if changed:
+                self.changes += 1
+                self.interval = LANE_FAST_INTERVAL
+            else:
+                self.interval = min(self.interval * 2, LANE_INTERVAL)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the lane state for diagnostics."""
+        return {
+            "section": self.section,
+            "active": self.active,
+            "interval": self.interval,
+            "fetches": self.fetches,
+            "changes": self.changes,
+            "failures": self.failures,
+        }
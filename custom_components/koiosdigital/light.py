@@ -16,7 +16,6 @@ from homeassistant.components.light import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     API_LED_CHANNEL,
@@ -34,6 +33,7 @@ from .const import (
 )
 from .coordinator import KoiosClockDataUpdateCoordinator
 from .device import get_device_info
+from .entity import KoiosClockEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,7 +69,7 @@ async def async_setup_entry(
     async_add_entities(entities, True)
 
 
-class KoiosClockLightEntity(CoordinatorEntity, LightEntity):
+class KoiosClockLightEntity(KoiosClockEntity, LightEntity):
     """Base class for Koios Clock light entities."""
 
     def __init__(
@@ -81,7 +81,7 @@ class KoiosClockLightEntity(CoordinatorEntity, LightEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.light_type = light_type
-        self._attr_unique_id = f"{coordinator.host}_{coordinator.port}_{light_type}"
+        self._attr_unique_id = f"{coordinator.device_id}_{light_type}"
         self._attr_device_info = get_device_info(
             coordinator, coordinator.host, coordinator.port, coordinator.model
         )
@@ -90,6 +90,8 @@ class KoiosClockLightEntity(CoordinatorEntity, LightEntity):
 class KoiosClockBacklight(KoiosClockLightEntity):
     """Representation of the Koios Clock backlight LEDs."""
 
+    _section = "led_channels"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the backlight."""
         super().__init__(coordinator, "backlight")
@@ -190,32 +192,20 @@ class KoiosClockBacklight(KoiosClockLightEntity):
             data["effect_id"] = "SOLID"
 
         endpoint = f"{API_LED_CHANNEL}/{self._channel_index}"
-        response = await self.coordinator.async_post_data(endpoint, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            led_channels = self.coordinator.data.setdefault("led_channels", {})
-            led_channels[self._channel_index] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(endpoint, data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Instruct the light to turn off."""
         data = {"on": False}
         endpoint = f"{API_LED_CHANNEL}/{self._channel_index}"
-        response = await self.coordinator.async_post_data(endpoint, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            led_channels = self.coordinator.data.setdefault("led_channels", {})
-            led_channels[self._channel_index] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(endpoint, data)
 
 
 class KoiosClockNixieTubes(KoiosClockLightEntity):
     """Representation of the Nixie tubes as a light for brightness control."""
 
+    _section = "nixie"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the nixie tubes."""
         super().__init__(coordinator, "nixie_tubes")
@@ -246,27 +236,19 @@ class KoiosClockNixieTubes(KoiosClockLightEntity):
             brightness_percent = int(kwargs[ATTR_BRIGHTNESS] * 100 / 255)
             data["brightness"] = brightness_percent
 
-        response = await self.coordinator.async_post_data(API_NIXIE, data)
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["nixie"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_NIXIE, data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the nixie tubes."""
         data = {"on": False}
-        response = await self.coordinator.async_post_data(API_NIXIE, data)
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["nixie"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_NIXIE, data)
 
 
 class KoiosClockFibonacciTheme(KoiosClockLightEntity):
     """Representation of the Fibonacci theme as a light entity."""
 
+    _section = "fibonacci"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the fibonacci theme light."""
         super().__init__(coordinator, "fibonacci_theme")
@@ -321,27 +303,19 @@ class KoiosClockFibonacciTheme(KoiosClockLightEntity):
             )
             data["theme_id"] = theme_id
 
-        response = await self.coordinator.async_post_data(API_FIBONACCI, data)
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["fibonacci"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_FIBONACCI, data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the fibonacci display."""
         data = {"on": False}
-        response = await self.coordinator.async_post_data(API_FIBONACCI, data)
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["fibonacci"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_FIBONACCI, data)
 
 
 class KoiosClockMatrxScreen(KoiosClockLightEntity):
     """Representation of the MATRX screen as a light entity (fallback control)."""
 
+    _section = "system_config"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the MATRX screen light."""
         super().__init__(coordinator, "matrx_screen")
@@ -368,19 +342,9 @@ class KoiosClockMatrxScreen(KoiosClockLightEntity):
         if ATTR_BRIGHTNESS in kwargs:
             data["screen_brightness"] = kwargs[ATTR_BRIGHTNESS]
 
-        response = await self.coordinator.async_post_data(API_SYSTEM_CONFIG, data)
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["system_config"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_SYSTEM_CONFIG, data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the MATRX screen."""
         data = {"screen_enabled": False}
-        response = await self.coordinator.async_post_data(API_SYSTEM_CONFIG, data)
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["system_config"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_SYSTEM_CONFIG, data)
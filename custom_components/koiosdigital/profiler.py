@@ -0,0 +1,124 @@
+"""On-demand profiling of the Koios Digital Clock integration."""
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import logging
+import os
+import pstats
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import KoiosClockDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Source directory of the integration, used to pick its own functions out
+# of the profile
+INTEGRATION_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Seconds between checks for completed poll cycles
+POLL_CHECK_INTERVAL = 0.5
+
+_PROFILE_LOCK = asyncio.Lock()
+
+
+def _summarize(profile: cProfile.Profile, path: str, top: int) -> dict[str, list[dict[str, Any]]]:
+    """Write the stats file and return the top functions, runs in the executor."""
+    profile.dump_stats(path)
+    stats = pstats.Stats(profile)
+
+    def _entry(function: tuple[str, int, str], row: tuple[Any, ...]) -> dict[str, Any]:
+        filename, line, name = function
+        _primitive_calls, calls, tottime, cumtime, _callers = row
+        if filename.startswith(INTEGRATION_DIR):
+            filename = os.path.relpath(filename, INTEGRATION_DIR)
+        return {
+            "function": f"{filename}:{line}({name})",
+            "calls": calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+        }
+
+    rows = stats.stats.items()  # type: ignore[attr-defined]
+    integration = sorted(
+        (item for item in rows if item[0][0].startswith(INTEGRATION_DIR)),
+        key=lambda item: item[1][3],
+        reverse=True,
+    )
+    # Time spent anywhere, this is where JSON decoding and state writes
+    # triggered by the integration show up. The selector wait is the loop
+    # being idle, not work.
+    overall = sorted(
+        (item for item in rows if "of 'select." not in item[0][2]),
+        key=lambda item: item[1][2],
+        reverse=True,
+    )
+    return {
+        "integration": [_entry(function, row) for function, row in integration[:top]],
+        "overall": [_entry(function, row) for function, row in overall[:top]],
+    }
+
+
+async def async_profile(
+    hass: HomeAssistant,
+    coordinators: list[KoiosClockDataUpdateCoordinator],
+    seconds: float,
+    polls: int | None,
+    top: int,
+) -> dict[str, Any]:
+    """Profile the event loop until enough polls completed or time ran out.
+
+    The profiler is only enabled for the duration of the run, outside of it
+    the integration runs without any profiling hooks.
+    """
+    if _PROFILE_LOCK.locked():
+        raise HomeAssistantError("A profile is already running")
+
+    async with _PROFILE_LOCK:
+        refreshes = {coordinator: coordinator.refreshes for coordinator in coordinators}
+        profile = cProfile.Profile()
+        start = time.monotonic()
+        deadline = start + seconds
+        try:
+            profile.enable()
+        except ValueError as err:
+            # Another profiler, e.g. the profiler integration, is active
+            raise HomeAssistantError(f"Cannot start profiler: {err}") from err
+        try:
+            while time.monotonic() < deadline:
+                if polls and coordinators and all(
+                    coordinator.refreshes - count >= polls
+                    for coordinator, count in refreshes.items()
+                ):
+                    break
+                await asyncio.sleep(min(POLL_CHECK_INTERVAL, deadline - time.monotonic()))
+        finally:
+            profile.disable()
+
+        duration = time.monotonic() - start
+        completed = min(
+            (coordinator.refreshes - count for coordinator, count in refreshes.items()),
+            default=0,
+        )
+        path = hass.config.path(f"{DOMAIN}_profile_{dt_util.utcnow():%Y%m%d_%H%M%S}.prof")
+        summary = await hass.async_add_executor_job(_summarize, profile, path, top)
+
+    _LOGGER.info(
+        "Profiled %s devices for %.1f s (%s polls each), stats written to %s",
+        len(coordinators),
+        duration,
+        completed,
+        path,
+    )
+    return {
+        "file": path,
+        "duration_s": round(duration, 1),
+        "polls": completed,
+        **summary,
+    }
@@ -0,0 +1,103 @@
+"""Websocket push for Koios Digital Clock sections."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.util.json import json_loads
+
+from .const import PUSH_RECONNECT_MAX, PUSH_RECONNECT_MIN
+
+if TYPE_CHECKING:
+    from .coordinator import KoiosClockDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SectionPush:
+    """Keep a websocket to a clock open and feed its messages to the coordinator.
+
+    The clock sends the full section state on connect and after every
+    change, so while the socket is up the section doesn't need polling.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: KoiosClockDataUpdateCoordinator,
+        section: str,
+        endpoint: str,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.section = section
+        self.endpoint = endpoint
+        self.connected = False
+        self.messages = 0
+        self.reconnects = 0
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the connection loop."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_run(), f"{self.coordinator.base_url}{self.endpoint} push"
+            )
+
+    def stop(self) -> None:
+        """Close the connection and stop reconnecting."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._set_connected(False)
+
+    def _set_connected(self, connected: bool) -> None:
+        """Tell the coordinator whether the section is pushed."""
+        if connected != self.connected:
+            self.connected = connected
+            self.coordinator.async_push_state(self.section, connected)
+
+    async def _async_run(self) -> None:
+        """Connect, read messages and reconnect with backoff."""
+        delay = PUSH_RECONNECT_MIN
+        url = f"{self.coordinator.base_url}{self.endpoint}"
+        while True:
+            try:
+                async with self.coordinator.session.ws_connect(
+                    url,
+                    timeout=self.coordinator.request_timeout,
+                    heartbeat=self.coordinator.update_interval.total_seconds(),
+                ) as socket:
+                    delay = PUSH_RECONNECT_MIN
+                    async for message in socket:
+                        if message.type != aiohttp.WSMsgType.TEXT:
+                            continue
+                        try:
+                            value = json_loads(message.data)
+                        except ValueError as err:
+                            _LOGGER.debug("Invalid push message from %s: %s", url, err)
+                            continue
+                        self.messages += 1
+                        # The first message is the current state, only then
+                        # can polling of the section stop
+                        self._set_connected(True)
+                        self.coordinator.async_push_update(self.section, value)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Push connection to %s failed: %s", url, err)
+            self._set_connected(False)
+            self.reconnects += 1
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PUSH_RECONNECT_MAX)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the connection state for diagnostics."""
+        return {
+            "endpoint": self.endpoint,
+            "connected": self.connected,
+            "messages": self.messages,
+            "reconnects": self.reconnects,
+        }
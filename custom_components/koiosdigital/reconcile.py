@@ -0,0 +1,94 @@
+"""Desired-state reconciliation for Koios Digital Clock."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from .const import RECONCILE_MAX_ATTEMPTS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def diff_state(desired: dict[str, Any], observed: dict[str, Any]) -> dict[str, Any]:
+    """Return the desired fields that differ from the observed state."""
+    changes = {}
+    for key, value in desired.items():
+        current = observed.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            # Nested values (e.g. color) only need the given components to match
+            if any(current.get(k) != v for k, v in value.items()):
+                changes[key] = value
+        elif current != value:
+            changes[key] = value
+    return changes
+
+
+class DesiredState:
+    """Per-device record of the state automations and services asked for.
+
+    Fields are kept per endpoint until the device acknowledges them or the
+    retry budget runs out, so commands sent while a clock is offline are
+    applied once it is reachable again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._attempts: dict[str, int] = {}
+
+    def __bool__(self) -> bool:
+        """Return True if anything is waiting to be applied."""
+        return bool(self._pending)
+
+    def __len__(self) -> int:
+        """Return the number of endpoints with pending fields."""
+        return len(self._pending)
+
+    @property
+    def endpoints(self) -> list[str]:
+        """Return the endpoints with pending fields."""
+        return list(self._pending)
+
+    def set(self, endpoint: str, fields: dict[str, Any]) -> None:
+        """Merge desired fields for an endpoint."""
+        self._pending.setdefault(endpoint, {}).update(fields)
+        self._attempts.pop(endpoint, None)
+
+    def get(self, endpoint: str) -> dict[str, Any]:
+        """Return the pending fields for an endpoint."""
+        return self._pending.get(endpoint, {})
+
+    def diff(self, endpoint: str, observed: dict[str, Any]) -> dict[str, Any]:
+        """Return the minimal update needed to reach the desired state."""
+        return diff_state(self._pending.get(endpoint, {}), observed)
+
+    def clear(self, endpoint: str) -> None:
+        """Forget everything pending for an endpoint."""
+        self._pending.pop(endpoint, None)
+        self._attempts.pop(endpoint, None)
+
+    def applied(self, endpoint: str, sent: dict[str, Any]) -> None:
+        """Drop fields the device acknowledged, unless they changed meanwhile."""
+        pending = self._pending.get(endpoint)
+        if pending is None:
+            return
+        for key, value in sent.items():
+            if pending.get(key) == value:
+                del pending[key]
+        if not pending:
+            self.clear(endpoint)
+
+    def failed(self, endpoint: str) -> bool:
+        """Count a failed write, returning True once the endpoint is given up."""
+        attempts = self._attempts.get(endpoint, 0) + 1
+        if attempts < RECONCILE_MAX_ATTEMPTS:
+            self._attempts[endpoint] = attempts
+            return False
+        _LOGGER.warning(
+            "Giving up on %s after %s attempts, dropping %s",
+            endpoint,
+            attempts,
+            self._pending.get(endpoint),
+        )
+        self.clear(endpoint)
+        return True
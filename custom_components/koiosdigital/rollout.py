@@ -0,0 +1,189 @@
+"""Fleet-wide system config rollouts for Koios Digital Clock."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    API_SYSTEM_CONFIG,
+    MODEL_MATRX,
+    ROLLOUT_CONCURRENCY,
+    ROLLOUT_RETRIES,
+    ROLLOUT_RETRY_DELAY,
+)
+from .coordinator import KoiosClockDataUpdateCoordinator
+from .reconcile import diff_state
+from .zonedb import async_get_zonedb, firmware_version
+
+_LOGGER = logging.getLogger(__name__)
+
+# Limits from SystemConfigUpdate in the device API
+MAX_LENGTH = 63
+HOSTNAME_LABEL = re.compile(r"^(?!-)[A-Za-z0-9-]{1,63}(?<!-)$")
+
+# Placeholders available in wifi_hostname patterns
+HOSTNAME_FIELDS = ("index", "model", "host")
+
+
+def render_hostnames(
+    pattern: str, coordinators: list[KoiosClockDataUpdateCoordinator]
+) -> list[str]:
+    """Render a wifi_hostname pattern for every target and validate the result.
+
+    {index} counts from 1 in target order, {model} is the clock model and
+    {host} its address with dots replaced by dashes.
+    """
+    try:
+        hostnames = [
+            pattern.format(
+                index=index, model=coordinator.model, host=coordinator.host.replace(".", "-")
+            )
+            for index, coordinator in enumerate(coordinators, 1)
+        ]
+    except (KeyError, IndexError, ValueError) as err:
+        fields = ", ".join(f"{{{field}}}" for field in HOSTNAME_FIELDS)
+        raise HomeAssistantError(
+            f"Invalid wifi_hostname pattern {pattern!r}, fields are {fields}"
+        ) from err
+
+    if invalid := [name for name in hostnames if not HOSTNAME_LABEL.match(name)]:
+        raise HomeAssistantError(f"Invalid hostnames {', '.join(invalid[:5])}")
+    if len(set(hostnames)) != len(hostnames):
+        raise HomeAssistantError(
+            "wifi_hostname must render a different name per clock, add {index} or {host}"
+        )
+    return hostnames
+
+
+def _validate_ntp_server(server: str) -> None:
+    """Validate an NTP server host name or address."""
+    if not 0 < len(server) <= MAX_LENGTH or not all(
+        HOSTNAME_LABEL.match(label) for label in server.split(".")
+    ):
+        raise HomeAssistantError(f"Invalid NTP server {server!r}")
+
+
+async def _async_unknown_timezone(
+    hass: HomeAssistant, coordinator: KoiosClockDataUpdateCoordinator, timezone: str
+) -> bool:
+    """Return True if the clock's firmware doesn't know a timezone."""
+    zones = await async_get_zonedb(hass).async_get(coordinator)
+    # Without a database the clock itself is left to reject the value
+    return zones is not None and timezone not in zones
+
+
+async def async_rollout_system_config(
+    hass: HomeAssistant,
+    coordinators: list[KoiosClockDataUpdateCoordinator],
+    changes: dict[str, Any],
+    concurrency: int = ROLLOUT_CONCURRENCY,
+    retries: int = ROLLOUT_RETRIES,
+) -> dict[str, Any]:
+    """Apply a partial system config to many clocks and report per clock.
+
+    Values are validated once before any request goes out; wifi_hostname is
+    a pattern rendered per clock. Clocks that already match are skipped,
+    the rest are written with bounded concurrency and retried with backoff.
+    Clocks still failing keep the change as desired state, so it is applied
+    once they answer a poll again.
+    """
+    start = time.monotonic()
+    if not changes:
+        raise HomeAssistantError("Nothing to change")
+    if len(changes.get("timezone", "")) > MAX_LENGTH:
+        raise HomeAssistantError(f"Timezone longer than {MAX_LENGTH} characters")
+    if "ntp_server" in changes:
+        _validate_ntp_server(changes["ntp_server"])
+
+    report: dict[str, dict[str, Any]] = {}
+    targets = []
+    for coordinator in coordinators:
+        if coordinator.model == MODEL_MATRX:
+            report[coordinator.base_url] = {"status": "unsupported"}
+        else:
+            targets.append(coordinator)
+    targets.sort(key=lambda coordinator: coordinator.device_id)
+
+    hostnames: list[str | None] = [None] * len(targets)
+    if "wifi_hostname" in changes:
+        hostnames = render_hostnames(changes["wifi_hostname"], targets)
+
+    payloads = []
+    for coordinator, hostname in zip(targets, hostnames):
+        payload = dict(changes)
+        if hostname is not None:
+            payload["wifi_hostname"] = hostname
+        payloads.append(payload)
+
+    if "timezone" in changes:
+        # One database per firmware version, downloaded at most once
+        unknown = await asyncio.gather(
+            *(
+                _async_unknown_timezone(hass, coordinator, changes["timezone"])
+                for coordinator in targets
+            )
+        )
+        if all(unknown) and targets:
+            raise HomeAssistantError(f"Unknown timezone {changes['timezone']}")
+        for coordinator, is_unknown in zip(targets, unknown):
+            if is_unknown:
+                report[coordinator.base_url] = {
+                    "status": "invalid",
+                    "error": f"timezone unknown to firmware {firmware_version(coordinator)}",
+                }
+
+    slots = asyncio.Semaphore(concurrency)
+
+    async def _async_write(
+        coordinator: KoiosClockDataUpdateCoordinator, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        async with slots:
+            await coordinator.async_refresh_observed(API_SYSTEM_CONFIG)
+            if not diff_state(payload, coordinator.observed(API_SYSTEM_CONFIG)):
+                return {"status": "unchanged", "attempts": 0}
+            device_start = time.monotonic()
+            for attempt in range(1, retries + 2):
+                if attempt > 1:
+                    await asyncio.sleep(ROLLOUT_RETRY_DELAY * 2 ** (attempt - 2))
+                response = await coordinator.async_post_data(API_SYSTEM_CONFIG, payload)
+                if response is not None:
+                    coordinator.async_write_applied(API_SYSTEM_CONFIG, payload, response)
+                    status = "ok"
+                    break
+            else:
+                # Reconciled on a later poll once the clock answers again
+                coordinator.desired.set(API_SYSTEM_CONFIG, payload)
+                status = "pending"
+            return {
+                "status": status,
+                "attempts": attempt,
+                "duration_ms": round((time.monotonic() - device_start) * 1000, 1),
+            }
+
+    writes = [
+        (coordinator, payload)
+        for coordinator, payload in zip(targets, payloads)
+        if coordinator.base_url not in report
+    ]
+    results = await asyncio.gather(
+        *(_async_write(coordinator, payload) for coordinator, payload in writes)
+    )
+    for (coordinator, payload), result in zip(writes, results):
+        if "wifi_hostname" in payload:
+            result["wifi_hostname"] = payload["wifi_hostname"]
+        report[coordinator.base_url] = result
+
+    summary: dict[str, int] = {}
+    for result in report.values():
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+    duration_ms = round((time.monotonic() - start) * 1000, 1)
+    _LOGGER.debug(
+        "System config rollout to %s clocks in %s ms: %s", len(report), duration_ms, summary
+    )
+    return {"duration_ms": duration_ms, "summary": summary, "devices": report}
@@ -0,0 +1,95 @@
+"""Subnet scan for Koios Digital Clocks without working mDNS."""
+from __future__ import annotations
+
+import asyncio
+import ipaddress
+import logging
+from typing import Any
+
+import aiohttp
+
+from .const import (
+    API_ABOUT,
+    MODEL_FIBONACCI,
+    MODEL_MATRX,
+    MODEL_NIXIE,
+    MODEL_TRANQUIL,
+    MODEL_WORDCLOCK,
+    SCAN_CONCURRENCY,
+    SCAN_MAX_HOSTS,
+    SCAN_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+KNOWN_MODELS = (MODEL_FIBONACCI, MODEL_NIXIE, MODEL_WORDCLOCK, MODEL_MATRX, MODEL_TRANQUIL)
+
+
+class NetworkTooLarge(ValueError):
+    """Error to indicate the network has too many hosts to scan."""
+
+
+def parse_network(cidr: str) -> list[str]:
+    """Return the host addresses of a CIDR range.
+
+    Raises ValueError for an invalid range and NetworkTooLarge for ranges
+    with more than SCAN_MAX_HOSTS addresses.
+    """
+    network = ipaddress.ip_network(cidr.strip(), strict=False)
+    if network.num_addresses > SCAN_MAX_HOSTS + 2:
+        raise NetworkTooLarge(cidr)
+    if network.num_addresses == 1:
+        return [str(network.network_address)]
+    return [str(host) for host in network.hosts()]
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, host: str, port: int, timeout: aiohttp.ClientTimeout
+) -> dict[str, Any] | None:
+    """Ask one address for /api/about, returning None if it is not a clock."""
+    try:
+        async with session.get(f"http://{host}:{port}{API_ABOUT}", timeout=timeout) as response:
+            if response.status != 200:
+                return None
+            data = await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+        return None
+
+    if not isinstance(data, dict):
+        return None
+    # Handle both 'subtype' (legacy clocks) and 'type' (MATRX devices)
+    subtype = data.get("subtype") or data.get("type")
+    if subtype not in KNOWN_MODELS:
+        return None
+    return {
+        "host": host,
+        "port": port,
+        "subtype": subtype,
+        "version": data.get("version"),
+        "model": data.get("model"),
+    }
+
+
+async def async_scan_network(
+    session: aiohttp.ClientSession,
+    hosts: list[str],
+    port: int = 80,
+    concurrency: int = SCAN_CONCURRENCY,
+    timeout: float = SCAN_TIMEOUT,
+) -> list[dict[str, Any]]:
+    """Probe every address concurrently and return the clocks found.
+
+    Most addresses don't answer at all, so the connect timeout is kept at
+    half of the total to move on quickly.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout, sock_connect=timeout / 2)
+
+    async def _async_bounded_probe(host: str) -> dict[str, Any] | None:
+        async with semaphore:
+            return await _async_probe(session, host, port, client_timeout)
+
+    results = await asyncio.gather(*(_async_bounded_probe(host) for host in hosts))
+    found = [result for result in results if result is not None]
+    _LOGGER.debug("Scanned %s addresses, found %s clocks", len(hosts), len(found))
+    return found
@@ -0,0 +1,182 @@
+"""Brightness schedules for Koios Digital Clock lights."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_right
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    API_FIBONACCI,
+    API_LED_CHANNEL,
+    API_NIXIE,
+    API_SYSTEM_CONFIG,
+    DATA_SCHEDULES,
+    DOMAIN,
+    LED_CHANNEL_BACKLIGHT,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import KoiosClockDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.schedules"
+STORAGE_VERSION = 1
+
+SECONDS_PER_DAY = 86400
+
+# Brightness written by a schedule per light type: endpoint, field and the
+# largest value the firmware accepts for it
+SCHEDULE_TARGETS = {
+    "backlight": (f"{API_LED_CHANNEL}/{LED_CHANNEL_BACKLIGHT}", "brightness", 255),
+    "nixie_tubes": (API_NIXIE, "brightness", 100),
+    "fibonacci_theme": (API_FIBONACCI, "brightness", 255),
+    "matrx_screen": (API_SYSTEM_CONFIG, "screen_brightness", 255),
+}
+
+
+def evaluate(points: list[tuple[int, int]], seconds: float) -> float:
+    """Return the brightness (0-255) of a curve at a time of day.
+
+    Points are (second of day, brightness) sorted by time. Brightness is
+    interpolated linearly between neighbouring points, wrapping around
+    midnight from the last point to the first.
+    """
+    if len(points) == 1:
+        return points[0][1]
+    index = bisect_right([time for time, _ in points], seconds)
+    start_time, start = points[index - 1]
+    end_time, end = points[index % len(points)]
+    if index in (0, len(points)):
+        # Between the last point of one day and the first of the next
+        span = (end_time - start_time) % SECONDS_PER_DAY
+        elapsed = (seconds - start_time) % SECONDS_PER_DAY
+    else:
+        span = end_time - start_time
+        elapsed = seconds - start_time
+    return start + (end - start) * elapsed / span
+
+
+def quantize(brightness: float, maximum: int) -> int:
+    """Scale a 0-255 brightness to the native range of a light."""
+    return round(brightness * maximum / 255)
+
+
+def seconds_of_day(now: datetime) -> float:
+    """Return the local time of day in seconds."""
+    now = dt_util.as_local(now)
+    return now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6
+
+
+class BrightnessSchedules:
+    """Brightness curves per light, persisted in .storage.
+
+    Curves are evaluated by each clock's coordinator when it polls, so the
+    writes are spread over the fleet the way polls are. A value is only
+    handed to the desired-state engine when the quantized curve value
+    changes; a brightness set by hand stays until the curve moves on to
+    its next native step.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._curves: dict[str, dict[str, list[tuple[int, int]]]] | None = None
+        # Last quantized value handed out per device and light type
+        self._last: dict[tuple[str, str], int] = {}
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the stored curves once."""
+        async with self._load_lock:
+            if self._curves is None:
+                stored = await self._store.async_load() or {}
+                self._curves = {
+                    device_id: {
+                        light_type: [tuple(point) for point in points]
+                        for light_type, points in curves.items()
+                    }
+                    for device_id, curves in stored.get("devices", {}).items()
+                }
+
+    @callback
+    def curves(self, device_id: str) -> dict[str, list[tuple[int, int]]]:
+        """Return the curves of a device's lights."""
+        return (self._curves or {}).get(device_id, {})
+
+    @callback
+    def async_set(self, device_id: str, light_type: str, points: list[tuple[int, int]]) -> None:
+        """Set the curve of a light, replacing any previous one."""
+        assert self._curves is not None
+        self._curves.setdefault(device_id, {})[light_type] = sorted(points)
+        self._last.pop((device_id, light_type), None)
+        self._store.async_delay_save(self._data_to_save, 1)
+
+    @callback
+    def async_clear(self, device_id: str, light_type: str | None = None) -> bool:
+        """Remove the curve of a light, or of every light of a device."""
+        curves = (self._curves or {}).get(device_id)
+        if not curves:
+            return False
+        if light_type is None:
+            del self._curves[device_id]
+        elif curves.pop(light_type, None) is None:
+            return False
+        elif not curves:
+            del self._curves[device_id]
+        for key in [key for key in self._last if key[0] == device_id]:
+            if light_type in (None, key[1]):
+                self._last.pop(key)
+        self._store.async_delay_save(self._data_to_save, 1)
+        return True
+
+    @callback
+    def async_apply(
+        self, coordinator: KoiosClockDataUpdateCoordinator, now: datetime | None = None
+    ) -> bool:
+        """Record the scheduled brightness of a clock's lights as desired state.
+
+        Returns True if any value changed since the last evaluation.
+        """
+        if not (curves := self.curves(coordinator.device_id)):
+            return False
+        seconds = seconds_of_day(now or dt_util.now())
+        changed = False
+        for light_type, points in curves.items():
+            endpoint, field, maximum = SCHEDULE_TARGETS[light_type]
+            value = quantize(evaluate(points, seconds), maximum)
+            key = (coordinator.device_id, light_type)
+            if self._last.get(key) == value:
+                continue
+            self._last[key] = value
+            # Only written if the clock doesn't already show this value
+            coordinator.desired.set(endpoint, {field: value})
+            changed = True
+        return changed
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the stored representation."""
+        return {
+            "devices": {
+                device_id: {
+                    light_type: [list(point) for point in points]
+                    for light_type, points in curves.items()
+                }
+                for device_id, curves in (self._curves or {}).items()
+            }
+        }
+
+
+@callback
+def async_get_schedules(hass: HomeAssistant) -> BrightnessSchedules:
+    """Return the brightness schedules shared by every clock."""
+    if (schedules := hass.data.get(DATA_SCHEDULES)) is None:
+        schedules = hass.data[DATA_SCHEDULES] = BrightnessSchedules(hass)
+    return schedules
@@ -6,19 +6,25 @@ from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     API_FIBONACCI,
+    API_SYSTEM_CONFIG,
     DOMAIN,
     MODEL_FIBONACCI,
+    MODEL_MATRX,
     MODEL_NIXIE,
     MODEL_WORDCLOCK,
     MODEL_TRANQUIL,
 )
 from .coordinator import KoiosClockDataUpdateCoordinator
+from .device import get_device_info
+from .entity import KoiosClockEntity
+from .zonedb import async_get_zonedb, firmware_version
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,11 +44,15 @@ async def async_setup_entry(
     if coordinator.model == MODEL_FIBONACCI:
         entities.append(KoiosClockFibonacciThemeSelect(coordinator))
 
+    # MATRX devices have no timezone settings
+    if coordinator.model != MODEL_MATRX:
+        entities.append(KoiosClockTimezoneSelect(coordinator))
+
     if entities:
         async_add_entities(entities, True)
 
 
-class KoiosClockSelectEntity(CoordinatorEntity, SelectEntity):
+class KoiosClockSelectEntity(KoiosClockEntity, SelectEntity):
     """Base class for Koios Clock select entities."""
 
     def __init__(
@@ -55,21 +65,19 @@ class KoiosClockSelectEntity(CoordinatorEntity, SelectEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.select_type = select_type
-        self._attr_unique_id = f"{coordinator.host}_{coordinator.port}_{select_type}"
+        self._attr_unique_id = f"{coordinator.device_id}_{select_type}"
         self._attr_name = f"Koios Clock {name}"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"{coordinator.host}_{coordinator.port}")},
-            "name": f"Koios Clock ({coordinator.host})",
-            "manufacturer": "Koios Digital",
-            "model": coordinator.model.title(),
-            "sw_version": coordinator.data.get("about", {}).get("version"),
-        }
+        self._attr_device_info = get_device_info(
+            coordinator, coordinator.host, coordinator.port, coordinator.model
+        )
 
 # LED effect select entity removed - effects are now handled by light entities
 
 class KoiosClockFibonacciThemeSelect(KoiosClockSelectEntity):
     """Select entity for Fibonacci themes."""
 
+    _section = "fibonacci"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the Fibonacci theme select."""
         super().__init__(coordinator, "fibonacci_theme", "Fibonacci Theme")
@@ -101,10 +109,77 @@ class KoiosClockFibonacciThemeSelect(KoiosClockSelectEntity):
             0
         )
         data = {"theme_id": theme_id}
-        response = await self.coordinator.async_post_data(API_FIBONACCI, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["fibonacci"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_FIBONACCI, data)
+
+
+class KoiosClockTimezoneSelect(KoiosClockSelectEntity):
+    """Select entity for the clock's timezone.
+
+    Options come from the timezone database of the clock's firmware, which
+    is downloaded once per firmware version and shared by every clock.
+    """
+
+    _section = "system_config"
+
+    def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
+        """Initialize the timezone select."""
+        super().__init__(coordinator, "timezone", "Timezone")
+        self._attr_icon = "mdi:map-clock"
+        self._attr_entity_category = EntityCategory.CONFIG
+        self._zonedb = async_get_zonedb(coordinator.hass)
+        self._loading = False
+
+    async def async_added_to_hass(self) -> None:
+        """Load the timezone list when added."""
+        await super().async_added_to_hass()
+        self._async_load_zones()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data, a firmware update brings a new list."""
+        if self._zonedb.zones(firmware_version(self.coordinator)) is None:
+            self._async_load_zones()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_load_zones(self) -> None:
+        """Load the timezone list in the background."""
+        if self._loading:
+            return
+        self._loading = True
+        self.hass.async_create_background_task(
+            self._async_fetch_zones(), f"{self.coordinator.base_url} zonedb"
+        )
+
+    async def _async_fetch_zones(self) -> None:
+        """Fetch the timezone list and refresh the options."""
+        try:
+            if await self._zonedb.async_get(self.coordinator) is not None:
+                self.async_write_ha_state()
+        finally:
+            self._loading = False
+
+    @property
+    def options(self) -> list[str]:
+        """Return the timezones known to the clock's firmware."""
+        names = self._zonedb.names(firmware_version(self.coordinator))
+        current = self.current_option
+        if names is None:
+            # Not loaded yet, offer what the clock is set to
+            return [current] if current else []
+        if current and current not in self._zonedb.zones(firmware_version(self.coordinator)):
+            return [current, *names]
+        return names
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the current timezone."""
+        return self.coordinator.data.get("system_config", {}).get("timezone")
+
+    async def async_select_option(self, option: str) -> None:
+        """Set the timezone, which turns automatic detection off."""
+        zones = self._zonedb.zones(firmware_version(self.coordinator))
+        if zones is not None and option not in zones:
+            raise HomeAssistantError(f"Unknown timezone {option}")
+        data = {"timezone": option, "auto_timezone": False}
+        await self.coordinator.async_set_desired(API_SYSTEM_CONFIG, data)
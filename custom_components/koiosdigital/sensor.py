@@ -0,0 +1,181 @@
+"""Sensor platform for Koios Digital Clock integration."""
+from __future__ import annotations
+
+import logging
+import time
+from abc import abstractmethod
+from datetime import datetime, timedelta
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, PERFORMANCE_SENSOR_INTERVAL
+from .coordinator import KoiosClockDataUpdateCoordinator
+from .device import get_device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Koios Clock sensors based on a config entry."""
+    coordinator: KoiosClockDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    # Performance sensors are disabled by default, they only start sampling
+    # once enabled and added to Home Assistant
+    async_add_entities([
+        KoiosClockPollRttSensor(coordinator),
+        KoiosClockRefreshDurationSensor(coordinator),
+        KoiosClockConsecutiveFailuresSensor(coordinator),
+        KoiosClockWriteLatencySensor(coordinator),
+        KoiosClockRequestRateSensor(coordinator),
+    ])
+
+
+class KoiosClockPerformanceSensor(SensorEntity):
+    """Base class for Koios Clock performance sensors.
+
+    These don't listen to the coordinator, which only notifies on changed
+    data. They sample its counters on a fixed interval instead so a busy
+    clock never writes state more often than that.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_should_poll = False
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: KoiosClockDataUpdateCoordinator,
+        sensor_type: str,
+        name: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self.coordinator = coordinator
+        self.sensor_type = sensor_type
+        self._attr_unique_id = f"{coordinator.device_id}_{sensor_type}"
+        self._attr_name = f"Koios Clock {name}"
+        self._attr_device_info = get_device_info(
+            coordinator, coordinator.host, coordinator.port, coordinator.model
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Start sampling."""
+        self._sample()
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_write_sample,
+                timedelta(seconds=PERFORMANCE_SENSOR_INTERVAL),
+                name=f"{DOMAIN} {self.sensor_type} sensor",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @abstractmethod
+    @callback
+    def _sample(self) -> None:
+        """Read the current value from the coordinator."""
+
+    @callback
+    def _async_write_sample(self, _now: datetime) -> None:
+        """Write a new sample if the value changed."""
+        previous = self._attr_native_value
+        self._sample()
+        if self._attr_native_value != previous:
+            self.async_write_ha_state()
+
+
+class KoiosClockPollRttSensor(KoiosClockPerformanceSensor):
+    """Average request round-trip time of the last poll."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
+        """Initialize the poll round-trip time sensor."""
+        super().__init__(coordinator, "poll_rtt", "Poll Round-Trip Time")
+        self._attr_icon = "mdi:timer-outline"
+
+    @callback
+    def _sample(self) -> None:
+        """Read the current value from the coordinator."""
+        self._attr_native_value = self.coordinator.poll_rtt_ms
+
+
+class KoiosClockRefreshDurationSensor(KoiosClockPerformanceSensor):
+    """Duration of the last coordinator refresh."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
+        """Initialize the refresh duration sensor."""
+        super().__init__(coordinator, "refresh_duration", "Last Refresh Duration")
+        self._attr_icon = "mdi:timer-sync-outline"
+
+    @callback
+    def _sample(self) -> None:
+        """Read the current value from the coordinator."""
+        self._attr_native_value = self.coordinator.last_refresh_ms
+
+
+class KoiosClockConsecutiveFailuresSensor(KoiosClockPerformanceSensor):
+    """Number of polls in a row in which the clock answered no request."""
+
+    def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
+        """Initialize the consecutive failures sensor."""
+        super().__init__(coordinator, "consecutive_failures", "Consecutive Failures")
+        self._attr_icon = "mdi:alert-circle-outline"
+
+    @callback
+    def _sample(self) -> None:
+        """Read the current value from the coordinator."""
+        self._attr_native_value = self.coordinator.consecutive_failures
+
+
+class KoiosClockWriteLatencySensor(KoiosClockPerformanceSensor):
+    """Latency of the last write to the clock."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
+        """Initialize the write latency sensor."""
+        super().__init__(coordinator, "write_latency", "Write Latency")
+        self._attr_icon = "mdi:upload-network-outline"
+
+    @callback
+    def _sample(self) -> None:
+        """Read the current value from the coordinator."""
+        self._attr_native_value = self.coordinator.stats.last_write_ms
+
+
+class KoiosClockRequestRateSensor(KoiosClockPerformanceSensor):
+    """Requests sent to the clock per minute."""
+
+    _attr_native_unit_of_measurement = "requests/min"
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
+        """Initialize the request rate sensor."""
+        super().__init__(coordinator, "request_rate", "Requests Per Minute")
+        self._attr_icon = "mdi:swap-vertical"
+        self._last_count = 0
+        self._last_time = 0.0
+
+    @callback
+    def _sample(self) -> None:
+        """Compute the rate since the previous sample."""
+        count, now = self.coordinator.stats.requests, time.monotonic()
+        if self._last_time:
+            self._attr_native_value = round((count - self._last_count) * 60 / (now - self._last_time), 1)
+        self._last_count, self._last_time = count, now
@@ -1,21 +1,43 @@
 """Services for Koios Digital Clock integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import config_validation as cv
-
-from .const import DOMAIN, API_LED_CHANNEL, API_NIXIE, API_FIBONACCI, LED_CHANNEL_BACKLIGHT
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, Unauthorized, UnknownUser
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .const import (
+    DOMAIN,
+    API_LED_CHANNEL,
+    API_NIXIE,
+    API_FIBONACCI,
+    LED_CHANNEL_BACKLIGHT,
+    PROFILE_MAX_SECONDS,
+    ROLLOUT_CONCURRENCY,
+    ROLLOUT_RETRIES,
+)
 from .coordinator import KoiosClockDataUpdateCoordinator
+from .schedule import SCHEDULE_TARGETS, async_get_schedules
+from .watchdog import async_get_watchdog
 
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_SET_LED_EFFECT = "set_led_effect"
 SERVICE_SET_FIBONACCI_THEME = "set_fibonacci_theme"
 SERVICE_SET_NIXIE_CONFIG = "set_nixie_config"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+SERVICE_PROFILE = "profile"
+SERVICE_SET_SYSTEM_CONFIG = "set_system_config"
+SERVICE_SET_BRIGHTNESS_SCHEDULE = "set_brightness_schedule"
+SERVICE_CLEAR_BRIGHTNESS_SCHEDULE = "clear_brightness_schedule"
+
+# Fields of set_system_config that are written to the clocks
+SYSTEM_CONFIG_FIELDS = ("auto_timezone", "timezone", "ntp_server", "wifi_hostname")
 
 SET_LED_EFFECT_SCHEMA = vol.Schema(
     {
@@ -26,6 +48,7 @@ SET_LED_EFFECT_SCHEMA = vol.Schema(
             vol.ExactSequence([vol.Coerce(int), vol.Coerce(int), vol.Coerce(int)]),
             [vol.Range(min=0, max=255), vol.Range(min=0, max=255), vol.Range(min=0, max=255)],
         ),
+        vol.Optional("broadcast", default=False): cv.boolean,
     }
 )
 
@@ -47,30 +70,102 @@ SET_NIXIE_CONFIG_SCHEMA = vol.Schema(
     }
 )
 
+SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        vol.Optional("name", default="default"): cv.string,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("seconds", default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=PROFILE_MAX_SECONDS)
+        ),
+        vol.Optional("polls"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("top", default=20): vol.All(vol.Coerce(int), vol.Range(min=1, max=200)),
+    }
+)
+
+SET_SYSTEM_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional("entity_id"): cv.entity_ids,
+        vol.Optional("auto_timezone"): cv.boolean,
+        vol.Optional("timezone"): cv.string,
+        vol.Optional("ntp_server"): cv.string,
+        vol.Optional("wifi_hostname"): cv.string,
+        vol.Optional("concurrency", default=ROLLOUT_CONCURRENCY): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=256)
+        ),
+        vol.Optional("retries", default=ROLLOUT_RETRIES): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=10)
+        ),
+    }
+)
+
+
+def _unique_times(points: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Reject schedules with two points at the same time."""
+    if len({point["time"] for point in points}) != len(points):
+        raise vol.Invalid("Every point of a schedule needs its own time")
+    return points
+
+
+SET_BRIGHTNESS_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+        vol.Required("points"): vol.All(
+            cv.ensure_list,
+            vol.Length(min=1),
+            [
+                vol.Schema(
+                    {
+                        vol.Required("time"): cv.time,
+                        vol.Required("brightness"): vol.All(
+                            vol.Coerce(int), vol.Range(min=0, max=255)
+                        ),
+                    }
+                )
+            ],
+            _unique_times,
+        ),
+    }
+)
+
+CLEAR_BRIGHTNESS_SCHEDULE_SCHEMA = vol.Schema(
+    {
+        vol.Required("entity_id"): cv.entity_ids,
+    }
+)
+
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Koios Clock integration."""
+    watchdog = async_get_watchdog(hass)
 
-    async def set_led_effect(call: ServiceCall) -> None:
+    async def set_led_effect(call: ServiceCall) -> ServiceResponse:
         """Service to set LED effect with optional parameters."""
         entity_ids = call.data["entity_id"]
         effect = call.data["effect"]
         brightness = call.data.get("brightness")
         color = call.data.get("color")
 
+        targets = []
         for entity_id in entity_ids:
             # Get coordinator from entity
             coordinator = _get_coordinator_from_entity_id(hass, entity_id)
-            if not coordinator:
+            if not coordinator or any(target[0] is coordinator for target in targets):
                 continue
 
             # Find the effect ID for the effect name using API data or fallback
             led_effects_data = coordinator.data.get("led_effects", [])
             effect_id = "SOLID"  # Default fallback
             
-            # Try to find from API effects first
+            # Try to find from API effects first, by name or ID in any case
             for api_effect in led_effects_data:
-                if api_effect.get("name") == effect:
+                if effect.lower() in (
+                    str(api_effect.get("name", "")).lower(),
+                    str(api_effect.get("id", "")).lower(),
+                ):
                     effect_id = api_effect.get("id", "SOLID")
                     break
 
@@ -83,13 +178,24 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     data["color"]["w"] = color[3]
 
             endpoint = f"{API_LED_CHANNEL}/{LED_CHANNEL_BACKLIGHT}"
-            response = await coordinator.async_post_data(endpoint, data)
-            
-            if response:
-                # Update the coordinator data with the response
-                led_channels = coordinator.data.setdefault("led_channels", {})
-                led_channels[LED_CHANNEL_BACKLIGHT] = response
-                coordinator.async_set_updated_data(coordinator.data)
+            if endpoint not in coordinator.writable_endpoints:
+                # Checked up front so no clock is written if any target is wrong
+                raise HomeAssistantError(f"{entity_id} is not on a clock with an LED backlight")
+            targets.append((coordinator, endpoint, data))
+
+        if call.data["broadcast"]:
+            from .broadcast import async_broadcast  # pylint: disable=import-outside-toplevel
+
+            # Release every write at the same instant so effects start in sync
+            return await async_broadcast(targets)
+
+        devices = {}
+        for coordinator, endpoint, data in targets:
+            # False means the write stays pending until the clock answers
+            devices[coordinator.base_url] = {
+                "ok": await coordinator.async_set_desired(endpoint, data)
+            }
+        return {"devices": devices}
 
     async def set_fibonacci_theme(call: ServiceCall) -> None:
         """Service to set Fibonacci theme."""
@@ -114,12 +220,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             if brightness is not None:
                 data["brightness"] = brightness
 
-            response = await coordinator.async_post_data(API_FIBONACCI, data)
-            
-            if response:
-                # Update the coordinator data with the response
-                coordinator.data["fibonacci"] = response
-                coordinator.async_set_updated_data(coordinator.data)
+            await coordinator.async_set_desired(API_FIBONACCI, data)
 
     async def set_nixie_config(call: ServiceCall) -> None:
         """Service to set Nixie configuration."""
@@ -140,50 +241,209 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 data["on"] = call.data["enabled"]
 
             if data:
-                response = await coordinator.async_post_data(API_NIXIE, data)
-                
-                if response:
-                    # Update the coordinator data with the response
-                    coordinator.data["nixie"] = response
-                    coordinator.async_set_updated_data(coordinator.data)
+                await coordinator.async_set_desired(API_NIXIE, data)
+
+    async def snapshot(call: ServiceCall) -> ServiceResponse:
+        """Service to capture the state of every device."""
+        from .snapshot import async_get_snapshot_store  # pylint: disable=import-outside-toplevel
+
+        store = async_get_snapshot_store(hass)
+        return await store.async_capture(call.data["name"], _get_coordinators(hass))
+
+    async def restore(call: ServiceCall) -> ServiceResponse:
+        """Service to put every device back to a captured state."""
+        from .snapshot import async_get_snapshot_store  # pylint: disable=import-outside-toplevel
+
+        store = async_get_snapshot_store(hass)
+        try:
+            report = await store.async_restore(call.data["name"], _get_coordinators(hass))
+        except KeyError as err:
+            raise HomeAssistantError(f"No snapshot named {call.data['name']}") from err
+        _LOGGER.debug("Restored snapshot %s: %s", call.data["name"], report)
+        return report
+
+    async def profile(call: ServiceCall) -> ServiceResponse:
+        """Service to profile the integration for a bounded time."""
+        # Same check as admin services, which can't return a response
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+
+        # cProfile and pstats are only imported for an actual run
+        from .profiler import async_profile  # pylint: disable=import-outside-toplevel
+
+        return await async_profile(
+            hass,
+            list(_get_coordinators(hass).values()),
+            call.data["seconds"],
+            call.data.get("polls"),
+            call.data["top"],
+        )
+
+    async def set_system_config(call: ServiceCall) -> ServiceResponse:
+        """Service to roll a partial system config out to many devices."""
+        if "entity_id" in call.data:
+            coordinators = []
+            for entity_id in call.data["entity_id"]:
+                coordinator = _get_coordinator_from_entity_id(hass, entity_id)
+                if coordinator and coordinator not in coordinators:
+                    coordinators.append(coordinator)
+        else:
+            coordinators = list(_get_coordinators(hass).values())
+
+        from .rollout import async_rollout_system_config  # pylint: disable=import-outside-toplevel
+
+        return await async_rollout_system_config(
+            hass,
+            coordinators,
+            {key: call.data[key] for key in SYSTEM_CONFIG_FIELDS if key in call.data},
+            call.data["concurrency"],
+            call.data["retries"],
+        )
+
+    def _schedule_targets(call: ServiceCall) -> list[tuple[KoiosClockDataUpdateCoordinator, str]]:
+        """Return the coordinator and light type of every light in a call."""
+        targets = []
+        for entity_id in call.data["entity_id"]:
+            coordinator = _get_coordinator_from_entity_id(hass, entity_id)
+            entity_entry = er.async_get(hass).async_get(entity_id)
+            if coordinator is None or entity_entry is None or entity_entry.domain != "light":
+                raise HomeAssistantError(f"{entity_id} is not a Koios Clock light")
+            light_type = entity_entry.unique_id.removeprefix(f"{coordinator.device_id}_")
+            if light_type not in SCHEDULE_TARGETS:
+                raise HomeAssistantError(f"{entity_id} has no schedulable brightness")
+            targets.append((coordinator, light_type))
+        return targets
+
+    async def set_brightness_schedule(call: ServiceCall) -> None:
+        """Service to run lights on a daily brightness curve."""
+        points = [
+            (
+                point["time"].hour * 3600 + point["time"].minute * 60 + point["time"].second,
+                point["brightness"],
+            )
+            for point in call.data["points"]
+        ]
+        schedules = async_get_schedules(hass)
+        coordinators = []
+        for coordinator, light_type in _schedule_targets(call):
+            schedules.async_set(coordinator.device_id, light_type, points)
+            if coordinator not in coordinators:
+                coordinators.append(coordinator)
+        # Write the current curve values right away instead of at the next
+        # poll, only the changed fields and every clock at once
+        for coordinator in coordinators:
+            schedules.async_apply(coordinator)
+        await asyncio.gather(*(coordinator.async_reconcile() for coordinator in coordinators))
+
+    async def clear_brightness_schedule(call: ServiceCall) -> None:
+        """Service to stop the brightness curve of lights."""
+        schedules = async_get_schedules(hass)
+        for coordinator, light_type in _schedule_targets(call):
+            schedules.async_clear(coordinator.device_id, light_type)
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_LED_EFFECT,
-        set_led_effect,
+        watchdog.wrap_service(SERVICE_SET_LED_EFFECT, set_led_effect),
         schema=SET_LED_EFFECT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_FIBONACCI_THEME,
-        set_fibonacci_theme,
+        watchdog.wrap_service(SERVICE_SET_FIBONACCI_THEME, set_fibonacci_theme),
         schema=SET_FIBONACCI_THEME_SCHEMA,
     )
 
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_NIXIE_CONFIG,
-        set_nixie_config,
+        watchdog.wrap_service(SERVICE_SET_NIXIE_CONFIG, set_nixie_config),
         schema=SET_NIXIE_CONFIG_SCHEMA,
     )
 
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        watchdog.wrap_service(SERVICE_SNAPSHOT, snapshot),
+        schema=SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        watchdog.wrap_service(SERVICE_RESTORE, restore),
+        schema=SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        watchdog.wrap_service(SERVICE_PROFILE, profile),
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_SYSTEM_CONFIG,
+        watchdog.wrap_service(SERVICE_SET_SYSTEM_CONFIG, set_system_config),
+        schema=SET_SYSTEM_CONFIG_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_BRIGHTNESS_SCHEDULE,
+        watchdog.wrap_service(SERVICE_SET_BRIGHTNESS_SCHEDULE, set_brightness_schedule),
+        schema=SET_BRIGHTNESS_SCHEDULE_SCHEMA,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CLEAR_BRIGHTNESS_SCHEDULE,
+        watchdog.wrap_service(SERVICE_CLEAR_BRIGHTNESS_SCHEDULE, clear_brightness_schedule),
+        schema=CLEAR_BRIGHTNESS_SCHEDULE_SCHEMA,
+    )
+
     _LOGGER.info("Koios Clock services registered")
 
 
 def _get_coordinator_from_entity_id(hass: HomeAssistant, entity_id: str) -> KoiosClockDataUpdateCoordinator | None:
     """Get coordinator from entity ID."""
-    # This is a simplified approach - in a real implementation you'd need to
-    # properly map entity IDs to coordinators
-    domain_data = hass.data.get(DOMAIN, {})
-    for coordinator in domain_data.values():
-        if isinstance(coordinator, KoiosClockDataUpdateCoordinator):
-            return coordinator
+    entity_entry = er.async_get(hass).async_get(entity_id)
+    if entity_entry is None or entity_entry.config_entry_id is None:
+        return None
+    coordinator = hass.data.get(DOMAIN, {}).get(entity_entry.config_entry_id)
+    if isinstance(coordinator, KoiosClockDataUpdateCoordinator):
+        return coordinator
     return None
 
 
+def _get_coordinators(hass: HomeAssistant) -> dict[str, KoiosClockDataUpdateCoordinator]:
+    """Get every loaded coordinator keyed by config entry ID."""
+    return {
+        entry_id: coordinator
+        for entry_id, coordinator in hass.data.get(DOMAIN, {}).items()
+        if isinstance(coordinator, KoiosClockDataUpdateCoordinator)
+    }
+
+
 async def async_unload_services(hass: HomeAssistant) -> None:
     """Unload Koios Clock services."""
     hass.services.async_remove(DOMAIN, SERVICE_SET_LED_EFFECT)
     hass.services.async_remove(DOMAIN, SERVICE_SET_FIBONACCI_THEME)
     hass.services.async_remove(DOMAIN, SERVICE_SET_NIXIE_CONFIG)
+    hass.services.async_remove(DOMAIN, SERVICE_SNAPSHOT)
+    hass.services.async_remove(DOMAIN, SERVICE_RESTORE)
+    hass.services.async_remove(DOMAIN, SERVICE_PROFILE)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_SYSTEM_CONFIG)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_BRIGHTNESS_SCHEDULE)
+    hass.services.async_remove(DOMAIN, SERVICE_CLEAR_BRIGHTNESS_SCHEDULE)
@@ -0,0 +1,150 @@
+"""Fleet snapshots for Koios Digital Clock."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    API_FIBONACCI,
+    API_LED_CHANNEL,
+    API_NIXIE,
+    API_SYSTEM_CONFIG,
+    DATA_SNAPSHOTS,
+    DOMAIN,
+)
+from .coordinator import KoiosClockDataUpdateCoordinator
+from .reconcile import diff_state
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.snapshots"
+STORAGE_VERSION = 1
+
+# Writable fields captured for each endpoint, read-only state is left out
+SNAPSHOT_FIELDS = {
+    API_LED_CHANNEL: ("on", "brightness", "color", "effect_id", "speed"),
+    API_NIXIE: ("on", "brightness", "military_time", "blinking_dots"),
+    API_FIBONACCI: ("on", "brightness", "theme_id"),
+    API_SYSTEM_CONFIG: (
+        "screen_enabled",
+        "screen_brightness",
+        "auto_brightness_enabled",
+        "auto_timezone",
+        "timezone",
+    ),
+}
+
+
+def _snapshot_fields(endpoint: str) -> tuple[str, ...]:
+    """Return the captured fields for an endpoint."""
+    if endpoint.startswith(f"{API_LED_CHANNEL}/"):
+        return SNAPSHOT_FIELDS[API_LED_CHANNEL]
+    return SNAPSHOT_FIELDS.get(endpoint, ())
+
+
+def capture_device(coordinator: KoiosClockDataUpdateCoordinator) -> dict[str, dict[str, Any]]:
+    """Capture the writable state of one device."""
+    state = {}
+    for endpoint in coordinator.writable_endpoints:
+        observed = coordinator.observed(endpoint)
+        fields = {
+            key: observed[key] for key in _snapshot_fields(endpoint) if key in observed
+        }
+        if fields:
+            state[endpoint] = fields
+    return state
+
+
+class SnapshotStore:
+    """Named fleet snapshots persisted in .storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._snapshots: dict[str, Any] | None = None
+
+    async def _async_load(self) -> dict[str, Any]:
+        """Load the stored snapshots once."""
+        if self._snapshots is None:
+            self._snapshots = await self._store.async_load() or {}
+        return self._snapshots
+
+    async def async_capture(
+        self, name: str, coordinators: dict[str, KoiosClockDataUpdateCoordinator]
+    ) -> dict[str, Any]:
+        """Capture every device into a named snapshot."""
+        snapshots = await self._async_load()
+        await asyncio.gather(
+            *(
+                coordinator.async_refresh_observed(*coordinator.writable_endpoints)
+                for coordinator in coordinators.values()
+            )
+        )
+        devices = {
+            entry_id: state
+            for entry_id, coordinator in coordinators.items()
+            if (state := capture_device(coordinator))
+        }
+        snapshots[name] = {"created": dt_util.utcnow().isoformat(), "devices": devices}
+        await self._store.async_save(snapshots)
+        _LOGGER.debug("Captured snapshot %s with %s devices", name, len(devices))
+        return {"name": name, "devices": len(devices)}
+
+    async def async_restore(
+        self, name: str, coordinators: dict[str, KoiosClockDataUpdateCoordinator]
+    ) -> dict[str, Any]:
+        """Apply a named snapshot, writing only what differs on each device."""
+        snapshots = await self._async_load()
+        if name not in snapshots:
+            raise KeyError(name)
+
+        devices = snapshots[name]["devices"]
+        entry_ids = [entry_id for entry_id in devices if entry_id in coordinators]
+        results = await asyncio.gather(
+            *(
+                _async_restore_device(coordinators[entry_id], devices[entry_id])
+                for entry_id in entry_ids
+            )
+        )
+        report = dict(zip(entry_ids, results))
+        for entry_id in devices:
+            report.setdefault(entry_id, {"status": "missing"})
+        return {"name": name, "devices": report}
+
+
+@callback
+def async_get_snapshot_store(hass: HomeAssistant) -> SnapshotStore:
+    """Return the snapshot store shared by every clock."""
+    if (store := hass.data.get(DATA_SNAPSHOTS)) is None:
+        store = hass.data[DATA_SNAPSHOTS] = SnapshotStore(hass)
+    return store
+
+
+async def _async_restore_device(
+    coordinator: KoiosClockDataUpdateCoordinator, state: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    """Restore one device and time it."""
+    start = time.monotonic()
+    changed = []
+    ok = True
+    for endpoint, fields in state.items():
+        if endpoint == API_SYSTEM_CONFIG and fields.get("auto_brightness_enabled"):
+            # The light sensor switches the screen while auto brightness is on
+            fields = {key: value for key, value in fields.items() if key != "screen_enabled"}
+        await coordinator.async_refresh_observed(endpoint)
+        if not (changes := diff_state(fields, coordinator.observed(endpoint))):
+            continue
+        changed.append(endpoint)
+        if not await coordinator.async_set_desired(endpoint, changes):
+            ok = False
+    return {
+        "status": "ok" if ok else "pending",
+        "changed": changed,
+        "duration_ms": round((time.monotonic() - start) * 1000, 1),
+    }
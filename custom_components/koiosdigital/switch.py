@@ -6,9 +6,9 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     API_NIXIE,
@@ -20,6 +20,7 @@ from .const import (
 )
 from .coordinator import KoiosClockDataUpdateCoordinator
 from .device import get_device_info
+from .entity import KoiosClockEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,12 +45,14 @@ async def async_setup_entry(
     # MATRX-specific switches
     if coordinator.model == MODEL_MATRX:
         entities.append(KoiosClockAutoBrightnessSwitch(coordinator))
+    else:
+        entities.append(KoiosClockAutoTimezoneSwitch(coordinator))
 
     if entities:
         async_add_entities(entities, True)
 
 
-class KoiosClockSwitchEntity(CoordinatorEntity, SwitchEntity):
+class KoiosClockSwitchEntity(KoiosClockEntity, SwitchEntity):
     """Base class for Koios Clock switch entities."""
 
     def __init__(
@@ -62,7 +65,7 @@ class KoiosClockSwitchEntity(CoordinatorEntity, SwitchEntity):
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.switch_type = switch_type
-        self._attr_unique_id = f"{coordinator.host}_{coordinator.port}_{switch_type}"
+        self._attr_unique_id = f"{coordinator.device_id}_{switch_type}"
         self._attr_name = f"Koios Clock {name}"
         self._attr_device_info = get_device_info(
             coordinator, coordinator.host, coordinator.port, coordinator.model
@@ -72,6 +75,8 @@ class KoiosClockSwitchEntity(CoordinatorEntity, SwitchEntity):
 class KoiosClockMilitaryTimeSwitch(KoiosClockSwitchEntity):
     """Switch to control military time format."""
 
+    _section = "nixie"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the military time switch."""
         super().__init__(coordinator, "military_time", "Military Time")
@@ -86,29 +91,19 @@ class KoiosClockMilitaryTimeSwitch(KoiosClockSwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on military time."""
         data = {"military_time": True}
-        response = await self.coordinator.async_post_data(API_NIXIE, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["nixie"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_NIXIE, data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off military time."""
         data = {"military_time": False}
-        response = await self.coordinator.async_post_data(API_NIXIE, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["nixie"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_NIXIE, data)
 
 
 class KoiosClockBlinkingDotsSwitch(KoiosClockSwitchEntity):
     """Switch to control blinking dots."""
 
+    _section = "nixie"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the blinking dots switch."""
         super().__init__(coordinator, "blinking_dots", "Blinking Dots")
@@ -123,29 +118,19 @@ class KoiosClockBlinkingDotsSwitch(KoiosClockSwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on blinking dots."""
         data = {"blinking_dots": True}
-        response = await self.coordinator.async_post_data(API_NIXIE, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["nixie"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_NIXIE, data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off blinking dots."""
         data = {"blinking_dots": False}
-        response = await self.coordinator.async_post_data(API_NIXIE, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["nixie"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_NIXIE, data)
 
 
 class KoiosClockAutoBrightnessSwitch(KoiosClockSwitchEntity):
     """Switch to control auto brightness for MATRX devices."""
 
+    _section = "system_config"
+
     def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
         """Initialize the auto brightness switch."""
         super().__init__(coordinator, "auto_brightness", "Auto Brightness")
@@ -160,21 +145,37 @@ class KoiosClockAutoBrightnessSwitch(KoiosClockSwitchEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on auto brightness."""
         data = {"auto_brightness_enabled": True}
-        response = await self.coordinator.async_post_data(API_SYSTEM_CONFIG, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["system_config"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_SYSTEM_CONFIG, data)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off auto brightness."""
         data = {"auto_brightness_enabled": False}
-        response = await self.coordinator.async_post_data(API_SYSTEM_CONFIG, data)
-        
-        if response:
-            # Update the coordinator data with the response
-            self.coordinator.data["system_config"] = response
-            # Trigger state update for all entities
-            self.coordinator.async_set_updated_data(self.coordinator.data)
+        await self.coordinator.async_set_desired(API_SYSTEM_CONFIG, data)
+
+
+class KoiosClockAutoTimezoneSwitch(KoiosClockSwitchEntity):
+    """Switch to let the clock detect its timezone."""
+
+    _section = "system_config"
+
+    def __init__(self, coordinator: KoiosClockDataUpdateCoordinator) -> None:
+        """Initialize the auto timezone switch."""
+        super().__init__(coordinator, "auto_timezone", "Auto Timezone")
+        self._attr_icon = "mdi:earth"
+        self._attr_entity_category = EntityCategory.CONFIG
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if the timezone is detected automatically."""
+        system_config = self.coordinator.data.get("system_config", {})
+        return system_config.get("auto_timezone", False)
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn on automatic timezone detection."""
+        data = {"auto_timezone": True}
+        await self.coordinator.async_set_desired(API_SYSTEM_CONFIG, data)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn off automatic timezone detection."""
+        data = {"auto_timezone": False}
+        await self.coordinator.async_set_desired(API_SYSTEM_CONFIG, data)
@@ -0,0 +1,88 @@
+"""Provide info to system health."""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import KoiosClockDataUpdateCoordinator
+from .instrumentation import histogram_percentile, new_histogram
+
+# Number of devices listed as slowest
+SLOWEST_DEVICES = 5
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+@callback
+def _device_health(coordinator: KoiosClockDataUpdateCoordinator) -> str:
+    """Classify a device as healthy, degraded or offline.
+
+    A clock that answered none of its last poll, or whose sections have all
+    failed or gone stale, is offline even if cached state is still shown.
+    """
+    unhealthy = [
+        status["failed"] or not status["available"]
+        for status in coordinator.section_status().values()
+    ]
+    if not coordinator.last_update_success or coordinator.consecutive_failures or all(unhealthy):
+        return "offline"
+    if coordinator.desired or any(unhealthy):
+        return "degraded"
+    return "healthy"
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page.
+
+    Everything is derived from counters the coordinators already keep,
+    no device is contacted.
+    """
+    coordinators = [
+        coordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+        if isinstance(coordinator, KoiosClockDataUpdateCoordinator)
+    ]
+
+    health: Counter[str] = Counter()
+    firmware: Counter[str] = Counter()
+    histogram = new_histogram()
+    request_rate = 0.0
+    for coordinator in coordinators:
+        health[_device_health(coordinator)] += 1
+        firmware[(coordinator.data or {}).get("about", {}).get("version") or "unknown"] += 1
+        histogram = [total + count for total, count in zip(histogram, coordinator.stats.get_histogram)]
+        request_rate += coordinator.stats.requests_per_minute()
+
+    slowest = sorted(
+        (coordinator for coordinator in coordinators if coordinator.poll_rtt_ms is not None),
+        key=lambda coordinator: coordinator.poll_rtt_ms,
+        reverse=True,
+    )[:SLOWEST_DEVICES]
+    p99 = histogram_percentile(histogram, 99)
+
+    return {
+        "devices": len(coordinators),
+        "healthy": health["healthy"],
+        "degraded": health["degraded"],
+        "offline": health["offline"],
+        "requests_per_minute": round(request_rate, 1),
+        "poll_latency_p99": "n/a" if p99 is None else f"<= {p99} ms",
+        "slowest_devices": ", ".join(
+            f"{coordinator.host} ({coordinator.poll_rtt_ms} ms)" for coordinator in slowest
+        )
+        or "n/a",
+        "firmware_versions": ", ".join(
+            f"{version}: {count}" for version, count in firmware.most_common()
+        )
+        or "n/a",
+    }
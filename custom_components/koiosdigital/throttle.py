@@ -0,0 +1,93 @@
+"""Fleet-wide throttling and backoff of Koios Digital Clock entry setup."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from .const import (
+    DATA_SETUP,
+    SETUP_CONCURRENCY,
+    SETUP_DEADLINE,
+    SETUP_PROBE_TIMEOUT,
+    SETUP_RETRY_MAX,
+    SETUP_RETRY_MIN,
+)
+from .coordinator import KoiosClockDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SetupThrottle:
+    """Run the first refresh of every entry through a shared limit.
+
+    After a restart all entries are set up at once. Only a few first
+    refreshes run at a time, an unreachable clock only holds its slot for
+    the probe timeout, and clocks that failed are not contacted again until
+    their backoff expires, however often Home Assistant retries them.
+    """
+
+    def __init__(self, concurrency: int = SETUP_CONCURRENCY) -> None:
+        """Initialize."""
+        self._slots = asyncio.Semaphore(concurrency)
+        self._failures: dict[str, int] = {}
+        self._next_attempt: dict[str, float] = {}
+
+    async def async_first_refresh(
+        self, entry_id: str, coordinator: KoiosClockDataUpdateCoordinator
+    ) -> None:
+        """Refresh a new coordinator or raise ConfigEntryNotReady."""
+        if (wait := self._next_attempt.get(entry_id, 0) - time.monotonic()) > 0:
+            raise ConfigEntryNotReady(
+                f"{coordinator.base_url} was unreachable, next attempt in {wait:.0f} s"
+            )
+
+        acquired = False
+        try:
+            async with asyncio.timeout(SETUP_DEADLINE):
+                async with self._slots:
+                    acquired = True
+                    if not await coordinator.async_probe(SETUP_PROBE_TIMEOUT):
+                        raise ConfigEntryNotReady(f"{coordinator.base_url} is not reachable")
+                    await coordinator.async_config_entry_first_refresh()
+        except asyncio.TimeoutError as err:
+            if not acquired:
+                # Other clocks held every slot, that says nothing about this one
+                raise ConfigEntryNotReady("Waiting for other clocks to finish setup") from err
+            self._failed(entry_id)
+            raise ConfigEntryNotReady(
+                f"{coordinator.base_url} did not finish setup within {SETUP_DEADLINE} s"
+            ) from err
+        except ConfigEntryNotReady:
+            self._failed(entry_id)
+            raise
+
+        self.async_clear(entry_id)
+
+    @callback
+    def async_clear(self, entry_id: str) -> None:
+        """Forget the backoff of an entry, its next setup contacts the clock."""
+        self._failures.pop(entry_id, None)
+        self._next_attempt.pop(entry_id, None)
+
+    @callback
+    def _failed(self, entry_id: str) -> None:
+        """Push back the next attempt of a clock that could not be set up."""
+        failures = self._failures[entry_id] = self._failures.get(entry_id, 0) + 1
+        delay = min(SETUP_RETRY_MAX, SETUP_RETRY_MIN * 2 ** (failures - 1))
+        # Spread the retries of clocks that went offline together
+        delay *= random.uniform(0.8, 1.2)
+        self._next_attempt[entry_id] = time.monotonic() + delay
+        _LOGGER.debug("Setup of entry %s failed %s times, backing off %.0f s", entry_id, failures, delay)
+
+
+@callback
+def async_get_setup_throttle(hass: HomeAssistant) -> SetupThrottle:
+    """Return the setup throttle shared by every entry."""
+    if (throttle := hass.data.get(DATA_SETUP)) is None:
+        throttle = hass.data[DATA_SETUP] = SetupThrottle()
+    return throttle
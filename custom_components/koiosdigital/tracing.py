@@ -0,0 +1,127 @@
+"""Opt-in request tracing for Koios Digital Clock."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from .const import TRACE_BUFFER_SIZE, TRACE_OUTLIER_MS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _elapsed_ms(start: float | None, end: float | None) -> float | None:
+    """Return the milliseconds between two monotonic timestamps."""
+    if start is None or end is None:
+        return None
+    return round((end - start) * 1000, 1)
+
+
+class RequestTracer:
+    """Record DNS, connect and time-to-first-byte of every request.
+
+    The trace config is attached to a session private to one config entry,
+    each request's phase timings land in a ring buffer of recent requests.
+    """
+
+    def __init__(self, name: str, size: int = TRACE_BUFFER_SIZE) -> None:
+        """Initialize."""
+        self.name = name
+        self.traces: deque[dict[str, Any]] = deque(maxlen=size)
+        self.outliers = 0
+
+        self.trace_config = aiohttp.TraceConfig()
+        self.trace_config.on_request_start.append(self._on_request_start)
+        self.trace_config.on_dns_resolvehost_start.append(self._on_dns_start)
+        self.trace_config.on_dns_resolvehost_end.append(self._on_dns_end)
+        self.trace_config.on_dns_cache_hit.append(self._on_dns_cache_hit)
+        self.trace_config.on_connection_create_start.append(self._on_connect_start)
+        self.trace_config.on_connection_create_end.append(self._on_connect_end)
+        self.trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+        self.trace_config.on_request_end.append(self._on_request_end)
+        self.trace_config.on_request_exception.append(self._on_request_exception)
+
+    async def _on_request_start(
+        self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceRequestStartParams
+    ) -> None:
+        ctx.start = time.monotonic()
+        ctx.dns_start = ctx.dns_end = ctx.connect_start = ctx.connect_end = None
+        ctx.reused = False
+        ctx.dns_cached = False
+
+    async def _on_dns_start(self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.dns_start = time.monotonic()
+
+    async def _on_dns_end(self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.dns_end = time.monotonic()
+
+    async def _on_dns_cache_hit(self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.dns_cached = True
+
+    async def _on_connect_start(self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.connect_start = time.monotonic()
+
+    async def _on_connect_end(self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.connect_end = time.monotonic()
+
+    async def _on_connection_reused(self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.reused = True
+
+    async def _on_request_end(
+        self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceRequestEndParams
+    ) -> None:
+        self._record(ctx, params.method, params.url, params.response.status, None)
+
+    async def _on_request_exception(
+        self, _session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceRequestExceptionParams
+    ) -> None:
+        self._record(ctx, params.method, params.url, None, repr(params.exception))
+
+    def _record(
+        self, ctx: SimpleNamespace, method: str, url: Any, status: int | None, error: str | None
+    ) -> None:
+        """Store the phase timings of a finished request."""
+        now = time.monotonic()
+        # The connection (new or reused) is ready once the connect phase ends,
+        # everything after that is the firmware producing the response headers
+        ready = ctx.connect_end or ctx.dns_end or ctx.start
+        trace = {
+            "time": time.time(),
+            "method": method,
+            "path": url.path,
+            "status": status,
+            "error": error,
+            "reused": ctx.reused,
+            "dns_cached": ctx.dns_cached,
+            "dns_ms": _elapsed_ms(ctx.dns_start, ctx.dns_end),
+            # DNS resolution happens inside connection setup, count it only once
+            "connect_ms": _elapsed_ms(ctx.dns_end or ctx.connect_start, ctx.connect_end),
+            "ttfb_ms": _elapsed_ms(ready, now) if status is not None else None,
+            "total_ms": _elapsed_ms(ctx.start, now),
+        }
+        self.traces.append(trace)
+        if trace["total_ms"] >= TRACE_OUTLIER_MS:
+            self.outliers += 1
+            _LOGGER.debug(
+                "Slow request %s %s on %s: dns %s ms, connect %s ms, ttfb %s ms, total %s ms",
+                method,
+                url.path,
+                self.name,
+                trace["dns_ms"],
+                trace["connect_ms"],
+                trace["ttfb_ms"],
+                trace["total_ms"],
+            )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the buffered traces for diagnostics."""
+        return {
+            "buffer_size": self.traces.maxlen,
+            "outlier_threshold_ms": TRACE_OUTLIER_MS,
+            "outliers": self.outliers,
+            "requests": list(self.traces),
+        }
@@ -2,15 +2,26 @@
 
 TRANSLATIONS = {
     "en": {
-        "config_flow": {
-            "title": "Koios Digital Clock",
+        "title": "Koios Digital Clock",
+        "config": {
             "error": {
                 "cannot_connect": "Failed to connect",
                 "invalid_auth": "Invalid authentication",
-                "unknown": "Unexpected error"
+                "unknown": "Unexpected error",
+                "invalid_network": "Enter a network in CIDR notation, e.g. 192.168.1.0/24",
+                "network_too_large": "The network is too large, scan at most a /22",
+                "no_devices_found": "No new clocks found on this network"
             },
             "step": {
                 "user": {
+                    "title": "Setup Koios Digital Clock",
+                    "description": "Add a single clock by address or scan a network for clocks.",
+                    "menu_options": {
+                        "manual": "Enter address",
+                        "scan": "Scan a network"
+                    }
+                },
+                "manual": {
                     "title": "Setup Koios Digital Clock",
                     "description": "Enter the connection details for your Koios Digital Clock.",
                     "data": {
@@ -18,10 +29,60 @@ TRANSLATIONS = {
                         "port": "Port"
                     }
                 },
+                "scan": {
+                    "title": "Scan a network",
+                    "description": "Probe every address of a network for Koios Digital Clocks. Use this when mDNS discovery does not work, e.g. across VLANs.",
+                    "data": {
+                        "network": "Network (CIDR)",
+                        "port": "Port"
+                    }
+                },
+                "scan_select": {
+                    "title": "Select a clock",
+                    "description": "Found {count} clocks. Select the one to add, scan again to add the others.",
+                    "data": {
+                        "device": "Clock"
+                    }
+                },
                 "discovery_confirm": {
                     "title": "Confirm discovery",
                     "description": "Do you want to add the Koios Digital Clock '{name}' to Home Assistant?"
                 }
+            },
+            "abort": {
+                "already_configured": "Device is already configured",
+                "already_in_progress": "Configuration flow is already in progress",
+                "cannot_connect": "Failed to connect",
+                "invalid_discovery": "Discovered device did not report its type"
+            }
+        },
+        "options": {
+            "step": {
+                "init": {
+                    "title": "Koios Digital Clock options",
+                    "description": "Changes apply to the running clock without reloading it.",
+                    "data": {
+                        "poll_interval": "Poll interval (seconds)",
+                        "request_timeout": "Request timeout (seconds)",
+                        "max_in_flight": "Maximum concurrent requests",
+                        "catalog_ttl": "Reuse device info and LED effect lists for (seconds, 0 to fetch every poll)",
+                        "push": "Receive state changes over a websocket instead of polling them",
+                        "trace_requests": "Trace request timings (DNS, connect, time to first byte)",
+                        "apply_to_all": "Apply these settings to every Koios clock"
+                    }
+                }
+            }
+        },
+        "system_health": {
+            "info": {
+                "devices": "Devices",
+                "healthy": "Healthy",
+                "degraded": "Degraded",
+                "offline": "Offline",
+                "requests_per_minute": "Requests per minute",
+                "poll_latency_p99": "Poll latency (p99)",
+                "slowest_devices": "Slowest devices",
+                "firmware_versions": "Firmware versions"
             }
         }
     }
@@ -0,0 +1,198 @@
+"""Event loop watchdog for Koios Digital Clock callbacks."""
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DATA_WATCHDOG, WATCHDOG_MAX_REPORTS, WATCHDOG_THRESHOLD_MS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Debug logging for the integration turns the watchdog on
+_INTEGRATION_LOGGER = logging.getLogger(__package__)
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class _Step:
+    """A callback or coroutine step currently holding the event loop."""
+
+    label: str
+    device: str
+    start: float
+    thread_id: int
+    stack: list[str] | None = field(default=None)
+
+
+class LoopWatchdog:
+    """Time integration callbacks and coroutine steps in debug mode.
+
+    Only active while the integration logs at debug level or the event loop
+    runs in debug mode. A sampler thread grabs the stack of the event loop
+    thread whenever a watched step runs past the threshold, so the report
+    shows where it was stuck, not just that it was slow.
+    """
+
+    def __init__(self, hass: HomeAssistant, threshold_ms: float = WATCHDOG_THRESHOLD_MS) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.threshold = threshold_ms / 1000
+        self.reports: deque[dict[str, Any]] = deque(maxlen=WATCHDOG_MAX_REPORTS)
+        self._active: list[_Step] = []
+        self._sampler: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if callbacks should be timed."""
+        return _INTEGRATION_LOGGER.isEnabledFor(logging.DEBUG) or self.hass.loop.get_debug()
+
+    @contextmanager
+    def step(self, label: str, device: str = "") -> Iterator[None]:
+        """Time one synchronous step on the event loop."""
+        self._ensure_sampler()
+        step = _Step(label, device, time.monotonic(), threading.get_ident())
+        self._active.append(step)
+        self._wake.set()
+        try:
+            yield
+        finally:
+            self._active.pop()
+            elapsed = time.monotonic() - step.start
+            if elapsed >= self.threshold:
+                self._report(step, elapsed)
+
+    async def async_timed(self, coro: Coroutine[Any, Any, _T], label: str, device: str = "") -> _T:
+        """Await a coroutine, timing each step it runs between suspensions."""
+        return await _TimedCoroutine(self, coro, label, device)
+
+    def wrap_service(
+        self, name: str, handler: Callable[[Any], Awaitable[_T]]
+    ) -> Callable[[Any], Coroutine[Any, Any, _T]]:
+        """Wrap a service handler so it is timed in debug mode."""
+
+        async def _handler(call: Any) -> _T:
+            if not self.enabled:
+                return await handler(call)
+            return await self.async_timed(handler(call), f"service {name}")
+
+        return _handler
+
+    @callback
+    def _report(self, step: _Step, elapsed: float) -> None:
+        """Record and log a step that blocked the event loop."""
+        report = {
+            "time": time.time(),
+            "label": step.label,
+            "device": step.device,
+            "duration_ms": round(elapsed * 1000, 1),
+            "stack": step.stack,
+        }
+        self.reports.append(report)
+        _LOGGER.warning(
+            "%s%s blocked the event loop for %.1f ms%s",
+            step.label,
+            f" on {step.device}" if step.device else "",
+            report["duration_ms"],
+            "\n" + "".join(step.stack) if step.stack else " (finished before a stack sample)",
+        )
+
+    def _ensure_sampler(self) -> None:
+        """Start the sampler thread on first use."""
+        if self._sampler is not None:
+            return
+        self._sampler = threading.Thread(
+            target=self._sample, name=f"{__package__} watchdog", daemon=True
+        )
+        self._sampler.start()
+
+    def _sample(self) -> None:
+        """Grab the loop thread's stack while a step overruns, runs in a thread."""
+        while not self._stop.is_set():
+            # Sleep until a step starts, then poll until the loop is idle again
+            self._wake.wait()
+            self._wake.clear()
+            while self._active and not self._stop.wait(self.threshold / 2):
+                try:
+                    step = self._active[0]
+                except IndexError:
+                    break
+                if step.stack is not None or time.monotonic() - step.start < self.threshold:
+                    continue
+                frame = sys._current_frames().get(step.thread_id)  # pylint: disable=protected-access
+                if frame is not None:
+                    step.stack = traceback.format_stack(frame)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the sampler thread."""
+        self._stop.set()
+        self._wake.set()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return recent reports for diagnostics."""
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "reports": list(self.reports),
+        }
+
+
+class _TimedCoroutine:
+    """Drive a coroutine step by step, timing each step."""
+
+    __slots__ = ("_watchdog", "_coro", "_label", "_device")
+
+    def __init__(
+        self, watchdog: LoopWatchdog, coro: Coroutine[Any, Any, Any], label: str, device: str
+    ) -> None:
+        """Initialize."""
+        self._watchdog = watchdog
+        self._coro = coro
+        self._label = label
+        self._device = device
+
+    def __await__(self) -> Generator[Any, Any, Any]:
+        """Run the coroutine, forwarding everything it yields to the loop."""
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            with self._watchdog.step(self._label, self._device):
+                try:
+                    if error is not None:
+                        yielded = self._coro.throw(error)
+                    else:
+                        yielded = self._coro.send(value)
+                except StopIteration as stop:
+                    return stop.value
+            try:
+                value, error = (yield yielded), None
+            except BaseException as err:  # pylint: disable=broad-except
+                value, error = None, err
+
+
+@callback
+def async_get_watchdog(hass: HomeAssistant) -> LoopWatchdog:
+    """Return the watchdog shared by every config entry."""
+    if (watchdog := hass.data.get(DATA_WATCHDOG)) is None:
+        watchdog = hass.data[DATA_WATCHDOG] = LoopWatchdog(hass)
+
+        @callback
+        def _async_stop(_event: Event) -> None:
+            watchdog.async_stop()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop)
+    return watchdog
@@ -0,0 +1,150 @@
+"""Timezone database cache for Koios Digital Clock."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    API_TIME_ZONEDB,
+    DATA_ZONEDB,
+    DOMAIN,
+    ZONEDB_MAX_VERSIONS,
+    ZONEDB_RETRY_AFTER,
+)
+from .coordinator import KoiosClockDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.zonedb"
+STORAGE_VERSION = 1
+
+
+def firmware_version(coordinator: KoiosClockDataUpdateCoordinator) -> str | None:
+    """Return the firmware version a clock reported in /api/about."""
+    about = (coordinator.data or {}).get("about") or {}
+    return about.get("version")
+
+
+class ZoneDatabase:
+    """Timezone name/rule lists per firmware version, shared by every clock.
+
+    The list is embedded in the firmware and /api/time/zonedb is expensive
+    for the clock to serve, so it is fetched from one clock per firmware
+    version, kept in .storage and indexed by name.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._zones: dict[str, dict[str, str]] | None = None
+        self._names: dict[str, list[str]] = {}
+        self._fetches: dict[str, asyncio.Future[dict[str, str] | None]] = {}
+        self._failed: dict[str, float] = {}
+        self._load_lock = asyncio.Lock()
+
+    async def _async_load(self) -> dict[str, dict[str, str]]:
+        """Load the stored databases once."""
+        async with self._load_lock:
+            if self._zones is None:
+                stored = await self._store.async_load() or {}
+                self._zones = {
+                    version: dict(zones) for version, zones in stored.get("versions", {}).items()
+                }
+        return self._zones
+
+    @callback
+    def zones(self, version: str | None) -> dict[str, str] | None:
+        """Return the loaded name to rule index for a firmware version."""
+        if self._zones is None or version is None:
+            return None
+        return self._zones.get(version)
+
+    @callback
+    def names(self, version: str | None) -> list[str] | None:
+        """Return the sorted timezone names of a firmware version."""
+        if (zones := self.zones(version)) is None:
+            return None
+        if (names := self._names.get(version)) is None:
+            names = self._names[version] = sorted(zones)
+        return names
+
+    async def async_get(
+        self, coordinator: KoiosClockDataUpdateCoordinator
+    ) -> dict[str, str] | None:
+        """Return the name to rule index for a clock's firmware.
+
+        Only the first clock of a version downloads the database, clocks
+        asking while that download runs wait for it. Returns None if the
+        version is unknown or the download failed.
+        """
+        if (version := firmware_version(coordinator)) is None:
+            return None
+        zones = await self._async_load()
+        if version in zones:
+            return zones[version]
+        if time.monotonic() - self._failed.get(version, -ZONEDB_RETRY_AFTER) < ZONEDB_RETRY_AFTER:
+            return None
+
+        if (fetch := self._fetches.get(version)) is not None:
+            return await fetch
+
+        fetch = self._fetches[version] = asyncio.get_running_loop().create_future()
+        result = None
+        try:
+            result = await self._async_fetch(coordinator, version)
+            if result is None:
+                self._failed[version] = time.monotonic()
+        finally:
+            # Waiters get None if this download failed, they retry later
+            del self._fetches[version]
+            fetch.set_result(result)
+        return result
+
+    async def _async_fetch(
+        self, coordinator: KoiosClockDataUpdateCoordinator, version: str
+    ) -> dict[str, str] | None:
+        """Download, index and persist the database of one firmware version."""
+        data = await coordinator.async_fetch(API_TIME_ZONEDB)
+        if not isinstance(data, list):
+            return None
+        index = {
+            zone["name"]: zone.get("rule", "")
+            for zone in data
+            if isinstance(zone, dict) and isinstance(zone.get("name"), str)
+        }
+        if not index:
+            return None
+        _LOGGER.debug(
+            "Fetched %s timezones for firmware %s from %s", len(index), version, coordinator.base_url
+        )
+
+        zones = await self._async_load()
+        zones[version] = index
+        # Versions are stored in the order they were first seen, drop the oldest
+        for stale in list(zones)[:-ZONEDB_MAX_VERSIONS]:
+            del zones[stale]
+            self._names.pop(stale, None)
+        self._store.async_delay_save(self._data_to_save, 1)
+        return index
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the stored representation."""
+        return {
+            "versions": {
+                version: sorted(zones.items()) for version, zones in (self._zones or {}).items()
+            }
+        }
+
+
+@callback
+def async_get_zonedb(hass: HomeAssistant) -> ZoneDatabase:
+    """Return the timezone database cache shared by every clock."""
+    if (zonedb := hass.data.get(DATA_ZONEDB)) is None:
+        zonedb = hass.data[DATA_ZONEDB] = ZoneDatabase(hass)
+    return zonedb
@@ -0,0 +1,18 @@
+"""Local simulator for Koios Digital devices.
+
+Serves every endpoint of api-swagger.yaml and matrx.yaml for all device
+models so the integration can be load tested without hardware.
+"""
+from .device import MODELS, Faults, SimulatedDevice
+from .replay import ReplayFixture, create_replay_app
+from .server import Fleet, create_app
+
+__all__ = [
+    "MODELS",
+    "Faults",
+    "Fleet",
+    "ReplayFixture",
+    "SimulatedDevice",
+    "create_app",
+    "create_replay_app",
+]
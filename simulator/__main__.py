@@ -0,0 +1,86 @@
+"""Run a fleet of simulated Koios Digital devices.
+
+    python -m simulator --count 200 --models nixie,wordclock --latency-ms 40
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+
+from .device import MODELS, Faults, SimulatedDevice
+from .server import Fleet
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(prog="python -m simulator", description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10, help="number of devices")
+    parser.add_argument(
+        "--models",
+        default=",".join(MODELS),
+        help="comma separated models, assigned round robin",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=18000)
+    parser.add_argument("--firmware", default="1.0.0")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--max-connections", type=int, default=0, help="0 means unlimited")
+    parser.add_argument("--rate-408", type=float, default=0.0, help="fraction of requests answered 408")
+    parser.add_argument("--rate-500", type=float, default=0.0, help="fraction of requests answered 500")
+    parser.add_argument("--manifest", help="write the device list as JSON to this file")
+    return parser.parse_args()
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve until cancelled."""
+    models = args.models.split(",")
+    devices = [
+        SimulatedDevice(
+            models[index % len(models)],
+            index,
+            args.firmware,
+            Faults(
+                latency_ms=args.latency_ms,
+                jitter_ms=args.jitter_ms,
+                max_connections=args.max_connections,
+                rate_408=args.rate_408,
+                rate_500=args.rate_500,
+            ),
+        )
+        for index in range(args.count)
+    ]
+    fleet = Fleet(devices, args.host, args.base_port)
+    await fleet.async_start()
+
+    if args.manifest:
+        with open(args.manifest, "w", encoding="utf-8") as manifest:
+            json.dump(
+                [
+                    {"host": host, "port": port, "model": device.model, "hostname": device.hostname}
+                    for device in devices
+                    for host, port in [fleet.address(device)]
+                ],
+                manifest,
+                indent=2,
+            )
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await fleet.async_stop()
+
+
+def main() -> None:
+    """Entry point."""
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(_parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""Simulated Koios Digital devices."""
+from __future__ import annotations
+
+import copy
+import functools
+import os
+import zoneinfo
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+# Mirrors custom_components/koiosdigital/const.py, the simulator only needs aiohttp
+MODEL_FIBONACCI = "fibonacci"
+MODEL_NIXIE = "nixie"
+MODEL_WORDCLOCK = "wordclock"
+MODEL_MATRX = "matrx"
+MODEL_TRANQUIL = "tranquil"
+
+MODELS = (MODEL_FIBONACCI, MODEL_NIXIE, MODEL_WORDCLOCK, MODEL_MATRX, MODEL_TRANQUIL)
+
+LED_EFFECTS = {
+    "SOLID": "Solid",
+    "BLINK": "Blink",
+    "BREATHE": "Breathe",
+    "CYCLIC": "Cyclic",
+    "RAINBOW": "Rainbow",
+    "COLOR_WIPE": "Color Wipe",
+    "THEATER_CHASE": "Theater Chase",
+    "SPARKLE": "Sparkle",
+}
+
+DEFAULT_FIRMWARE = "1.0.0"
+
+# LED channels per model as served by /api/led/config
+LED_CHANNELS = {
+    MODEL_NIXIE: [{"index": 0, "num_leds": 6, "type": "RGBW", "name": "Backlight"}],
+    MODEL_WORDCLOCK: [
+        {"index": 0, "num_leds": 114, "type": "RGB", "name": "Letters"},
+        {"index": 1, "num_leds": 4, "type": "RGB", "name": "Minutes"},
+    ],
+    MODEL_TRANQUIL: [{"index": 0, "num_leds": 60, "type": "RGBW", "name": "Backlight"}],
+}
+
+FIBONACCI_THEMES = [
+    {"id": 0, "name": "RGB", "hour_color": "#FF0000", "minute_color": "#00FF00", "both_color": "#0000FF"},
+    {"id": 1, "name": "Mondrian", "hour_color": "#FF0A0A", "minute_color": "#F8DE00", "both_color": "#0A0AFF"},
+    {"id": 2, "name": "Basbrun", "hour_color": "#502800", "minute_color": "#14C81E", "both_color": "#FF6400"},
+    {"id": 3, "name": "80's", "hour_color": "#F564C9", "minute_color": "#72F736", "both_color": "#71EBDB"},
+    {"id": 4, "name": "Pastel", "hour_color": "#FF7B7B", "minute_color": "#8FFF70", "both_color": "#7878FF"},
+    {"id": 5, "name": "Modern", "hour_color": "#D4312D", "minute_color": "#91D231", "both_color": "#8D5FE0"},
+    {"id": 6, "name": "Cold", "hour_color": "#D13EC8", "minute_color": "#45E8E0", "both_color": "#5046CA"},
+    {"id": 7, "name": "Warm", "hour_color": "#ED1414", "minute_color": "#F6F336", "both_color": "#FF7E15"},
+    {"id": 8, "name": "Earth", "hour_color": "#462300", "minute_color": "#467A0A", "both_color": "#C8B600"},
+    {"id": 9, "name": "Dark", "hour_color": "#D32222", "minute_color": "#50974E", "both_color": "#101895"},
+]
+
+
+@functools.cache
+def zonedb() -> list[dict[str, str]]:
+    """Return the name/rule list served by /api/time/zonedb.
+
+    Rules are the POSIX TZ strings from the footer of the host's TZif files,
+    which is what the firmware embeds.
+    """
+    zones = []
+    for name in sorted(zoneinfo.available_timezones()):
+        for base in zoneinfo.TZPATH:
+            try:
+                with open(os.path.join(base, name), "rb") as tzfile:
+                    rule = tzfile.read().rstrip(b"\n").rsplit(b"\n", 1)[-1].decode()
+            except (OSError, UnicodeDecodeError):
+                continue
+            if rule and not rule.startswith("TZif"):
+                zones.append({"name": name, "rule": rule})
+            break
+    return zones or [{"name": "Etc/UTC", "rule": "UTC0"}]
+
+
+@dataclass
+class Faults:
+    """Fault injection settings of a simulated device."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    max_connections: int = 0
+    rate_408: float = 0.0
+    rate_500: float = 0.0
+    # Drop connections without an answer, like a clock that fell off Wi-Fi
+    offline: bool = False
+    # Cut JSON bodies of paths starting with this prefix in half
+    truncate: str = ""
+
+    def update(self, values: dict[str, Any]) -> None:
+        """Change settings at runtime."""
+        for key, value in values.items():
+            if not hasattr(self, key):
+                raise KeyError(key)
+            setattr(self, key, type(getattr(self, key))(value))
+
+
+@dataclass
+class SimulatedDevice:
+    """State of one simulated clock."""
+
+    model: str
+    index: int = 0
+    firmware: str = DEFAULT_FIRMWARE
+    faults: Faults = field(default_factory=Faults)
+    requests: Counter = field(default_factory=Counter)
+    state: dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Build the initial state for the model."""
+        if self.model not in MODELS:
+            raise ValueError(f"Unknown model {self.model}")
+        self.hostname = f"kd-{self.model}-{self.index:04d}"
+        self.reset()
+
+    def reset(self) -> None:
+        """Put the device back to factory state."""
+        state: dict[str, Any] = {}
+        if self.model == MODEL_MATRX:
+            state["system_config"] = {
+                "screen_enabled": True,
+                "screen_brightness": 128,
+                "auto_brightness_enabled": False,
+            }
+        else:
+            state["system_config"] = {
+                "auto_timezone": False,
+                "timezone": "America/New_York",
+                "ntp_server": "pool.ntp.org",
+                "wifi_hostname": self.hostname,
+            }
+        if self.model in LED_CHANNELS:
+            state["led_channels"] = {
+                channel["index"]: {
+                    "effect_id": "SOLID",
+                    "brightness": 255,
+                    "speed": 50,
+                    "on": True,
+                    "color": {"r": 255, "g": 255, "b": 255, "w": 0}
+                    if channel["type"] == "RGBW"
+                    else {"r": 255, "g": 255, "b": 255},
+                }
+                for channel in LED_CHANNELS[self.model]
+            }
+        if self.model == MODEL_NIXIE:
+            state["nixie"] = {
+                "brightness": 80,
+                "military_time": False,
+                "blinking_dots": True,
+                "on": True,
+            }
+        if self.model == MODEL_FIBONACCI:
+            state["fibonacci"] = {"brightness": 255, "theme_id": 0, "on": True}
+        self.state = state
+
+    @property
+    def has_leds(self) -> bool:
+        """Return True if the model serves the LED endpoints."""
+        return self.model in LED_CHANNELS
+
+    def about(self) -> dict[str, Any]:
+        """Return /api/about for the current firmware."""
+        if self.model == MODEL_MATRX:
+            return {"model": "matrx_v9_64x32", "type": "matrx", "version": self.firmware}
+        if self.firmware.startswith("0."):
+            # Early firmware reported the clock kind in type and had no subtype
+            return {"model": f"{self.model.upper()}-V1", "type": self.model, "version": self.firmware}
+        return {
+            "model": f"{self.model.upper()}-V1",
+            "type": "clock",
+            "subtype": self.model,
+            "version": self.firmware,
+        }
+
+    def led_config(self) -> dict[str, Any]:
+        """Return /api/led/config."""
+        return {"channels": copy.deepcopy(LED_CHANNELS[self.model])}
+
+    def led_effects(self) -> list[dict[str, str]]:
+        """Return /api/led/effects."""
+        return [{"id": effect_id, "name": name} for effect_id, name in LED_EFFECTS.items()]
+
+    def fibonacci(self) -> dict[str, Any]:
+        """Return /api/fibonacci including the theme list."""
+        return {**self.state["fibonacci"], "themes": FIBONACCI_THEMES}
+
+    def update(self, section: str, values: dict[str, Any], channel: int | None = None) -> None:
+        """Apply a partial update like the firmware does."""
+        target = self.state[section] if channel is None else self.state[section][channel]
+        for key, value in values.items():
+            if key not in target:
+                raise KeyError(key)
+            if isinstance(target[key], dict) and isinstance(value, dict):
+                target[key] = {**target[key], **value}
+            else:
+                target[key] = value
@@ -0,0 +1,185 @@
+"""Record real device traffic into a replayable fixture.
+
+Runs a reverse proxy in front of a real clock. Point the integration (config
+flow and coordinator) at the proxy and every request/response pair is
+forwarded and appended to a JSON lines fixture, together with the time it
+happened and how long the device took to answer.
+
+    python -m simulator.recorder --target http://192.168.1.50 --port 18080 \\
+        --output fixtures/nixie-1.2.0.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import IO, Any
+
+import aiohttp
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+FIXTURE_VERSION = 1
+
+TARGET_KEY = web.AppKey("target", str)
+SESSION_KEY = web.AppKey("session", aiohttp.ClientSession)
+RECORDER_KEY = web.AppKey("recorder", "FixtureWriter")
+
+# Headers passed through in both directions, the firmware ignores the rest
+FORWARDED_HEADERS = ("Content-Type",)
+
+
+def encode_body(body: bytes) -> dict[str, str]:
+    """Store a body as text when possible, base64 otherwise."""
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_b64": base64.b64encode(body).decode("ascii")}
+
+
+def decode_body(record: dict[str, Any]) -> bytes:
+    """Return the raw bytes of a recorded body."""
+    if "body_b64" in record:
+        return base64.b64decode(record["body_b64"])
+    return record.get("body", "").encode("utf-8")
+
+
+class FixtureWriter:
+    """Append exchanges to a fixture file."""
+
+    def __init__(self, file: IO[str], target: str) -> None:
+        """Initialize and write the header line."""
+        self._file = file
+        self._start = time.monotonic()
+        self.count = 0
+        self._write(
+            {
+                "fixture": FIXTURE_VERSION,
+                "target": target,
+                "recorded": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    def _write(self, line: dict[str, Any]) -> None:
+        """Write one line and flush so an interrupted recording stays usable."""
+        self._file.write(json.dumps(line) + "\n")
+        self._file.flush()
+
+    def record(
+        self,
+        started: float,
+        elapsed_ms: float,
+        request: web.Request,
+        request_body: bytes,
+        status: int,
+        content_type: str | None,
+        response_body: bytes,
+    ) -> None:
+        """Record one exchange."""
+        self.count += 1
+        self._write(
+            {
+                "at_ms": round((started - self._start) * 1000, 1),
+                "elapsed_ms": round(elapsed_ms, 1),
+                "method": request.method,
+                "path": request.path,
+                "query": request.query_string,
+                "request": encode_body(request_body) if request_body else None,
+                "status": status,
+                "content_type": content_type,
+                **encode_body(response_body),
+            }
+        )
+
+
+async def proxy(request: web.Request) -> web.StreamResponse:
+    """Forward a request to the device and record the exchange."""
+    if request.headers.get("Upgrade", "").lower() == "websocket":
+        raise web.HTTPNotImplemented(text="Websockets are not recorded")
+
+    body = await request.read()
+    headers = {name: request.headers[name] for name in FORWARDED_HEADERS if name in request.headers}
+    started = time.monotonic()
+    try:
+        async with request.app[SESSION_KEY].request(
+            request.method,
+            f"{request.app[TARGET_KEY]}{request.path_qs}",
+            data=body or None,
+            headers=headers,
+        ) as response:
+            response_body = await response.read()
+    except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+        # Failures are part of real traffic, record them as a gateway timeout
+        _LOGGER.warning("%s %s failed: %s", request.method, request.path, err)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        request.app[RECORDER_KEY].record(started, elapsed_ms, request, body, 504, None, b"")
+        return web.Response(status=504)
+
+    elapsed_ms = (time.monotonic() - started) * 1000
+    content_type = response.headers.get("Content-Type")
+    request.app[RECORDER_KEY].record(
+        started, elapsed_ms, request, body, response.status, content_type, response_body
+    )
+    _LOGGER.info("%s %s -> %s (%.0f ms)", request.method, request.path, response.status, elapsed_ms)
+    return web.Response(
+        status=response.status,
+        body=response_body,
+        headers={"Content-Type": content_type} if content_type else None,
+    )
+
+
+def create_recorder_app(target: str, writer: FixtureWriter) -> web.Application:
+    """Create the recording proxy for one device."""
+    app = web.Application()
+    app[TARGET_KEY] = target.rstrip("/")
+    app[RECORDER_KEY] = writer
+
+    async def _session(app: web.Application) -> Any:
+        app[SESSION_KEY] = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30))
+        yield
+        await app[SESSION_KEY].close()
+
+    app.cleanup_ctx.append(_session)
+    app.router.add_route("*", "/{tail:.*}", proxy)
+    return app
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Proxy until cancelled."""
+    with open(args.output, "a" if args.append else "w", encoding="utf-8") as file:
+        writer = FixtureWriter(file, args.target)
+        runner = web.AppRunner(create_recorder_app(args.target, writer), access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, args.host, args.port).start()
+        _LOGGER.info("Recording %s on %s:%s into %s", args.target, args.host, args.port, args.output)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+            _LOGGER.info("Recorded %s exchanges", writer.count)
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(prog="python -m simulator.recorder", description=__doc__.splitlines()[0])
+    parser.add_argument("--target", required=True, help="base URL of the real device, e.g. http://192.168.1.50")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--output", required=True, help="fixture file (JSON lines)")
+    parser.add_argument("--append", action="store_true", help="append to an existing fixture")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
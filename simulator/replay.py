@@ -0,0 +1,158 @@
+"""Serve recorded device traffic back deterministically.
+
+Each (method, path, query) answers with its recorded responses in the
+order they were captured, so a poll sequence plays back exactly as the
+real device answered it. Once a sequence is exhausted the last response is
+repeated, or the sequence starts over with --loop. Every response is
+delayed by the recorded device latency divided by --speed; --speed 0 answers
+immediately.
+
+    python -m simulator.replay fixtures/nixie-1.2.0.jsonl --port 18080 --speed 10
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from collections import Counter, defaultdict
+from typing import Any
+
+from aiohttp import web
+
+from .recorder import decode_body
+
+_LOGGER = logging.getLogger(__name__)
+
+FIXTURE_KEY = web.AppKey("fixture", "ReplayFixture")
+
+
+class ReplayFixture:
+    """Recorded exchanges indexed for playback."""
+
+    def __init__(self, records: list[dict[str, Any]], speed: float = 1.0, loop: bool = False) -> None:
+        """Initialize."""
+        self.speed = speed
+        self.loop = loop
+        self._exchanges: dict[tuple[str, str, str], list[dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            self._exchanges[(record["method"], record["path"], record.get("query", ""))].append(record)
+        self._positions: Counter[tuple[str, str, str]] = Counter()
+        self.unmatched: Counter[str] = Counter()
+
+    @classmethod
+    def load(cls, path: str, speed: float = 1.0, loop: bool = False) -> ReplayFixture:
+        """Read a fixture file, skipping the header lines of each recording."""
+        with open(path, encoding="utf-8") as file:
+            records = [json.loads(line) for line in file if line.strip()]
+        return cls([record for record in records if "fixture" not in record], speed, loop)
+
+    def reset(self) -> None:
+        """Rewind every sequence."""
+        self._positions.clear()
+        self.unmatched.clear()
+
+    def next(self, method: str, path: str, query: str) -> dict[str, Any] | None:
+        """Return the next recorded exchange for a request."""
+        key = (method, path, query)
+        sequence = self._exchanges.get(key)
+        if not sequence and query:
+            # Fall back to the same request without a query string
+            key = (method, path, "")
+            sequence = self._exchanges.get(key)
+        if not sequence:
+            self.unmatched[f"{method} {path}"] += 1
+            return None
+
+        position = self._positions[key]
+        self._positions[key] += 1
+        if self.loop:
+            return sequence[position % len(sequence)]
+        return sequence[min(position, len(sequence) - 1)]
+
+    def delay(self, record: dict[str, Any]) -> float:
+        """Return the seconds to wait before answering."""
+        if not self.speed:
+            return 0.0
+        return record.get("elapsed_ms", 0) / 1000 / self.speed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return playback counters."""
+        return {
+            "speed": self.speed,
+            "loop": self.loop,
+            "served": {
+                f"{method} {path}?{query}" if query else f"{method} {path}": count
+                for (method, path, query), count in self._positions.items()
+            },
+            "unmatched": dict(self.unmatched),
+        }
+
+
+async def replay(request: web.Request) -> web.Response:
+    """Answer a request from the fixture."""
+    fixture = request.app[FIXTURE_KEY]
+    record = fixture.next(request.method, request.path, request.query_string)
+    if record is None:
+        _LOGGER.warning("No recorded response for %s %s", request.method, request.path_qs)
+        return web.json_response({"error": "Not recorded"}, status=404)
+
+    if delay := fixture.delay(record):
+        await asyncio.sleep(delay)
+    content_type = record.get("content_type")
+    return web.Response(
+        status=record["status"],
+        body=decode_body(record),
+        headers={"Content-Type": content_type} if content_type else None,
+    )
+
+
+async def replay_state(request: web.Request) -> web.Response:
+    """Inspect or rewind playback."""
+    fixture = request.app[FIXTURE_KEY]
+    if request.method == "POST":
+        fixture.reset()
+    return web.json_response(fixture.as_dict())
+
+
+def create_replay_app(fixture: ReplayFixture) -> web.Application:
+    """Create the application replaying one fixture."""
+    app = web.Application()
+    app[FIXTURE_KEY] = fixture
+    app.router.add_route("*", "/_replay/state", replay_state)
+    app.router.add_route("*", "/{tail:.*}", replay)
+    return app
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Serve until cancelled."""
+    fixture = ReplayFixture.load(args.fixture, args.speed, args.loop)
+    runner = web.AppRunner(create_replay_app(fixture), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, args.host, args.port).start()
+    _LOGGER.info("Replaying %s on %s:%s at %sx speed", args.fixture, args.host, args.port, args.speed)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    """Entry point."""
+    parser = argparse.ArgumentParser(prog="python -m simulator.replay", description=__doc__.splitlines()[0])
+    parser.add_argument("fixture", help="fixture file written by simulator.recorder")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--speed", type=float, default=1.0, help="latency divisor, 0 answers immediately")
+    parser.add_argument("--loop", action="store_true", help="start sequences over instead of repeating the last response")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(_async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""aiohttp server implementing api-swagger.yaml and matrx.yaml."""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict
+from typing import Any
+
+from aiohttp import WSMsgType, web
+
+from .device import MODEL_FIBONACCI, MODEL_MATRX, MODEL_NIXIE, SimulatedDevice, zonedb
+
+_LOGGER = logging.getLogger(__name__)
+
+DEVICE_KEY = web.AppKey("device", SimulatedDevice)
+SOCKETS_KEY = web.AppKey("sockets", set)
+INFLIGHT_KEY = web.AppKey("inflight", list)
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+
+@web.middleware
+async def fault_middleware(request: web.Request, handler: Handler) -> web.StreamResponse:
+    """Apply latency, jitter, connection limits and error injection."""
+    device = request.app[DEVICE_KEY]
+    faults = device.faults
+    if request.path.startswith("/_sim/"):
+        return await handler(request)
+
+    device.requests[f"{request.method} {request.path}"] += 1
+    if faults.offline:
+        device.requests["dropped"] += 1
+        if request.transport is not None:
+            request.transport.close()
+        raise web.HTTPServiceUnavailable()
+
+    inflight = request.app[INFLIGHT_KEY]
+    if faults.max_connections and inflight[0] >= faults.max_connections:
+        # A saturated ESP32 httpd has no socket left for the request
+        device.requests["rejected"] += 1
+        return web.Response(status=503, text="Too many connections")
+
+    inflight[0] += 1
+    try:
+        delay = faults.latency_ms + random.uniform(-faults.jitter_ms, faults.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        roll = random.random()
+        if roll < faults.rate_408:
+            device.requests["408"] += 1
+            return web.json_response({"error": "Request timeout", "code": 408}, status=408)
+        if roll < faults.rate_408 + faults.rate_500:
+            device.requests["500"] += 1
+            return web.json_response({"error": "Internal server error", "code": 500}, status=500)
+        response = await handler(request)
+        if (
+            faults.truncate
+            and request.path.startswith(faults.truncate)
+            and isinstance(response, web.Response)
+            and response.body
+        ):
+            device.requests["truncated"] += 1
+            response.body = bytes(response.body)[: len(response.body) // 2]
+        return response
+    finally:
+        inflight[0] -= 1
+
+
+async def _read_json(request: web.Request) -> dict[str, Any]:
+    """Parse a JSON object body or raise 400."""
+    try:
+        body = await request.json()
+    except ValueError as err:
+        raise web.HTTPBadRequest(text="Invalid JSON format") from err
+    if not isinstance(body, dict):
+        raise web.HTTPBadRequest(text="Invalid JSON format")
+    return body
+
+
+def _require(condition: bool) -> None:
+    """Raise 404 for endpoints the model does not serve."""
+    if not condition:
+        raise web.HTTPNotFound(text="Not found")
+
+
+async def _broadcast(app: web.Application, section: str) -> None:
+    """Send the current state to every websocket client."""
+    device = app[DEVICE_KEY]
+    state = device.fibonacci() if section == MODEL_FIBONACCI else device.state[section]
+    for socket in list(app[SOCKETS_KEY]):
+        if not socket.closed:
+            await socket.send_json(state)
+
+
+async def root(request: web.Request) -> web.Response:
+    """Handle /."""
+    return web.Response(text="Welcome to the KD Clock API!")
+
+
+async def about(request: web.Request) -> web.Response:
+    """Handle /api/about."""
+    return web.json_response(request.app[DEVICE_KEY].about())
+
+
+async def system_config(request: web.Request) -> web.Response:
+    """Handle /api/system/config."""
+    device = request.app[DEVICE_KEY]
+    if request.method == "POST":
+        body = await _read_json(request)
+        try:
+            device.update("system_config", body)
+        except (KeyError, TypeError) as err:
+            raise web.HTTPBadRequest(text="Invalid parameters") from err
+        if device.model != MODEL_MATRX:
+            return web.json_response({"status": "success"})
+    return web.json_response(device.state["system_config"])
+
+
+async def time_zonedb(request: web.Request) -> web.Response:
+    """Handle /api/time/zonedb."""
+    _require(request.app[DEVICE_KEY].model != MODEL_MATRX)
+    return web.json_response(zonedb())
+
+
+async def led_effects(request: web.Request) -> web.Response:
+    """Handle /api/led/effects."""
+    device = request.app[DEVICE_KEY]
+    _require(device.has_leds)
+    return web.json_response(device.led_effects())
+
+
+async def led_config(request: web.Request) -> web.Response:
+    """Handle /api/led/config."""
+    device = request.app[DEVICE_KEY]
+    _require(device.has_leds)
+    return web.json_response(device.led_config())
+
+
+async def led_channel(request: web.Request) -> web.Response:
+    """Handle /api/led/channel/{channelIndex}."""
+    device = request.app[DEVICE_KEY]
+    _require(device.has_leds)
+    try:
+        channel = int(request.match_info["channel"])
+    except ValueError as err:
+        raise web.HTTPBadRequest(text="Invalid channel index") from err
+    if channel not in device.state["led_channels"]:
+        raise web.HTTPNotFound(text="Channel not found")
+    if request.method == "POST":
+        body = await _read_json(request)
+        try:
+            device.update("led_channels", body, channel)
+        except (KeyError, TypeError) as err:
+            raise web.HTTPBadRequest(text="Invalid JSON format") from err
+        return web.json_response({"status": "ok"})
+    return web.json_response(device.state["led_channels"][channel])
+
+
+def _section_handler(model: str) -> Handler:
+    """Build the handler for /api/nixie or /api/fibonacci."""
+
+    async def handler(request: web.Request) -> web.Response:
+        device = request.app[DEVICE_KEY]
+        _require(device.model == model)
+        if request.method == "POST":
+            body = await _read_json(request)
+            try:
+                device.update(model, body)
+            except (KeyError, TypeError) as err:
+                raise web.HTTPBadRequest(text="Invalid configuration parameters") from err
+            await _broadcast(request.app, model)
+            return web.json_response({"status": "success"})
+        return web.json_response(device.fibonacci() if model == MODEL_FIBONACCI else device.state[model])
+
+    return handler
+
+
+def _websocket_handler(model: str) -> Handler:
+    """Build the handler for /api/nixie/ws or /api/fibonacci/ws."""
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        device = request.app[DEVICE_KEY]
+        _require(device.model == model)
+        socket = web.WebSocketResponse()
+        await socket.prepare(request)
+        request.app[SOCKETS_KEY].add(socket)
+        try:
+            # Current state is sent immediately upon connection
+            await socket.send_json(device.fibonacci() if model == MODEL_FIBONACCI else device.state[model])
+            async for message in socket:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    device.update(model, json.loads(message.data))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue
+                await _broadcast(request.app, model)
+        finally:
+            request.app[SOCKETS_KEY].discard(socket)
+        return socket
+
+    return handler
+
+
+async def sim_state(request: web.Request) -> web.Response:
+    """Inspect or reset the simulated device."""
+    device = request.app[DEVICE_KEY]
+    if request.method == "POST":
+        device.reset()
+    return web.json_response(
+        {
+            "model": device.model,
+            "firmware": device.firmware,
+            "state": device.state,
+            "faults": asdict(device.faults),
+            "requests": dict(device.requests),
+        }
+    )
+
+
+async def sim_firmware(request: web.Request) -> web.Response:
+    """Switch the reported firmware version."""
+    device = request.app[DEVICE_KEY]
+    body = await _read_json(request)
+    device.firmware = str(body.get("version", device.firmware))
+    return web.json_response(device.about())
+
+
+async def sim_faults(request: web.Request) -> web.Response:
+    """Change fault injection settings."""
+    device = request.app[DEVICE_KEY]
+    try:
+        device.faults.update(await _read_json(request))
+    except (KeyError, TypeError, ValueError) as err:
+        raise web.HTTPBadRequest(text=f"Unknown fault setting {err}") from err
+    return web.json_response(asdict(device.faults))
+
+
+async def _close_sockets(app: web.Application) -> None:
+    """Close websocket clients on shutdown."""
+    for socket in list(app[SOCKETS_KEY]):
+        await socket.close()
+
+
+def create_app(device: SimulatedDevice) -> web.Application:
+    """Create the application serving one simulated device."""
+    app = web.Application(middlewares=[fault_middleware])
+    app[DEVICE_KEY] = device
+    app[SOCKETS_KEY] = set()
+    app[INFLIGHT_KEY] = [0]
+    app.on_shutdown.append(_close_sockets)
+
+    app.router.add_get("/", root)
+    app.router.add_get("/api/about", about)
+    app.router.add_route("*", "/api/system/config", system_config)
+    app.router.add_get("/api/time/zonedb", time_zonedb)
+    app.router.add_get("/api/led/effects", led_effects)
+    app.router.add_get("/api/led/config", led_config)
+    app.router.add_route("*", "/api/led/channel/{channel}", led_channel)
+    app.router.add_route("*", "/api/nixie", _section_handler(MODEL_NIXIE))
+    app.router.add_get("/api/nixie/ws", _websocket_handler(MODEL_NIXIE))
+    app.router.add_route("*", "/api/fibonacci", _section_handler(MODEL_FIBONACCI))
+    app.router.add_get("/api/fibonacci/ws", _websocket_handler(MODEL_FIBONACCI))
+
+    # Simulator control endpoints
+    app.router.add_route("*", "/_sim/state", sim_state)
+    app.router.add_post("/_sim/firmware", sim_firmware)
+    app.router.add_post("/_sim/faults", sim_faults)
+    return app
+
+
+class Fleet:
+    """Many simulated devices served from one process, one port each."""
+
+    def __init__(
+        self,
+        devices: list[SimulatedDevice],
+        host: str = "127.0.0.1",
+        base_port: int = 18000,
+    ) -> None:
+        """Initialize."""
+        self.devices = devices
+        self.host = host
+        self.base_port = base_port
+        self._runners: list[web.AppRunner] = []
+
+    def address(self, device: SimulatedDevice) -> tuple[str, int]:
+        """Return the host and port serving a device."""
+        return self.host, self.base_port + self.devices.index(device)
+
+    async def async_start(self) -> None:
+        """Start serving every device."""
+        for offset, device in enumerate(self.devices):
+            runner = web.AppRunner(create_app(device), access_log=None)
+            await runner.setup()
+            await web.TCPSite(runner, self.host, self.base_port + offset).start()
+            self._runners.append(runner)
+        _LOGGER.info(
+            "Serving %s simulated devices on %s:%s-%s",
+            len(self.devices),
+            self.host,
+            self.base_port,
+            self.base_port + len(self.devices) - 1,
+        )
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        await asyncio.gather(*(runner.cleanup() for runner in self._runners))
+        self._runners.clear()
@@ -0,0 +1 @@
+"""Tests for the Koios Digital Clock integration."""
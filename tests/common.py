@@ -0,0 +1,47 @@
+"""Helpers to run a coordinator against the device simulator."""
+from __future__ import annotations
+
+import socket
+import tempfile
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+
+from custom_components.koiosdigital.coordinator import KoiosClockDataUpdateCoordinator
+from simulator import Fleet, SimulatedDevice
+
+
+def free_port() -> int:
+    """Return a TCP port nothing listens on right now."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def async_simulated_clock(
+    model: str, options: Mapping[str, Any] | None = None
+) -> AsyncIterator[tuple[KoiosClockDataUpdateCoordinator, SimulatedDevice]]:
+    """Serve one simulated clock and yield a coordinator after its first poll."""
+    device = SimulatedDevice(model)
+    fleet = Fleet([device], host="127.0.0.1", base_port=free_port())
+    await fleet.async_start()
+    hass = HomeAssistant(tempfile.mkdtemp(prefix="koios-test-hass-"))
+    hass.config.set_time_zone("UTC")
+    session = aiohttp.ClientSession()
+    coordinator = KoiosClockDataUpdateCoordinator(
+        hass, session, *fleet.address(device), model, options=options
+    )
+    # Failed sections are only retried by the next poll of the test
+    coordinator.retry_delay = 3600
+    try:
+        await coordinator.async_refresh()
+        yield coordinator, device
+    finally:
+        await coordinator.async_shutdown()
+        await session.close()
+        await hass.async_stop(force=True)
+        await fleet.async_stop()
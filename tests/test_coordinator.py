@@ -0,0 +1,126 @@
+"""Tests for the coordinator against the device simulator."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from custom_components.koiosdigital.const import (
+    API_NIXIE,
+    API_SYSTEM_CONFIG,
+    CONF_CATALOG_TTL,
+    SETTINGS_TTL,
+)
+
+from .common import async_simulated_clock
+
+
+async def test_catalog_sections_reused_within_ttl() -> None:
+    """Catalog sections are only due again once their TTL ran out."""
+    async with async_simulated_clock("nixie", {CONF_CATALOG_TTL: 600}) as (coordinator, _):
+        assert not coordinator._section_due("about")
+        assert not coordinator._section_due("led_effects")
+        assert coordinator._section_due("nixie")
+        assert coordinator._section_due("led_channels")
+
+        coordinator._sections["about"].updated -= timedelta(seconds=600)
+        assert coordinator._section_due("about")
+
+
+async def test_settings_reused_except_on_matrx() -> None:
+    """System config is reused for SETTINGS_TTL, MATRX polls it every time."""
+    async with async_simulated_clock("nixie") as (coordinator, _):
+        assert not coordinator._section_due("system_config")
+        coordinator._sections["system_config"].updated -= timedelta(seconds=SETTINGS_TTL)
+        assert coordinator._section_due("system_config")
+
+    async with async_simulated_clock("matrx") as (coordinator, _):
+        assert coordinator._section_due("system_config")
+
+
+async def test_pending_write_makes_section_due() -> None:
+    """A pending write is diffed against a fresh fetch of its section."""
+    async with async_simulated_clock("nixie") as (coordinator, _):
+        assert not coordinator._section_due("system_config")
+        coordinator.desired.set(API_SYSTEM_CONFIG, {"ntp_server": "time.example.com"})
+        assert coordinator._section_due("system_config")
+
+
+async def test_section_goes_stale_after_missed_polls() -> None:
+    """A section is available until stale_after plus its TTL has passed."""
+    async with async_simulated_clock("nixie") as (coordinator, _):
+        assert coordinator.section_available("nixie")
+        assert coordinator.section_available(None)
+        assert not coordinator.section_available("fibonacci")
+
+        cache = coordinator._sections["nixie"]
+        cache.updated -= coordinator.stale_after - timedelta(seconds=1)
+        assert coordinator.section_available("nixie")
+        cache.updated -= timedelta(seconds=2)
+        assert not coordinator.section_available("nixie")
+
+
+async def test_pushed_section_stays_available_and_is_not_polled() -> None:
+    """A section fed by a push connection is neither due nor stale."""
+    async with async_simulated_clock("nixie") as (coordinator, _):
+        coordinator.async_push_state("nixie", True)
+        coordinator._sections["nixie"].updated -= timedelta(days=1)
+        assert not coordinator._section_due("nixie")
+        assert coordinator.section_available("nixie")
+
+
+async def test_unreachable_clock_fails_poll() -> None:
+    """A poll the clock answers none of fails even with cached sections."""
+    async with async_simulated_clock("nixie") as (coordinator, device):
+        assert coordinator.last_update_success
+        assert coordinator.section_available("system_config")
+
+        device.faults.offline = True
+        await coordinator.async_refresh()
+        assert not coordinator.last_update_success
+        assert coordinator.consecutive_failures == 1
+        await coordinator.async_refresh()
+        assert coordinator.consecutive_failures == 2
+
+        device.faults.offline = False
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.consecutive_failures == 0
+
+
+async def test_partial_failure_keeps_other_sections() -> None:
+    """One failing endpoint leaves the poll and the other sections alone."""
+    async with async_simulated_clock("nixie") as (coordinator, device):
+        device.faults.truncate = API_NIXIE
+        await coordinator.async_refresh()
+        assert coordinator.last_update_success
+        assert coordinator.consecutive_failures == 0
+        assert coordinator.section_status()["nixie"]["failed"]
+        # The last good value is kept until it goes stale
+        assert coordinator.section_available("nixie")
+        assert coordinator.data["nixie"]
+
+
+async def test_direct_write_sent_when_cache_matches() -> None:
+    """A command is posted even if the cached state already matches it."""
+    async with async_simulated_clock("nixie") as (coordinator, device):
+        cached = coordinator.data["nixie"]["military_time"]
+        # Changed on the clock itself since the last poll
+        device.state["nixie"]["military_time"] = not cached
+        posts = device.requests[f"POST {API_NIXIE}"]
+
+        assert await coordinator.async_set_desired(API_NIXIE, {"military_time": cached})
+        assert device.requests[f"POST {API_NIXIE}"] == posts + 1
+        assert device.state["nixie"]["military_time"] == cached
+        assert not coordinator.desired
+
+
+async def test_offline_write_stays_pending() -> None:
+    """A write to an unreachable clock is applied once it answers again."""
+    async with async_simulated_clock("nixie") as (coordinator, device):
+        device.faults.offline = True
+        assert not await coordinator.async_set_desired(API_NIXIE, {"brightness": 12})
+        assert coordinator.desired.get(API_NIXIE) == {"brightness": 12}
+
+        device.faults.offline = False
+        await coordinator.async_refresh()
+        assert device.state["nixie"]["brightness"] == 12
+        assert not coordinator.desired
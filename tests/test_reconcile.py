@@ -0,0 +1,72 @@
+"""Tests for desired-state reconciliation."""
+from __future__ import annotations
+
+from custom_components.koiosdigital.const import RECONCILE_MAX_ATTEMPTS
+from custom_components.koiosdigital.reconcile import DesiredState, diff_state
+
+ENDPOINT = "/api/nixie"
+
+
+def test_diff_state_returns_only_differing_fields() -> None:
+    """Fields that already match are left out of the diff."""
+    observed = {"brightness": 80, "on": True, "military_time": False}
+    assert diff_state({"brightness": 80, "on": False}, observed) == {"on": False}
+    assert diff_state({"brightness": 80}, observed) == {}
+
+
+def test_diff_state_missing_field_differs() -> None:
+    """A field the clock didn't report has to be written."""
+    assert diff_state({"blinking_dots": True}, {}) == {"blinking_dots": True}
+
+
+def test_diff_state_nested_values_match_on_given_components() -> None:
+    """A color only needs the components it was given to match."""
+    observed = {"color": {"r": 255, "g": 0, "b": 0, "w": 12}}
+    assert diff_state({"color": {"r": 255, "g": 0}}, observed) == {}
+    assert diff_state({"color": {"r": 255, "g": 1}}, observed) == {"color": {"r": 255, "g": 1}}
+
+
+def test_desired_state_merges_and_diffs() -> None:
+    """Desired fields merge per endpoint and diff against observed state."""
+    desired = DesiredState()
+    assert not desired
+    desired.set(ENDPOINT, {"brightness": 10})
+    desired.set(ENDPOINT, {"on": True})
+    assert desired.endpoints == [ENDPOINT]
+    assert len(desired) == 1
+    assert desired.get(ENDPOINT) == {"brightness": 10, "on": True}
+    assert desired.diff(ENDPOINT, {"brightness": 10, "on": False}) == {"on": True}
+
+
+def test_desired_state_applied_keeps_fields_changed_meanwhile() -> None:
+    """Only acknowledged values are dropped, newer ones stay pending."""
+    desired = DesiredState()
+    desired.set(ENDPOINT, {"brightness": 10, "on": True})
+    sent = dict(desired.get(ENDPOINT))
+    desired.set(ENDPOINT, {"brightness": 20})
+    desired.applied(ENDPOINT, sent)
+    assert desired.get(ENDPOINT) == {"brightness": 20}
+
+    desired.applied(ENDPOINT, {"brightness": 20})
+    assert not desired
+
+
+def test_desired_state_gives_up_after_max_attempts() -> None:
+    """Rejected writes are dropped once the retry budget is used up."""
+    desired = DesiredState()
+    desired.set(ENDPOINT, {"brightness": 10})
+    for _ in range(RECONCILE_MAX_ATTEMPTS - 1):
+        assert not desired.failed(ENDPOINT)
+    assert desired.failed(ENDPOINT)
+    assert not desired
+
+
+def test_desired_state_set_resets_attempts() -> None:
+    """A new command gets a fresh retry budget."""
+    desired = DesiredState()
+    desired.set(ENDPOINT, {"brightness": 10})
+    for _ in range(RECONCILE_MAX_ATTEMPTS - 1):
+        desired.failed(ENDPOINT)
+    desired.set(ENDPOINT, {"brightness": 20})
+    assert not desired.failed(ENDPOINT)
+    assert desired.get(ENDPOINT) == {"brightness": 20}